@@ -17,8 +17,10 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import Direction, OpenApiParameter
 
 from netbox.api.fields import ChoiceField
+from netbox.api.renderers import StreamingRenderer
 from netbox.api.serializers import WritableNestedSerializer
 from netbox.api.viewsets import NetBoxModelViewSet
+from netbox.api.viewsets.mixins import StreamingExportMixin
 
 # see netbox.api.routers.NetBoxRouter
 BULK_ACTIONS = ("bulk_destroy", "bulk_partial_update", "bulk_update")
@@ -96,6 +98,7 @@ class NetBoxAutoSchema(AutoSchema):
         3. bulk operations don't have filter params
         4. bulk operations don't have pagination
         5. bulk delete should specify input
+        6. formats streamed by list views are parameters rather than response media types
     """
 
     writable_serializers = {}
@@ -303,8 +306,27 @@ class NetBoxAutoSchema(AutoSchema):
                     description='Return only brief fields for each object.',
                 ),
             ]
+        # Expose the ?format query parameter for list views which support streaming exports
+        if isinstance(self.view, StreamingExportMixin) and self._is_list_view() and self.method == 'GET':
+            params = list(params) + [
+                OpenApiParameter(
+                    name='format',
+                    location=OpenApiParameter.QUERY,
+                    required=False,
+                    type=OpenApiTypes.STR,
+                    enum=[renderer.format for renderer in self.view.streaming_renderer_classes],
+                    description='Stream all matching objects (without pagination) in the specified format.',
+                ),
+            ]
         return params
 
+    def map_renderers(self, attribute):
+        streaming = {
+            getattr(renderer, attribute) for renderer in self.view.get_renderers()
+            if isinstance(renderer, StreamingRenderer)
+        }
+        return [value for value in super().map_renderers(attribute) if value not in streaming]
+
     def get_filter_backends(self):
         # bulk operations don't have filter params
         if self.is_bulk_action:
@@ -0,0 +1,93 @@
+import logging
+from contextlib import contextmanager
+
+from django.db import router
+
+from netbox.context import changelog_buffer
+
+from .models import ObjectChange
+
+__all__ = (
+    'ChangeLogBuffer',
+    'buffered_change_logging',
+)
+
+# The number of ObjectChange records written per INSERT
+CHANGELOG_BATCH_SIZE = 1000
+
+logger = logging.getLogger('netbox.changelog')
+
+
+class ChangeLogBuffer:
+    """
+    Holds the ObjectChange records generated while performing a bulk operation, so that they can be written to the
+    database at once. Records are written in the order in which they were recorded.
+    """
+    def __init__(self):
+        self.records = []
+        # Maps each changed object (by object type and ID) to its most recent record
+        self.latest = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, objectchange):
+        # Populate the static fields normally set by ObjectChange.save()
+        if not objectchange.user_name:
+            objectchange.user_name = objectchange.user.username
+        if not objectchange.object_repr:
+            objectchange.object_repr = str(objectchange.changed_object)
+
+        # Detach the record from the changed and related objects, retaining only their IDs. A deleted object's PK is
+        # cleared before the buffer is flushed, and bulk_create() refuses to save a reference to an unsaved object.
+        for field_name in ('changed_object', 'related_object'):
+            field = ObjectChange._meta.get_field(field_name)
+            if field.is_cached(objectchange):
+                if (obj := field.get_cached_value(objectchange)) is not None:
+                    setattr(objectchange, field.fk_field, obj.pk)
+                field.delete_cached_value(objectchange)
+
+        self.records.append(objectchange)
+        self.latest[(objectchange.changed_object_type_id, objectchange.changed_object_id)] = objectchange
+
+    def get_latest(self, object_type, object_id):
+        """
+        Return the most recent record for the specified object, if any.
+        """
+        return self.latest.get((object_type.pk, object_id))
+
+    def flush(self):
+        """
+        Write all buffered records to the database and empty the buffer.
+        """
+        if not self.records:
+            return
+        ObjectChange.objects.using(router.db_for_write(ObjectChange)).bulk_create(
+            self.records,
+            batch_size=CHANGELOG_BATCH_SIZE
+        )
+        logger.debug(f"Wrote {len(self.records)} buffered object changes")
+        self.records = []
+        self.latest = {}
+
+
+@contextmanager
+def buffered_change_logging():
+    """
+    Buffer the ObjectChange records generated within the wrapped block, and write them in bulk once the block has
+    completed successfully. Records are discarded if the block raises an exception. This should be entered within the
+    transaction in which changes are made, so that records are written as part of that transaction.
+
+    If a buffer is already active (e.g. in an enclosing block), it continues to be used.
+    """
+    if changelog_buffer.get() is not None:
+        yield
+        return
+
+    buffer = ChangeLogBuffer()
+    token = changelog_buffer.set(buffer)
+    try:
+        yield
+        buffer.flush()
+    finally:
+        changelog_buffer.reset(token)
@@ -1,5 +1,7 @@
 import logging
+import os
 import re
+import stat
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path, PurePosixPath
@@ -52,6 +54,27 @@ class LocalBackend(DataBackend):
 
         yield local_path
 
+    def get_manifest(self, local_path):
+        """
+        Identify the revision of each file by its modification time and size, so that only files which have been
+        modified since the last sync are read.
+        """
+        manifest = {}
+        for path, dir_names, file_names in os.walk(local_path):
+            rel_path = path.split(local_path)[1].lstrip('/')  # Strip root path
+            if not rel_path:
+                # Hidden directories at the root are never synchronized
+                dir_names[:] = [name for name in dir_names if not name.startswith('.')]
+            for file_name in file_names:
+                try:
+                    st = os.stat(os.path.join(path, file_name))
+                    revision = f'{st.st_mtime_ns}-{st.st_size}'
+                except OSError:
+                    revision = None
+                manifest[os.path.join(rel_path, file_name)] = revision
+
+        return manifest
+
 
 @register_data_backend()
 class GitBackend(DataBackend):
@@ -138,6 +161,32 @@ class GitBackend(DataBackend):
 
         local_path.cleanup()
 
+    def get_manifest(self, local_path):
+        """
+        Identify the revision of each file by its blob ID within the HEAD commit. This is equivalent to diffing the
+        tree of the previously synced commit against the new HEAD, but does not require the repository's history to
+        have been fetched (clones are shallow). Symlinks are always read, as their targets may have changed.
+        """
+        from dulwich.object_store import iter_tree_contents
+        from dulwich.repo import Repo
+
+        manifest = {}
+        with Repo(local_path) as repo:
+            tree_id = repo[repo.head()].tree
+            for entry in iter_tree_contents(repo.object_store, tree_id):
+                if stat.S_ISREG(entry.mode):
+                    manifest[os.fsdecode(entry.path)] = entry.sha.decode()
+                elif stat.S_ISLNK(entry.mode):
+                    manifest[os.fsdecode(entry.path)] = None
+
+        return manifest
+
+    def get_revision(self, local_path):
+        from dulwich.repo import Repo
+
+        with Repo(local_path) as repo:
+            return repo.head().decode()
+
 
 @register_data_backend()
 class S3Backend(DataBackend):
@@ -5,14 +5,23 @@ from importlib import import_module
 import requests
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Exists, OuterRef, Subquery
+from django.db.models import Exists, OuterRef, Q, Subquery
 from django.utils import timezone
 from packaging import version
 
 from core.models import Job, ObjectChange
+from core.partitioning import (
+    create_changelog_partitions,
+    drop_expired_changelog_partitions,
+    get_partitioned_floor,
+    is_changelog_partitioned,
+)
 from netbox.config import Config
+from netbox.constants import COUNTER_CACHE_DEFERRED
 from netbox.jobs import JobRunner, system_job
 from netbox.search.backends import search_backend
+from utilities.counters import verify_counts
+from utilities.management.commands.calculate_cached_counts import Command as CalculateCachedCountsCommand
 from utilities.proxy import resolve_proxies
 
 from .choices import DataSourceStatusChoices, JobIntervalChoices, ObjectChangeActionChoices
@@ -77,8 +86,10 @@ class SystemHousekeepingJob(JobRunner):
 
         self.send_census_report()
         self.clear_expired_sessions()
+        self.create_upcoming_partitions()
         self.prune_changelog()
         self.delete_expired_jobs()
+        self.reconcile_cached_counts()
         self.check_for_new_releases()
 
     def send_census_report(self):
@@ -123,9 +134,20 @@ class SystemHousekeepingJob(JobRunner):
                 f"clearing sessions; skipping."
             )
 
+    def create_upcoming_partitions(self):
+        """
+        Create upcoming changelog partitions (if the changelog has been partitioned).
+        """
+        if not is_changelog_partitioned():
+            return
+        self.logger.info('Creating upcoming changelog partitions...')
+        created = create_changelog_partitions()
+        self.logger.info(f'Created {len(created)} changelog partitions')
+
     def prune_changelog(self):
         """
-        Delete any ObjectChange records older than the configured changelog retention time (if any).
+        Delete any ObjectChange records older than the configured changelog retention time (if any). If the changelog
+        has been partitioned, expired partitions are dropped in their entirety.
         """
         self.logger.info('Pruning old changelog entries...')
         config = Config()
@@ -136,7 +158,7 @@ class SystemHousekeepingJob(JobRunner):
         cutoff = timezone.now() - timedelta(days=config.CHANGELOG_RETENTION)
         self.logger.debug(f'Changelog retention period: {config.CHANGELOG_RETENTION} days ({cutoff:%Y-%m-%d %H:%M:%S})')
 
-        expired_qs = ObjectChange.objects.filter(time__lt=cutoff)
+        retained_qs = None
 
         # When enabled, retain each object's original create record and most recent update record while pruning expired
         # changelog entries. This applies only to objects without a delete record.
@@ -167,6 +189,20 @@ class SystemHousekeepingJob(JobRunner):
                 .values('pk')
             )
 
+            retained_qs = ObjectChange.objects.filter(
+                Q(pk__in=Subquery(create_pks_to_keep)) | Q(pk__in=Subquery(latest_update_pks_to_keep))
+            )
+
+        # Drop any partitions which have expired in their entirety. Only records predating the earliest remaining
+        # monthly partition (i.e. those within the legacy or default partition) are deleted individually.
+        if is_changelog_partitioned():
+            dropped = drop_expired_changelog_partitions(cutoff, retained=retained_qs)
+            self.logger.info(f'Dropped {len(dropped)} expired changelog partitions')
+            if floor := get_partitioned_floor():
+                cutoff = min(cutoff, floor)
+
+        expired_qs = ObjectChange.objects.filter(time__lt=cutoff)
+        if retained_qs is not None:
             expired_qs = expired_qs.exclude(pk__in=Subquery(create_pks_to_keep))
             expired_qs = expired_qs.exclude(pk__in=Subquery(latest_update_pks_to_keep))
 
@@ -191,6 +227,21 @@ class SystemHousekeepingJob(JobRunner):
         count = Job.objects.filter(created__lt=cutoff).delete()[0]
         self.logger.info(f"Deleted {count} expired jobs")
 
+    def reconcile_cached_counts(self):
+        """
+        Correct any cached counter fields which have drifted from the actual counts (if counter updates are deferred).
+        """
+        if settings.COUNTER_CACHE_MODE != COUNTER_CACHE_DEFERRED:
+            return
+        self.logger.info('Reconciling cached counts...')
+        corrected = 0
+        for model, mappings in CalculateCachedCountsCommand.collect_models().items():
+            for field_name, related_query in mappings.items():
+                if count := verify_counts(model, field_name, related_query):
+                    self.logger.warning(f'Corrected {field_name} for {count} {model._meta.verbose_name_plural}')
+                    corrected += count
+        self.logger.info(f'Corrected {corrected} cached counts')
+
     def check_for_new_releases(self):
         """
         Check for new releases and cache the latest release.
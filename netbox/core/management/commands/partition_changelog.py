@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+
+from core.models import ObjectChange
+from core.partitioning import (
+    PARTITION_MONTHS_AHEAD,
+    convert_changelog,
+    create_changelog_partitions,
+    get_changelog_partitions,
+    is_changelog_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = "Partition the changelog by month, and create upcoming changelog partitions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert', action='store_true',
+            help="Convert the existing changelog table to a partitioned table (requires an exclusive lock on the table)"
+        )
+        parser.add_argument(
+            '--months', type=int, default=PARTITION_MONTHS_AHEAD,
+            help=f"The number of months ahead for which partitions are created (default: {PARTITION_MONTHS_AHEAD})"
+        )
+
+    def handle(self, *args, **options):
+        if connections[router.db_for_write(ObjectChange)].vendor != 'postgresql':
+            raise CommandError("Changelog partitioning requires PostgreSQL.")
+        if options['months'] < 0:
+            raise CommandError("--months must not be negative.")
+
+        if options['convert']:
+            if is_changelog_partitioned():
+                raise CommandError("The changelog has already been partitioned.")
+            if options['verbosity']:
+                self.stdout.write("Converting the changelog to a partitioned table... ", ending='')
+                self.stdout.flush()
+            created = convert_changelog(months=options['months'])
+            if options['verbosity']:
+                self.stdout.write("Done.", self.style.SUCCESS)
+        elif not is_changelog_partitioned():
+            raise CommandError("The changelog has not been partitioned. Specify --convert to partition it.")
+        else:
+            created = create_changelog_partitions(months=options['months'])
+
+        if options['verbosity']:
+            for name in created:
+                self.stdout.write(f"Created partition {name}")
+            if options['verbosity'] > 1:
+                for partition in get_changelog_partitions():
+                    self.stdout.write(f"  {partition.name}: {partition.lower or '-'} to {partition.upper or '-'}")
+            self.stdout.write(self.style.SUCCESS(f"Finished. Created {len(created)} partitions."))
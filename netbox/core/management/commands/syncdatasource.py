@@ -13,6 +13,10 @@ class Command(BaseCommand):
             "--all", action='store_true', dest='sync_all',
             help="Synchronize all data sources"
         )
+        parser.add_argument(
+            "--full", action='store_true',
+            help="Re-read all files, including those which appear to be unchanged since the last sync"
+        )
 
     def handle(self, *args, **options):
 
@@ -35,7 +39,7 @@ class Command(BaseCommand):
             self.stdout.write(f"[{i}] Syncing {datasource}... ", ending='')
             self.stdout.flush()
             try:
-                datasource.sync()
+                datasource.sync(full=options['full'])
                 self.stdout.write(datasource.get_status_display())
                 self.stdout.flush()
             except Exception as e:
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_job_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datasource',
+            name='revision',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='datafile',
+            name='revision',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+    ]
@@ -1,7 +1,9 @@
 import hashlib
 import logging
 import os
-from fnmatch import fnmatchcase
+import re
+from fnmatch import translate
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import yaml
@@ -31,6 +33,20 @@ __all__ = (
 
 logger = logging.getLogger('netbox.core.data')
 
+# The number of DataFiles read from disk and written to the database at once while syncing
+DATAFILE_SYNC_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=64)
+def compile_ignore_rules(ignore_rules):
+    """
+    Compile a DataSource's ignore rules (one fnmatch-style pattern per line) into a single regular expression.
+    Returns None if no rules have been defined.
+    """
+    if rules := ignore_rules.splitlines():
+        return re.compile('|'.join(translate(rule) for rule in rules))
+    return None
+
 
 class DataSource(JobsMixin, PrimaryModel):
     """
@@ -82,6 +98,13 @@ class DataSource(JobsMixin, PrimaryModel):
         null=True,
         editable=False
     )
+    revision = models.CharField(
+        verbose_name=_('revision'),
+        max_length=100,
+        blank=True,
+        editable=False,
+        help_text=_("The revision (e.g. git commit) from which data was last synchronized")
+    )
 
     class Meta:
         ordering = ('name',)
@@ -177,9 +200,12 @@ class DataSource(JobsMixin, PrimaryModel):
         backend_params = self.parameters or {}
         return self.backend_class(self.source_url, **backend_params)
 
-    def sync(self):
+    def sync(self, full=False):
         """
         Create/update/delete child DataFiles as necessary to synchronize with the remote source.
+
+        If the backend is able to report the revision of each file (see DataBackend.get_manifest()), only files whose
+        revision has changed since the last sync are read from disk. Set full to True to re-read all files.
         """
         from core.signals import post_sync, pre_sync
 
@@ -202,48 +228,88 @@ class DataSource(JobsMixin, PrimaryModel):
         with backend.fetch() as local_path:
 
             logger.debug(f'Syncing files from source root {local_path}')
-            data_files = self.datafiles.all()
-            known_paths = {df.path for df in data_files}
-            logger.debug(f'Starting with {len(known_paths)} known files')
-
-            # Check for any updated/deleted files
+            known_files = {
+                path: (pk, file_hash, revision)
+                for pk, path, file_hash, revision in self.datafiles.values_list('pk', 'path', 'hash', 'revision')
+            }
+            logger.debug(f'Starting with {len(known_files)} known files')
+
+            # Determine the current set of files and their revisions. If the backend cannot provide a manifest,
+            # walk the local replication and treat every file as potentially modified.
+            if (manifest := backend.get_manifest(local_path)) is not None:
+                manifest = {
+                    path: revision for path, revision in manifest.items() if not self._ignore_path(path)
+                }
+                logger.debug(f"Backend reported {len(manifest)} files")
+            else:
+                manifest = dict.fromkeys(self._walk(local_path))
+            if full:
+                known_files = {path: (pk, file_hash, None) for path, (pk, file_hash, __) in known_files.items()}
+
+            # Check for any updated/deleted files. Files are only read if their revision is unknown or has changed.
+            updated_count = 0
             updated_files = []
+            revised_files = []
             deleted_file_ids = []
-            for datafile in data_files:
-
+            for path, (pk, file_hash, revision) in known_files.items():
+                if path not in manifest:
+                    deleted_file_ids.append(pk)
+                    continue
+                if manifest[path] is not None and manifest[path] == revision:
+                    continue
+                datafile = DataFile(pk=pk, source=self, path=path, hash=file_hash, revision=manifest[path] or '')
                 try:
                     if datafile.refresh_from_disk(source_root=local_path):
                         updated_files.append(datafile)
+                    elif datafile.revision != revision:
+                        # Content is unchanged (e.g. the file was touched); record only its new revision
+                        revised_files.append(datafile)
                 except FileNotFoundError:
                     # File no longer exists
-                    deleted_file_ids.append(datafile.pk)
+                    deleted_file_ids.append(pk)
                     continue
 
-            # Bulk update modified files
-            updated_count = DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
+                # Bulk update modified files
+                if len(updated_files) >= DATAFILE_SYNC_BATCH_SIZE:
+                    updated_count += DataFile.objects.bulk_update(
+                        updated_files, ('last_updated', 'size', 'hash', 'data', 'revision')
+                    )
+                    updated_files = []
+            updated_count += DataFile.objects.bulk_update(
+                updated_files, ('last_updated', 'size', 'hash', 'data', 'revision')
+            )
+            DataFile.objects.bulk_update(revised_files, ('revision',), batch_size=DATAFILE_SYNC_BATCH_SIZE)
             logger.debug(f"Updated {updated_count} files")
 
             # Bulk delete deleted files
             deleted_count, __ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
             logger.debug(f"Deleted {deleted_count} files")
 
-            # Walk the local replication to find new files
-            new_paths = self._walk(local_path) - known_paths
-
             # Bulk create new files
+            created_count = 0
             new_datafiles = []
-            for path in new_paths:
-                datafile = DataFile(source=self, path=path)
+            for path in manifest.keys() - known_files.keys():
+                datafile = DataFile(source=self, path=path, revision=manifest[path] or '')
                 datafile.refresh_from_disk(source_root=local_path)
                 datafile.full_clean()
                 new_datafiles.append(datafile)
-            created_count = len(DataFile.objects.bulk_create(new_datafiles, batch_size=100))
+                if len(new_datafiles) >= DATAFILE_SYNC_BATCH_SIZE:
+                    created_count += len(DataFile.objects.bulk_create(new_datafiles))
+                    new_datafiles = []
+            created_count += len(DataFile.objects.bulk_create(new_datafiles))
             logger.debug(f"Created {created_count} data files")
 
-        # Update status & last_synced time
+            revision = backend.get_revision(local_path) or ''
+
+        # Update status, revision & last_synced time
         self.status = DataSourceStatusChoices.COMPLETED
+        self.revision = revision
         self.last_synced = timezone.now()
-        DataSource.objects.filter(pk=self.pk).update(status=self.status, last_synced=self.last_synced)
+        DataSource.objects.filter(pk=self.pk).update(
+            status=self.status,
+            revision=self.revision,
+            last_synced=self.last_synced
+        )
 
         # Emit the post_sync signal
         post_sync.send(sender=self.__class__, instance=self)
@@ -268,16 +334,22 @@ class DataSource(JobsMixin, PrimaryModel):
         logger.debug(f"Found {len(paths)} files")
         return paths
 
+    def _ignore_path(self, file_path):
+        """
+        Returns a boolean indicating whether the file at the given relative path would be excluded by _walk().
+        """
+        return file_path.startswith('.') or self._ignore(file_path)
+
     def _ignore(self, file_path):
         """
         Returns a boolean indicating whether the file should be ignored per the DataSource's configured
         ignore rules. file_path is the full relative path (e.g. "subdir/file.txt").
         """
-        if os.path.basename(file_path).startswith('.'):
+        file_name = os.path.basename(file_path)
+        if file_name.startswith('.'):
             return True
-        for rule in self.ignore_rules.splitlines():
-            if fnmatchcase(file_path, rule) or fnmatchcase(os.path.basename(file_path), rule):
-                return True
+        if pattern := compile_ignore_rules(self.ignore_rules):
+            return bool(pattern.match(file_path) or pattern.match(file_name))
         return False
 
 
@@ -320,6 +392,13 @@ class DataFile(models.Model):
         help_text=_('SHA256 hash of the file data')
     )
     data = models.BinaryField()
+    revision = models.CharField(
+        verbose_name=_('revision'),
+        max_length=100,
+        blank=True,
+        editable=False,
+        help_text=_("Backend-specific identifier for the revision of the file (e.g. git blob ID)")
+    )
 
     objects = RestrictedQuerySet.as_manager()
 
@@ -363,15 +442,15 @@ class DataFile(models.Model):
         """
         file_path = os.path.join(source_root, self.path)
         with open(file_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+            data = f.read()
+        file_hash = hashlib.sha256(data).hexdigest()
 
         # Update instance file attributes & data
         if is_modified := file_hash != self.hash:
             self.last_updated = timezone.now()
-            self.size = os.path.getsize(file_path)
+            self.size = len(data)
             self.hash = file_hash
-            with open(file_path, 'rb') as f:
-                self.data = f.read()
+            self.data = data
 
         return is_modified
 
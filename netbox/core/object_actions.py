@@ -1,9 +1,13 @@
+from django.apps import apps
+from django.urls.exceptions import NoReverseMatch
 from django.utils.translation import gettext_lazy as _
 
 from netbox.object_actions import ObjectAction
+from utilities.views import get_action_url
 
 __all__ = (
     'BulkSync',
+    'RetryImport',
 )
 
 
@@ -16,3 +20,24 @@ class BulkSync(ObjectAction):
     multi = True
     permissions_required = {'sync'}
     template_name = 'core/buttons/bulk_sync.html'
+
+
+class RetryImport(ObjectAction):
+    """
+    Populate the bulk import form with the records of a chunked import job which failed to import.
+    """
+    name = 'bulk_import'
+    label = _('Retry Failed Records')
+    template_name = 'core/buttons/retry_import.html'
+
+    @classmethod
+    def get_url(cls, obj):
+        data = obj.data if isinstance(obj.data, dict) else {}
+        if not data.get('failed') or 'chunks' not in data:
+            return None
+        try:
+            model = apps.get_model(data['object_type'])
+            url = get_action_url(model, action=cls.name)
+        except (KeyError, LookupError, NoReverseMatch):
+            return None
+        return f'{url}?retry_job={obj.pk}'
@@ -0,0 +1,303 @@
+import logging
+import re
+from datetime import UTC, datetime
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .models import ObjectChange
+
+__all__ = (
+    'Partition',
+    'convert_changelog',
+    'create_changelog_partitions',
+    'drop_expired_changelog_partitions',
+    'get_changelog_partitions',
+    'get_partitioned_floor',
+    'is_changelog_partitioned',
+)
+
+# The default number of months for which changelog partitions are created in advance
+PARTITION_MONTHS_AHEAD = 3
+
+PARTITION_BOUND_RE = re.compile(r"FOR VALUES FROM \((MINVALUE|'[^']+')\) TO \((MAXVALUE|'[^']+')\)")
+
+logger = logging.getLogger('netbox.changelog')
+
+
+class Partition:
+    """
+    A range partition of the changelog table. Bounds of None represent MINVALUE/MAXVALUE.
+    """
+    def __init__(self, name, lower, upper):
+        self.name = name
+        self.lower = lower
+        self.upper = upper
+
+    def __repr__(self):
+        return f'<Partition {self.name}: {self.lower} - {self.upper}>'
+
+
+def _get_connection():
+    return connections[router.db_for_write(ObjectChange)]
+
+
+def _get_table():
+    return ObjectChange._meta.db_table
+
+
+def _parse_bound(value):
+    if value in ('MINVALUE', 'MAXVALUE'):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+def _get_month_start(dt, offset=0):
+    """
+    Return the start of the month (in UTC) containing the given datetime, shifted by the given number of months.
+    """
+    dt = dt.astimezone(UTC)
+    month = dt.year * 12 + dt.month - 1 + offset
+    return datetime(month // 12, month % 12 + 1, 1, tzinfo=UTC)
+
+
+def _get_partition_name(table, start):
+    return f'{table}_y{start:%Y}m{start:%m}'
+
+
+def is_changelog_partitioned():
+    """
+    Return True if the changelog table has been converted to a partitioned table.
+    """
+    connection = _get_connection()
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [_get_table()]
+        )
+        return cursor.fetchone()[0]
+
+
+def get_changelog_partitions():
+    """
+    Return the range partitions of the changelog table, ordered by their lower bound. The default partition (if any)
+    is not included.
+    """
+    with _get_connection().cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [_get_table()]
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        if match := PARTITION_BOUND_RE.match(bound):
+            partitions.append(Partition(name, _parse_bound(match.group(1)), _parse_bound(match.group(2))))
+    return sorted(partitions, key=lambda p: (p.lower is not None, p.lower))
+
+
+def get_partitioned_floor():
+    """
+    Return the lower bound of the earliest monthly partition. Changelog records older than this reside in the legacy
+    or default partition, and must be pruned individually.
+    """
+    bounds = [p.lower for p in get_changelog_partitions() if p.lower is not None]
+    return min(bounds) if bounds else None
+
+
+def create_changelog_partitions(months=PARTITION_MONTHS_AHEAD, now=None):
+    """
+    Ensure that a partition exists for the current month and each of the specified number of following months.
+    Returns the names of any partitions created.
+    """
+    table = _get_table()
+    connection = _get_connection()
+    qn = connection.ops.quote_name
+    now = now or timezone.now()
+
+    partitions = get_changelog_partitions()
+    created = []
+    for offset in range(months + 1):
+        start = _get_month_start(now, offset)
+        end = _get_month_start(now, offset + 1)
+        # Skip any month already covered by an existing partition
+        if any(
+            (p.lower is None or p.lower < end) and (p.upper is None or p.upper > start) for p in partitions
+        ):
+            continue
+
+        name = _get_partition_name(table, start)
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {qn(table + '_default')} WHERE time >= %s AND time < %s)",
+                [start, end]
+            )
+            if cursor.fetchone()[0]:
+                # Records within the new partition's range must be moved out of the default partition first
+                cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+                cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(table + '_default')}")
+                cursor.execute(
+                    f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)",
+                    [start, end]
+                )
+                cursor.execute(
+                    f"INSERT INTO {qn(name)} SELECT * FROM {qn(table + '_default')} WHERE time >= %s AND time < %s",
+                    [start, end]
+                )
+                cursor.execute(
+                    f"DELETE FROM {qn(table + '_default')} WHERE time >= %s AND time < %s",
+                    [start, end]
+                )
+                cursor.execute(f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(table + '_default')} DEFAULT")
+            else:
+                cursor.execute(
+                    f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)",
+                    [start, end]
+                )
+        logger.info(f"Created changelog partition {name}")
+        created.append(name)
+
+    return created
+
+
+def drop_expired_changelog_partitions(cutoff, retained=None):
+    """
+    Drop all changelog partitions whose records all predate the cutoff time. Returns the names of the partitions
+    dropped.
+
+    :param cutoff: The time before which records have expired
+    :param retained: A QuerySet of ObjectChanges which are to be retained despite having expired. Any such records
+        are moved to the default partition before their partition is dropped.
+    """
+    table = _get_table()
+    connection = _get_connection()
+    qn = connection.ops.quote_name
+    columns = ', '.join(qn(field.column) for field in ObjectChange._meta.concrete_fields)
+
+    dropped = []
+    for partition in get_changelog_partitions():
+        if partition.upper is None or partition.upper > cutoff:
+            continue
+
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            if retained is not None:
+                # Set aside any retained records before the partition is detached
+                retained_qs = retained.filter(time__lt=partition.upper)
+                if partition.lower is not None:
+                    retained_qs = retained_qs.filter(time__gte=partition.lower)
+                sql, params = retained_qs.values('pk').query.sql_with_params()
+                cursor.execute(
+                    f"CREATE TEMPORARY TABLE changelog_retained ON COMMIT DROP AS "
+                    f"SELECT {columns} FROM {qn(partition.name)} WHERE id IN ({sql})",
+                    params
+                )
+            cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(partition.name)}")
+            cursor.execute(f"DROP TABLE {qn(partition.name)}")
+            if retained is not None:
+                # With its partition gone, retained records are routed to the default partition
+                cursor.execute(f"INSERT INTO {qn(table)} ({columns}) SELECT {columns} FROM changelog_retained")
+                cursor.execute("DROP TABLE changelog_retained")
+        logger.info(f"Dropped changelog partition {partition.name}")
+        dropped.append(partition.name)
+
+    return dropped
+
+
+def convert_changelog(months=PARTITION_MONTHS_AHEAD):
+    """
+    Convert the changelog table to a table partitioned by month on the `time` column. The existing table is retained
+    as a "legacy" partition holding all existing records; new records are written to monthly partitions. A default
+    partition receives any records which fall outside the range of all other partitions.
+
+    This requires an exclusive lock on the changelog table while the legacy partition is validated and a new primary
+    key index is built for it, and so should be performed during a maintenance window.
+    """
+    table = _get_table()
+    legacy = f'{table}_legacy'
+    connection = _get_connection()
+    qn = connection.ops.quote_name
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # Foreign key checks deferred until the end of the transaction would prevent altering the table
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(f"LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE")
+
+        # The legacy partition holds all records up to the end of the current month (or of the most recent record)
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0), MAX(time) FROM {qn(table)}")
+        max_id, max_time = cursor.fetchone()
+        boundary = _get_month_start(max(filter(None, (max_time, timezone.now()))), 1)
+
+        # Record the existing primary key, indexes, foreign keys, and ID sequence
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+            [table]
+        )
+        pkey = cursor.fetchone()[0]
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s",
+            [table]
+        )
+        indexes = [(name, definition) for name, definition in cursor.fetchall() if name != pkey]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [table]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT attidentity, pg_get_serial_sequence(%s, 'id') FROM pg_attribute "
+            "WHERE attrelid = to_regclass(%s) AND attname = 'id'",
+            [table, table]
+        )
+        identity, sequence = cursor.fetchone()
+
+        # Rename the existing table and its indexes to make way for the partitioned table
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}")
+        cursor.execute(f"ALTER INDEX {qn(pkey)} RENAME TO {qn(f'{legacy}_pkey')}")
+        for i, (name, _) in enumerate(indexes):
+            cursor.execute(f"ALTER INDEX {qn(name)} RENAME TO {qn(f'{legacy}_{i}_idx')}")
+
+        # Partitioned tables cannot employ identity columns, so IDs are assigned from a standalone sequence
+        if identity:
+            cursor.execute(f"ALTER TABLE {qn(legacy)} ALTER COLUMN id DROP IDENTITY")
+            sequence = qn(f'{table}_id_seq')
+            cursor.execute(f"CREATE SEQUENCE {sequence} AS bigint START WITH {max_id + 1}")
+        else:
+            cursor.execute(f"ALTER TABLE {qn(legacy)} ALTER COLUMN id DROP DEFAULT")
+
+        # Create the partitioned table. Its primary key must include the partition key.
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} "
+            f"(LIKE {qn(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS) "
+            f"PARTITION BY RANGE (time)"
+        )
+        cursor.execute(f"ALTER TABLE {qn(table)} ALTER COLUMN id SET DEFAULT nextval('{sequence}'::regclass)")
+        cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {qn(table)}.id")
+        cursor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(pkey)} PRIMARY KEY (id, time)")
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}")
+        # Index definitions refer to the original table name, which is now that of the partitioned table
+        for name, definition in indexes:
+            cursor.execute(definition)
+
+        # Attach the existing table as the legacy partition. Its renamed indexes are attached to those of the
+        # partitioned table.
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(legacy)} FOR VALUES FROM (MINVALUE) TO (%s)",
+            [boundary]
+        )
+        cursor.execute(f"CREATE TABLE {qn(table + '_default')} PARTITION OF {qn(table)} DEFAULT")
+
+    created = create_changelog_partitions(months=months, now=boundary)
+    logger.info(f"Converted {table} to a partitioned table ({len(created)} monthly partitions created)")
+
+    return created
@@ -18,10 +18,11 @@ from extras.events import enqueue_event
 from extras.models import Tag
 from extras.utils import run_validators
 from netbox.config import get_config
-from netbox.context import current_request, events_queue
+from netbox.context import changelog_buffer, current_request, events_queue
 from netbox.models.features import ChangeLoggingMixin, get_model_features, model_is_public
 from utilities.data import get_config_value_ci
 from utilities.exceptions import AbortRequest
+from utilities.jinja2 import invalidate_jinja2_templates
 
 from .models import ConfigRevision, DataSource, ObjectChange
 
@@ -129,9 +130,15 @@ def handle_changed_object(sender, instance, **kwargs):
         OBJECT_DELETED: ObjectChangeActionChoices.ACTION_DELETE,
     }[event_type]
     objectchange = instance.to_objectchange(action)
+    buffer = changelog_buffer.get()
     # If this is a many-to-many field change, check for a previous ObjectChange instance recorded
-    # for this object by this request and update it
-    if m2m_changed and (
+    # for this object by this request and update it. A record which has not yet been written is
+    # updated in memory.
+    if m2m_changed and buffer is not None and (
+        prev_change := buffer.get_latest(ContentType.objects.get_for_model(instance), instance.pk)
+    ):
+        prev_change.postchange_data = objectchange.postchange_data
+    elif m2m_changed and (
         prev_change := ObjectChange.objects.filter(
             changed_object_type=ContentType.objects.get_for_model(instance),
             changed_object_id=instance.pk,
@@ -143,11 +150,18 @@ def handle_changed_object(sender, instance, **kwargs):
     elif objectchange and objectchange.has_changes:
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        if buffer is not None:
+            buffer.add(objectchange)
+        else:
+            objectchange.save()
 
     # Ensure that we're working with fresh M2M assignments
     if m2m_changed:
-        instance.refresh_from_db()
+        if buffer is not None:
+            # Discarding any prefetched M2M assignments suffices; there is no need to reload the object
+            getattr(instance, '_prefetched_objects_cache', {}).clear()
+        else:
+            instance.refresh_from_db()
 
     # Enqueue the object for event processing
     queue = events_queue.get()
@@ -200,7 +214,10 @@ def handle_deleted_object(sender, instance, **kwargs):
         objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        if (buffer := changelog_buffer.get()) is not None:
+            buffer.add(objectchange)
+        else:
+            objectchange.save()
 
     # Django does not automatically send an m2m_changed signal for the reverse direction of a
     # many-to-many relationship (see https://code.djangoproject.com/ticket/17688), so we need to
@@ -310,6 +327,14 @@ def auto_sync(instance, **kwargs):
         autosync.object.sync(save=True)
 
 
+@receiver(post_sync)
+def invalidate_jinja2_template_cache(instance, **kwargs):
+    """
+    Invalidate any cached Jinja2 templates which may include DataFiles that have changed.
+    """
+    invalidate_jinja2_templates()
+
+
 @receiver(post_save, sender=ConfigRevision)
 def update_config(sender, instance, **kwargs):
     """
@@ -1,6 +1,6 @@
 import logging
 import uuid
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
@@ -12,6 +12,7 @@ from rest_framework import status
 from core.choices import ObjectChangeActionChoices
 from core.jobs import SystemHousekeepingJob
 from core.models import ObjectChange, ObjectType
+from core.partitioning import convert_changelog, get_changelog_partitions
 from dcim.choices import InterfaceTypeChoices, ModuleStatusChoices, SiteStatusChoices
 from dcim.models import (
     Cable,
@@ -797,3 +798,35 @@ class ChangelogPruneRetentionTestCase(TestCase):
         self.assertNotIn(x_create, remaining)
         self.assertNotIn(x_update, remaining)
         self.assertIn(y_delete, remaining)
+
+    def test_prune_partitioned_drops_expired_partitions(self):
+        ct = ContentType.objects.get_for_model(Site)
+
+        # Partition the changelog as of January 2020, creating partitions through May 2020
+        with patch('core.partitioning.timezone.now', return_value=datetime(2020, 1, 15, tzinfo=UTC)):
+            convert_changelog(months=3)
+        self.assertEqual(len(get_changelog_partitions()), 5)
+
+        expired = datetime(2020, 3, 10, tzinfo=UTC)
+        not_expired = timezone.now()
+
+        # A) Not deleted: the expired CREATE is retained (moved to the default partition)
+        a_create = self._make_oc(ct=ct, obj_id=1, action=ObjectChangeActionChoices.ACTION_CREATE, ts=expired)
+        a_update1 = self._make_oc(ct=ct, obj_id=1, action=ObjectChangeActionChoices.ACTION_UPDATE, ts=expired)
+        a_update2 = self._make_oc(ct=ct, obj_id=1, action=ObjectChangeActionChoices.ACTION_UPDATE, ts=not_expired)
+
+        # B) Deleted (all expired): nothing is retained
+        b_create = self._make_oc(ct=ct, obj_id=2, action=ObjectChangeActionChoices.ACTION_CREATE, ts=expired)
+        b_delete = self._make_oc(ct=ct, obj_id=2, action=ObjectChangeActionChoices.ACTION_DELETE, ts=expired)
+
+        self._run_prune(retention_days=90, retain_create_last_update=True)
+
+        # All partitions have expired in their entirety
+        self.assertEqual(get_changelog_partitions(), [])
+
+        remaining = set(ObjectChange.objects.values_list('pk', flat=True))
+        self.assertIn(a_create, remaining)
+        self.assertNotIn(a_update1, remaining)
+        self.assertIn(a_update2, remaining)
+        self.assertNotIn(b_create, remaining)
+        self.assertNotIn(b_delete, remaining)
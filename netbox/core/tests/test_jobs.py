@@ -131,6 +131,7 @@ class SystemHousekeepingRunTestCase(HousekeepingRunnerMixin, TestCase):
     SUBMETHODS = (
         'send_census_report',
         'clear_expired_sessions',
+        'create_upcoming_partitions',
         'prune_changelog',
         'delete_expired_jobs',
         'check_for_new_releases',
@@ -8,9 +8,12 @@ from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase, override_settings
 
-from core.choices import DataSourceStatusChoices
+from core.choices import DataSourceStatusChoices, ObjectChangeActionChoices
 from core.management.commands import nbshell, upgrade
 from core.management.commands.rqworker import DEFAULT_QUEUES
+from core.models import ObjectChange, ObjectType
+from core.partitioning import get_changelog_partitions, is_changelog_partitioned
+from dcim.models import Site
 
 
 class MakeMigrationsTestCase(TestCase):
@@ -169,6 +172,53 @@ class NbShellTestCase(TestCase):
         self.assertIn('plugin', banner)
 
 
+class PartitionChangelogTestCase(TestCase):
+    def test_requires_convert_when_not_partitioned(self):
+        with self.assertRaisesMessage(CommandError, 'Specify --convert'):
+            call_command('partition_changelog', stdout=StringIO())
+
+    def test_convert(self):
+        object_type = ObjectType.objects.get_for_model(Site)
+        existing = ObjectChange.objects.create(
+            changed_object_type=object_type,
+            changed_object_id=1,
+            action=ObjectChangeActionChoices.ACTION_CREATE,
+            user_name='test',
+            object_repr='Site 1',
+        )
+
+        out = StringIO()
+        call_command('partition_changelog', convert=True, months=2, stdout=out)
+
+        self.assertTrue(is_changelog_partitioned())
+        partitions = get_changelog_partitions()
+        # The legacy partition followed by three monthly partitions
+        self.assertEqual(len(partitions), 4)
+        self.assertIsNone(partitions[0].lower)
+        for previous, partition in zip(partitions, partitions[1:]):
+            self.assertEqual(partition.lower, previous.upper)
+        self.assertIn('Created 3 partitions', out.getvalue())
+
+        # Existing records are retained, and new records continue the existing ID sequence
+        created = ObjectChange.objects.create(
+            changed_object_type=object_type,
+            changed_object_id=1,
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            user_name='test',
+            object_repr='Site 1',
+        )
+        self.assertGreater(created.pk, existing.pk)
+        self.assertEqual(ObjectChange.objects.count(), 2)
+
+        # Upcoming partitions already exist
+        out = StringIO()
+        call_command('partition_changelog', months=2, stdout=out)
+        self.assertIn('Created 0 partitions', out.getvalue())
+
+        with self.assertRaisesMessage(CommandError, 'already been partitioned'):
+            call_command('partition_changelog', convert=True, stdout=StringIO())
+
+
 class RQWorkerTestCase(TestCase):
     def test_defaults_to_all_queues_and_enables_scheduler(self):
         with (
@@ -255,10 +305,21 @@ class SyncDataSourceTestCase(TestCase):
             call_command('syncdatasource', sync_all=True, stdout=out)
 
         data_source_model.objects.all.assert_called_once_with()
-        datasource.sync.assert_called_once_with()
+        datasource.sync.assert_called_once_with(full=False)
         self.assertIn('Syncing Test Data Source', out.getvalue())
         self.assertIn('completed', out.getvalue())
 
+    def test_full_syncs_all_files(self):
+        datasource = MagicMock()
+        datasource.__str__.return_value = 'Test Data Source'
+        datasource.get_status_display.return_value = 'completed'
+
+        with patch('core.management.commands.syncdatasource.DataSource') as data_source_model:
+            data_source_model.objects.all.return_value = [datasource]
+            call_command('syncdatasource', sync_all=True, full=True, stdout=StringIO())
+
+        datasource.sync.assert_called_once_with(full=True)
+
     def test_named_datasource_syncs_matching_datasource(self):
         datasource = self.FakeDataSource('source-a')
         datasources = self.FakeQuerySet([datasource])
@@ -273,7 +334,7 @@ class SyncDataSourceTestCase(TestCase):
             set(data_source_model.objects.filter.call_args.kwargs['name__in']),
             {'source-a'},
         )
-        datasource.sync.assert_called_once_with()
+        datasource.sync.assert_called_once_with(full=False)
         self.assertIn('[1] Syncing source-a', out.getvalue())
         self.assertIn('completed', out.getvalue())
         self.assertNotIn('Syncing 1 data sources.', out.getvalue())
@@ -311,8 +372,8 @@ class SyncDataSourceTestCase(TestCase):
             set(data_source_model.objects.filter.call_args.kwargs['name__in']),
             {'source-a', 'source-b'},
         )
-        datasource_a.sync.assert_called_once_with()
-        datasource_b.sync.assert_called_once_with()
+        datasource_a.sync.assert_called_once_with(full=False)
+        datasource_b.sync.assert_called_once_with(full=False)
         self.assertIn('Syncing 2 data sources.', out.getvalue())
         self.assertIn('[1] Syncing source-a', out.getvalue())
         self.assertIn('[2] Syncing source-b', out.getvalue())
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -6,7 +8,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.test import TestCase
 
 from core.choices import JobNotificationChoices, JobStatusChoices, ObjectChangeActionChoices
-from core.models import DataSource, Job, ObjectType
+from core.models import DataFile, DataSource, Job, ObjectType
 from dcim.models import Device, Location, Site
 from extras.models import Notification
 from netbox.constants import CENSOR_TOKEN, CENSOR_TOKEN_CHANGED
@@ -32,6 +34,81 @@ class DataSourceIgnoreRulesTestCase(TestCase):
         self.assertTrue(ds._ignore('dev/script.py'))
         self.assertFalse(ds._ignore('prod/script.py'))
 
+    def test_ignore_multiple_rules(self):
+        ds = DataSource(ignore_rules='*.txt\nREADME*\n*/dev/*')
+        self.assertTrue(ds._ignore('notes.txt'))
+        self.assertTrue(ds._ignore('subdir/README.md'))
+        self.assertTrue(ds._ignore('subdir/dev/script.py'))
+        self.assertFalse(ds._ignore('subdir/script.py'))
+        self.assertFalse(ds._ignore('readme.md'))
+
+    def test_ignore_hidden_paths(self):
+        ds = DataSource(ignore_rules='')
+        self.assertTrue(ds._ignore_path('.git/config'))
+        self.assertTrue(ds._ignore_path('subdir/.hidden'))
+        self.assertFalse(ds._ignore_path('subdir/.hidden/file.py'))
+
+
+class DataSourceSyncTestCase(TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = tmpdir.name
+        self.datasource = DataSource.objects.create(
+            name='Data Source 1',
+            type='local',
+            source_url=f'file://{self.root}',
+            ignore_rules='*.bak'
+        )
+
+    def write_file(self, path, data):
+        os.makedirs(os.path.dirname(os.path.join(self.root, path)), exist_ok=True)
+        with open(os.path.join(self.root, path), 'w') as f:
+            f.write(data)
+
+    def sync(self, **kwargs):
+        """
+        Sync the DataSource, returning the paths of all files read from disk.
+        """
+        refresh_from_disk = DataFile.refresh_from_disk
+        with patch.object(DataFile, 'refresh_from_disk', autospec=True, side_effect=refresh_from_disk) as mock:
+            self.datasource.sync(**kwargs)
+        return sorted(call.args[0].path for call in mock.call_args_list)
+
+    def test_sync_reads_only_modified_files(self):
+        self.write_file('file1.txt', 'abc')
+        self.write_file('subdir/file2.txt', 'def')
+        self.write_file('file3.bak', 'ghi')
+        self.write_file('.hidden/file4.txt', 'jkl')
+
+        self.assertEqual(self.sync(), ['file1.txt', 'subdir/file2.txt'])
+        self.assertEqual(
+            sorted(self.datasource.datafiles.values_list('path', flat=True)),
+            ['file1.txt', 'subdir/file2.txt']
+        )
+
+        # Nothing has changed
+        self.assertEqual(self.sync(), [])
+
+        # Modify one file, add another, and delete a third
+        self.write_file('file1.txt', 'abcd')
+        self.write_file('file5.txt', 'mno')
+        os.remove(os.path.join(self.root, 'subdir/file2.txt'))
+        self.assertEqual(self.sync(), ['file1.txt', 'file5.txt'])
+        self.assertEqual(
+            sorted(self.datasource.datafiles.values_list('path', flat=True)),
+            ['file1.txt', 'file5.txt']
+        )
+        self.assertEqual(self.datasource.datafiles.get(path='file1.txt').data, b'abcd')
+
+    def test_full_sync_reads_all_files(self):
+        self.write_file('file1.txt', 'abc')
+        self.write_file('file2.txt', 'def')
+        self.sync()
+
+        self.assertEqual(self.sync(full=True), ['file1.txt', 'file2.txt'])
+
 
 class DataSourceChangeLoggingTestCase(TestCase):
 
@@ -9,6 +9,7 @@ from django.db import transaction
 from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 
 from core import signals
+from core.changelog import buffered_change_logging
 from core.choices import DataSourceStatusChoices, JobStatusChoices, ObjectChangeActionChoices
 from core.models import ConfigRevision, DataSource, ObjectChange, ObjectType
 from core.signals import _signals_received, clear_events, post_sync
@@ -247,6 +248,89 @@ class HandleDeletedObjectSignalTestCase(TestCase):
             self.assertEqual(actions, [ObjectChangeActionChoices.ACTION_DELETE])
 
 
+class BufferedChangeLoggingTestCase(TestCase):
+    """
+    Verify that ObjectChanges recorded within buffered_change_logging() are written in bulk
+    once the block completes, preserving their order and request ID.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='alice', password='pw')
+
+    def setUp(self):
+        _signals_received.pre_delete = set()
+
+    def test_changes_are_written_on_completion(self):
+        tag = Tag.objects.create(name='Important', slug='important')
+        site_to_delete = Site.objects.create(name='Site 0', slug='site-0')
+        deleted_pk = site_to_delete.pk
+        request = _build_request(self.user)
+
+        with event_tracking(request):
+            with buffered_change_logging():
+                site = Site.objects.create(name='Site 1', slug='site-1')
+                site.tags.add(tag)
+                site_to_delete.delete()
+                # Nothing is written until the block completes
+                self.assertEqual(ObjectChange.objects.count(), 0)
+
+        changes = list(ObjectChange.objects.order_by('pk'))
+        self.assertEqual(
+            [(oc.changed_object_id, oc.action) for oc in changes],
+            [
+                (site.pk, ObjectChangeActionChoices.ACTION_CREATE),
+                (deleted_pk, ObjectChangeActionChoices.ACTION_DELETE),
+            ]
+        )
+        # The tag assignment is merged into the creation record
+        self.assertEqual(changes[0].postchange_data['tags'], ['Important'])
+        self.assertEqual(changes[0].object_repr, 'Site 1')
+        for oc in changes:
+            self.assertEqual(oc.user_name, 'alice')
+            self.assertEqual(oc.request_id, request.id)
+
+    def test_cascaded_deletions_are_written(self):
+        manufacturer = Manufacturer.objects.create(name='Manufacturer', slug='manufacturer')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type', slug='device-type')
+        role = DeviceRole.objects.create(name='Role', slug='role')
+        site = Site.objects.create(name='Site', slug='site')
+        device = Device.objects.create(name='Device', site=site, device_type=device_type, role=role)
+        interface = Interface.objects.create(device=device, name='eth0', type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+        device_pk, interface_pk = device.pk, interface.pk
+        request = _build_request(self.user)
+
+        with event_tracking(request):
+            with buffered_change_logging():
+                device.delete()
+
+        oc = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(Interface),
+            changed_object_id=interface_pk,
+            action=ObjectChangeActionChoices.ACTION_DELETE,
+        )
+        self.assertEqual(oc.related_object_id, device_pk)
+        self.assertEqual(oc.object_repr, 'eth0')
+        self.assertTrue(
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Device),
+                changed_object_id=device_pk,
+                action=ObjectChangeActionChoices.ACTION_DELETE,
+            ).exists()
+        )
+
+    def test_changes_are_discarded_on_failure(self):
+        request = _build_request(self.user)
+
+        with self.assertRaises(AbortRequest):
+            with event_tracking(request), transaction.atomic():
+                with buffered_change_logging():
+                    Site.objects.create(name='Site 1', slug='site-1')
+                    raise AbortRequest('Failed')
+
+        self.assertEqual(ObjectChange.objects.count(), 0)
+
+
 class ClearSignalHistorySignalTestCase(TestCase):
     """
     Verify core.signals.clear_signal_history resets the pre_delete bookkeeping at the
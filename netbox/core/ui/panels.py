@@ -11,6 +11,7 @@ class DataSourcePanel(panels.ObjectAttributesPanel):
     status = attrs.ChoiceAttr('status')
     sync_interval = attrs.ChoiceAttr('sync_interval', label=_('Sync interval'))
     last_synced = attrs.DateTimeAttr('last_synced', label=_('Last synced'))
+    revision = attrs.TextAttr('revision', style='font-monospace')
     description = attrs.TextAttr('description')
     source_url = attrs.TemplatedAttr(
         'source_url',
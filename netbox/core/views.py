@@ -69,6 +69,7 @@ from utilities.views import (
 from . import filtersets, forms, tables
 from .jobs import SyncDataSourceJob
 from .models import *
+from .object_actions import RetryImport
 from .plugins import get_catalog_plugins, get_local_plugins
 from .tables import CatalogPluginTable, JobLogEntryTable, PluginVersionTable
 from .ui import panels
@@ -245,7 +246,7 @@ class JobListView(generic.ObjectListView):
 @register_model_view(Job)
 class JobView(generic.ObjectView):
     queryset = Job.objects.all()
-    actions = (DeleteObject,)
+    actions = (RetryImport, DeleteObject)
     layout = layout.SimpleLayout(
         left_panels=[
             panels.JobPanel(),
@@ -262,7 +263,7 @@ class JobView(generic.ObjectView):
 @register_model_view(Job, 'log')
 class JobLogView(generic.ObjectView):
     queryset = Job.objects.all()
-    actions = (DeleteObject,)
+    actions = (RetryImport, DeleteObject)
     template_name = 'core/job/log.html'
     tab = ViewTab(
         label=_('Log'),
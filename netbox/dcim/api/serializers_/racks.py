@@ -17,6 +17,7 @@ from .manufacturers import ManufacturerSerializer
 from .sites import LocationSerializer, SiteSerializer
 
 __all__ = (
+    'RackAvailableSpaceSerializer',
     'RackElevationDetailFilterSerializer',
     'RackGroupSerializer',
     'RackReservationSerializer',
@@ -227,3 +228,21 @@ class RackElevationDetailFilterSerializer(serializers.Serializer):
         required=False,
         default=True
     )
+
+
+class RackAvailableSpaceSerializer(serializers.Serializer):
+    """
+    The space available within a rack for the installation of a device (see the rack available-space endpoint).
+    """
+    rack = RackSerializer(nested=True, read_only=True)
+    available_units = serializers.ListField(
+        child=serializers.DecimalField(max_digits=4, decimal_places=1),
+        read_only=True,
+        help_text=_("The positions at which a device of the requested height may be installed")
+    )
+    max_contiguous_units = serializers.DecimalField(
+        max_digits=4,
+        decimal_places=1,
+        read_only=True,
+        help_text=_("The largest number of contiguous free units on the requested face")
+    )
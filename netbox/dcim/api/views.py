@@ -1,17 +1,25 @@
 from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db import router, transaction
 from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.routers import APIRootView
 from rest_framework.viewsets import ViewSet
 
+from core.changelog import buffered_change_logging
 from dcim import filtersets
 from dcim.constants import CABLE_TRACE_SVG_DEFAULT_WIDTH
+from dcim.elevations import get_elevation_digest, render_elevation_svg
 from dcim.models import *
-from dcim.svg import CableTraceSVG
+from dcim.occupancy import RackOccupancy
+from dcim.provisioning import bulk_provisioning
+from dcim.svg import CableTraceSVG, RackElevationSVG
 from extras.api.mixins import ConfigContextQuerySetMixin, RenderConfigMixin
 from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
 from netbox.api.metadata import ContentTypeMetadata
@@ -221,9 +229,8 @@ class RackViewSet(NetBoxModelViewSet):
                 except ValueError:
                     pass
 
-            # Render and return the elevation as an SVG drawing with the correct content type
-            drawing = rack.get_elevation_svg(
-                face=data['face'],
+            elevation = RackElevationSVG(
+                rack,
                 user=request.user,
                 unit_width=data['unit_width'],
                 unit_height=data['unit_height'],
@@ -232,7 +239,20 @@ class RackViewSet(NetBoxModelViewSet):
                 base_url=request.build_absolute_uri('/'),
                 highlight_params=highlight_params
             )
-            return HttpResponse(drawing.tostring(), content_type='image/svg+xml')
+
+            # Return 304 (Not Modified) if the client's copy of the elevation is current
+            digest = get_elevation_digest(elevation, data['face'])
+            etag = quote_etag(digest)
+            if response := get_conditional_response(request, etag=etag):
+                return response
+
+            # Render (or retrieve from the cache) and return the elevation as an SVG drawing with the correct
+            # content type
+            svg = render_elevation_svg(elevation, data['face'], digest=digest)
+            response = HttpResponse(svg, content_type='image/svg+xml')
+            response['ETag'] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
 
         # Return a JSON representation of the rack units in the elevation
         elevation = rack.get_rack_units(
@@ -255,6 +275,36 @@ class RackViewSet(NetBoxModelViewSet):
         # TODO: This endpoint should always return an HttpResponse/DRF Response; `None` is not a meaningful result.
         return None
 
+    @extend_schema(
+        operation_id='dcim_racks_available_space_list',
+        responses={200: serializers.RackAvailableSpaceSerializer(many=True)}
+    )
+    @action(detail=False, url_path='available-space')
+    def available_space(self, request):
+        """
+        List the space available within each matching rack. The positions at which a device of the height given by
+        `available_units` (default 1U) may be installed on the face given by `available_units_face` (default both
+        faces) are returned for each rack. When `available_units` is specified, only racks with sufficient space are
+        included.
+        """
+        filterset = self.filterset_class(request.GET, queryset=self.get_queryset(), request=request)
+        if not filterset.is_valid():
+            return Response(filterset.errors, 400)
+        u_height = filterset.form.cleaned_data.get('available_units') or 1
+        face = filterset.form.cleaned_data.get('available_units_face') or None
+
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        occupancy = RackOccupancy.for_racks(page, include_reservations=False)
+        data = [
+            {
+                'rack': rack,
+                'available_units': occupancy[rack.pk].get_available_units(u_height, face),
+                'max_contiguous_units': occupancy[rack.pk].get_max_contiguous_units(face),
+            } for rack in page
+        ]
+        serializer = serializers.RackAvailableSpaceSerializer(data, many=True, context={'request': request})
+        return self.get_paginated_response(serializer.data)
+
 
 #
 # Rack reservations
@@ -439,6 +489,39 @@ class DeviceViewSet(
 
         return serializers.DeviceWithConfigContextSerializer
 
+    @extend_schema(
+        operation_id='dcim_devices_provision_create',
+        request=serializers.DeviceSerializer(many=True),
+        responses={201: serializers.DeviceWithConfigContextSerializer(many=True)}
+    )
+    @action(detail=False, methods=['post'], url_path='provision')
+    def provision(self, request):
+        """
+        Create one or more devices, instantiating the components of all new devices at once. Devices are validated and
+        created sequentially (as for a bulk create); their components are then created in bulk, with the resulting
+        changelog records, events, search cache entries, and component counts recorded in aggregate.
+        """
+        data = request.data if isinstance(request.data, list) else [request.data]
+        self.resolve_related_objects(data)
+
+        devices = []
+        with (
+            transaction.atomic(using=router.db_for_write(Device)),
+            buffered_change_logging(),
+            bulk_provisioning(),
+        ):
+            for item in data:
+                serializer = self.get_serializer(data=item)
+                serializer.is_valid(raise_exception=True)
+                self.perform_create(serializer)
+                devices.append(serializer.instance)
+
+        # Reload the devices to reflect their newly created components (e.g. component counts)
+        queryset = self.get_queryset().filter(pk__in=[device.pk for device in devices]).order_by('pk')
+        serializer = self.get_serializer(queryset, many=True)
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
 
 class VirtualDeviceContextViewSet(NetBoxModelViewSet):
     queryset = VirtualDeviceContext.objects.all()
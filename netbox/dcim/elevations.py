@@ -0,0 +1,117 @@
+import hashlib
+import json
+import logging
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
+
+__all__ = (
+    'get_elevation_digest',
+    'invalidate_rack_elevations',
+    'render_elevation_svg',
+)
+
+RACK_ELEVATION_VERSION_CACHE_KEY = 'rack_elevation_version'
+
+logger = logging.getLogger('netbox.dcim.elevations')
+
+
+def get_version_key(rack_id=None):
+    if rack_id is None:
+        return RACK_ELEVATION_VERSION_CACHE_KEY
+    return f'{RACK_ELEVATION_VERSION_CACHE_KEY}:{rack_id}'
+
+
+def get_cache_version(rack_id):
+    """
+    Return the current version of the rendered elevation cache for a rack. This comprises both a global version and
+    a per-rack version, either of which may be replaced to invalidate cached elevations.
+    """
+    keys = (get_version_key(), get_version_key(rack_id))
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid.uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return ':'.join(versions[key] for key in keys)
+
+
+def get_elevation_digest(elevation, face):
+    """
+    Return a digest of everything which determines the content of a rack elevation SVG: the rack and its installed
+    devices (including their names, roles, and device type images), reservations, the devices visible to the user,
+    and the rendering parameters. A change to any of these produces a new digest. The digest is suitable for use as
+    an ETag.
+
+    :param elevation: A RackElevationSVG instance
+    :param face: The rack face being rendered
+    """
+    rack = elevation.rack
+    devices = rack.devices.annotate(
+        devicebay_count=Count('devicebays')
+    ).order_by('pk').values_list(
+        'pk', 'name', 'label', 'position', 'face', 'status', 'asset_tag', 'serial', 'description',
+        'parent_bay__device_id', 'devicebay_count', 'role__name', 'role__color', 'device_type__model',
+        'device_type__manufacturer__name', 'device_type__u_height', 'device_type__is_full_depth',
+        'device_type__front_image', 'device_type__rear_image',
+    )
+    reservations = rack.reservations.order_by('pk').values_list('pk', 'units', 'description')
+    # Evaluating the highlighted devices here also caches them for rendering
+    highlight_devices = [device.pk for device in elevation.highlight_devices]
+
+    data = {
+        'version': [settings.RELEASE.full_version, get_cache_version(rack.pk)],
+        'rack': [rack.pk, rack.u_height, rack.starting_unit, rack.desc_units, rack.site_id, rack.location_id],
+        'params': [
+            face, elevation.unit_width, elevation.unit_height, elevation.legend_width, elevation.margin_width,
+            elevation.include_images, elevation.base_url,
+        ],
+        'devices': list(devices),
+        'reservations': list(reservations),
+        'permitted': sorted(elevation.permitted_device_ids),
+        'highlight': sorted(highlight_devices),
+    }
+    serialized = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def get_cache_key(digest):
+    return f'rack_elevation:{digest}'
+
+
+def render_elevation_svg(elevation, face, digest=None):
+    """
+    Return a rack elevation as an SVG document (string). If RACK_ELEVATION_CACHE_TIMEOUT is set, rendered elevations
+    are stored in the cache under their digest, and served from the cache until their content changes.
+
+    :param elevation: A RackElevationSVG instance
+    :param face: The rack face to render
+    :param digest: The elevation's digest, if already computed
+    """
+    timeout = settings.RACK_ELEVATION_CACHE_TIMEOUT
+    if not timeout:
+        return elevation.render(face).tostring()
+
+    key = get_cache_key(digest or get_elevation_digest(elevation, face))
+    if (svg := cache.get(key)) is not None:
+        return svg
+
+    svg = elevation.render(face).tostring()
+    cache.set(key, svg, timeout)
+    logger.debug(f"Cached {face} elevation of rack {elevation.rack.pk}")
+
+    return svg
+
+
+def invalidate_rack_elevations(rack_ids=None):
+    """
+    Invalidate the cached elevations of the given racks (by ID). If no racks are specified, all cached elevations
+    are invalidated. (Versions are maintained even when caching is disabled, as they also determine elevation ETags.)
+    """
+    if rack_ids is None:
+        cache.set(get_version_key(), uuid.uuid4().hex, None)
+        return
+    cache.delete_many([get_version_key(rack_id) for rack_id in rack_ids if rack_id is not None])
@@ -45,6 +45,7 @@ from wireless.models import WirelessLAN, WirelessLink
 from .choices import *
 from .constants import *
 from .models import *
+from .occupancy import RackOccupancy
 
 __all__ = (
     'CableBundleFilterSet',
@@ -493,6 +494,15 @@ class RackFilterSet(PrimaryModelFilterSet, TenancyFilterSet, ContactModelFilterS
     serial = MultiValueCharFilter(
         lookup_expr='iexact'
     )
+    available_units = django_filters.NumberFilter(
+        method='filter_available_units',
+        label=_('Contiguous units available'),
+    )
+    available_units_face = django_filters.ChoiceFilter(
+        choices=DeviceFaceChoices,
+        method='filter_available_units_face',
+        label=_('Face on which units are available'),
+    )
 
     class Meta:
         model = Rack
@@ -514,6 +524,32 @@ class RackFilterSet(PrimaryModelFilterSet, TenancyFilterSet, ContactModelFilterS
             Q(comments__icontains=value)
         )
 
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        # Return only racks with the specified number of contiguous units free on the specified face (or on both
+        # faces, if no face has been specified). This is applied after all other filters, so that occupancy is
+        # computed only for the racks which otherwise match.
+        if units := self.form.cleaned_data.get('available_units'):
+            face = self.form.cleaned_data.get('available_units_face') or None
+            racks = Rack.objects.filter(pk__in=queryset.values('pk')).only(
+                'pk', 'u_height', 'starting_unit', 'desc_units'
+            )
+            queryset = queryset.filter(pk__in=[
+                pk for pk, occupancy in RackOccupancy.for_racks(racks, include_reservations=False).items()
+                if occupancy.has_available_units(units, face)
+            ])
+
+        return queryset
+
+    def filter_available_units(self, queryset, name, value):
+        # Applied by filter_queryset()
+        return queryset
+
+    def filter_available_units_face(self, queryset, name, value):
+        # Applied by filter_queryset()
+        return queryset
+
 
 @register_filterset
 class RackReservationFilterSet(PrimaryModelFilterSet, TenancyFilterSet):
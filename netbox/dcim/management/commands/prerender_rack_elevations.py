@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from dcim.choices import DeviceFaceChoices
+from dcim.constants import RACK_ELEVATION_DEFAULT_LEGEND_WIDTH
+from dcim.elevations import render_elevation_svg
+from dcim.models import Rack
+from dcim.svg import RackElevationSVG
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the front and rear elevations of racks to populate the rack elevation cache. Elevations are rendered "
+        "as they appear to users permitted to view all devices; renders for users with restricted permissions are "
+        "not warmed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--site', action='append', dest='sites', metavar='SLUG',
+            help="Render only the racks within the specified site (may be specified multiple times)"
+        )
+        parser.add_argument(
+            '--base-url', required=True,
+            help="The base URL of the NetBox installation (e.g. https://netbox.example.com/), as used by clients of "
+                 "the REST API. Cached elevations are served only to requests made under the same base URL."
+        )
+        parser.add_argument(
+            '--no-images', action='store_false', dest='include_images',
+            help="Render elevations without device images"
+        )
+
+    def handle(self, *args, **options):
+        if not settings.RACK_ELEVATION_CACHE_TIMEOUT:
+            raise CommandError("Rack elevation caching is disabled. Set RACK_ELEVATION_CACHE_TIMEOUT to enable it.")
+
+        racks = Rack.objects.select_related('site', 'location').order_by('pk')
+        if options['sites']:
+            racks = racks.filter(site__slug__in=options['sites'])
+        total = racks.count()
+        if options['verbosity']:
+            self.stdout.write(f"Rendering elevations for {total} racks...")
+
+        for i, rack in enumerate(racks.iterator(), start=1):
+            # Elevations are rendered as for a user permitted to view all devices, using the same defaults as the
+            # REST API
+            for face in (DeviceFaceChoices.FACE_FRONT, DeviceFaceChoices.FACE_REAR):
+                elevation = RackElevationSVG(
+                    rack,
+                    legend_width=RACK_ELEVATION_DEFAULT_LEGEND_WIDTH,
+                    include_images=options['include_images'],
+                    base_url=options['base_url']
+                )
+                render_elevation_svg(elevation, face)
+            if options['verbosity'] > 1:
+                self.stdout.write(f"  [{i}/{total}] {rack}")
+
+        if options['verbosity']:
+            self.stdout.write(self.style.SUCCESS(f"Finished. Rendered elevations for {total} racks."))
@@ -1,10 +1,16 @@
-from django.core.management.base import BaseCommand
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
-from django.db import connection
-from django.db.models import Q
+from django.db import connection, connections
+from django.db.models import Count, Q
 
 from dcim.models import CablePath, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort
 from dcim.signals import create_cablepaths
+from dcim.utils import diff_cablepaths
 
 ENDPOINT_MODELS = (
     ConsolePort,
@@ -15,6 +21,75 @@ ENDPOINT_MODELS = (
     PowerPort
 )
 
+# The field by which the origins of each model are sharded when distributing work across processes
+SHARD_FIELDS = {
+    'device': {'dcim.powerfeed': 'power_panel_id'},
+    'site': {'dcim.powerfeed': 'power_panel__site_id'},
+}
+DEFAULT_SHARD_FIELDS = {
+    'device': 'device_id',
+    'site': 'device__site_id',
+}
+
+# The number of existing CablePaths compared at once in --diff-only mode
+DIFF_CHUNK_SIZE = 1000
+
+
+def get_shard_field(model, shard_by):
+    return SHARD_FIELDS[shard_by].get(model._meta.label_lower, DEFAULT_SHARD_FIELDS[shard_by])
+
+
+def get_origins(model):
+    """
+    Return a QuerySet of all cabled (or wirelessly linked) objects of the given endpoint model.
+    """
+    params = Q(cable__isnull=False)
+    if hasattr(model, 'wireless_link'):
+        params |= Q(wireless_link__isnull=False)
+    return model.objects.filter(params)
+
+
+def trace_shard(label, shard_field=None, shard_ids=None, force=False, diff_only=False):
+    """
+    Trace cable paths for the cabled objects of the specified model, optionally limited to those whose shard_field
+    value is among shard_ids. Returns a dictionary reporting the number of origins processed, as well as the number
+    of missing and stale cable paths found (if diff_only is True).
+
+    If diff_only is True, paths are traced in memory and compared with the existing CablePaths; nothing is written.
+    Otherwise, paths are created for all origins which lack one (or for all origins, if force is True).
+    """
+    model = apps.get_model(label)
+    origins = get_origins(model)
+    if shard_ids is not None:
+        origins = origins.filter(**{f'{shard_field}__in': shard_ids})
+    stats = {'origins': 0, 'missing': 0, 'stale': 0}
+
+    if not diff_only:
+        if not force:
+            origins = origins.filter(_path__isnull=True)
+        for obj in origins.iterator():
+            create_cablepaths([obj])
+            stats['origins'] += 1
+        return stats
+
+    # Identify origins with no CablePath, and collect the existing CablePaths of all others
+    path_ids = set()
+    for obj in origins.iterator():
+        stats['origins'] += 1
+        if obj._path_id is not None:
+            path_ids.add(obj._path_id)
+        elif CablePath.from_origin([obj]):
+            stats['missing'] += 1
+
+    # Retrace all existing CablePaths in memory and count those which have changed
+    path_ids = sorted(path_ids)
+    for i in range(0, len(path_ids), DIFF_CHUNK_SIZE):
+        cable_paths = list(CablePath.objects.filter(pk__in=path_ids[i:i + DIFF_CHUNK_SIZE]))
+        updated_paths, deleted_paths, _ = diff_cablepaths(cable_paths)
+        stats['stale'] += len(updated_paths) + len(deleted_paths)
+
+    return stats
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in NetBox"
@@ -28,6 +103,18 @@ class Command(BaseCommand):
             "--no-input", action='store_true', dest='no_input',
             help="Do not prompt user for any input/confirmation"
         )
+        parser.add_argument(
+            "--diff-only", action='store_true', dest='diff_only',
+            help="Report missing and stale cable paths without writing any changes"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=1,
+            help="Number of worker processes across which to distribute path tracing"
+        )
+        parser.add_argument(
+            "--shard-by", choices=SHARD_FIELDS.keys(), default='device', dest='shard_by',
+            help="Distribute path tracing across workers by device or by site (default: device)"
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -37,6 +124,10 @@ class Command(BaseCommand):
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20 - bar_size)}] {int(percentage)}%", ending='')
 
     def handle(self, *model_names, **options):
+        if options['workers'] < 1:
+            raise CommandError("The number of workers must be at least 1.")
+        if options['diff_only'] and options['force']:
+            raise CommandError("The --diff-only and --force options are mutually exclusive.")
 
         # If --force was passed, first delete all existing CablePaths
         if options['force']:
@@ -66,12 +157,14 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
+        # Distribute tracing across worker processes, and/or diff the existing paths
+        if options['workers'] > 1 or options['diff_only']:
+            self._handle_sharded(**options)
+            return
+
         # Retrace paths
         for model in ENDPOINT_MODELS:
-            params = Q(cable__isnull=False)
-            if hasattr(model, 'wireless_link'):
-                params |= Q(wireless_link__isnull=False)
-            origins = model.objects.filter(params)
+            origins = get_origins(model)
             if not options['force']:
                 origins = origins.filter(_path__isnull=True)
             origins_count = origins.count()
@@ -79,12 +172,109 @@ class Command(BaseCommand):
                 self.stdout.write(f'Found no missing {model._meta.verbose_name} paths; skipping')
                 continue
             self.stdout.write(f'Retracing {origins_count} cabled {model._meta.verbose_name_plural}...')
+            start_time = time.monotonic()
             i = 0
             for i, obj in enumerate(origins, start=1):
                 create_cablepaths([obj])
                 if not i % 100:
                     self.draw_progress_bar(i * 100 / origins_count)
             self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f'\n  Retraced {i} {model._meta.verbose_name_plural}'))
+            self.stdout.write(self.style.SUCCESS(
+                f'\n  Retraced {i} {model._meta.verbose_name_plural} {self._get_throughput(i, start_time)}'
+            ))
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
+
+    @staticmethod
+    def _get_throughput(count, start_time):
+        elapsed = time.monotonic() - start_time
+        rate = count / elapsed if elapsed else count
+        return f'in {elapsed:.1f}s ({rate:.0f} paths/s)'
+
+    def _get_shards(self, origins, shard_field, shard_count):
+        """
+        Divide the given origins into (at most) shard_count shards of roughly equal size, grouping them by the value
+        of shard_field. Returns a list of lists of shard_field values.
+        """
+        counts = origins.order_by(shard_field).values_list(shard_field).annotate(count=Count('pk'))
+        target_size = max(sum(count for _, count in counts) / shard_count, 1)
+        shards = [[]]
+        shard_size = 0
+        for shard_id, count in counts:
+            if shard_size >= target_size:
+                shards.append([])
+                shard_size = 0
+            shards[-1].append(shard_id)
+            shard_size += count
+        return shards
+
+    def _handle_sharded(self, **options):
+        """
+        Trace (or diff) the cable paths for each endpoint model in shards grouped by device or site, optionally
+        distributed across a pool of worker processes.
+        """
+        workers = options['workers']
+        diff_only = options['diff_only']
+        totals = {'origins': 0, 'missing': 0, 'stale': 0}
+
+        for model in ENDPOINT_MODELS:
+            label = model._meta.label_lower
+            origins = get_origins(model)
+            if not options['force'] and not diff_only:
+                origins = origins.filter(_path__isnull=True)
+            origins_count = origins.count()
+            if not origins_count:
+                self.stdout.write(
+                    f'Found no {"cabled" if diff_only else "missing"} {model._meta.verbose_name} paths; skipping'
+                )
+                continue
+
+            shard_field = get_shard_field(model, options['shard_by'])
+            shards = self._get_shards(origins, shard_field, workers * 4)
+            self.stdout.write(
+                f'{"Checking" if diff_only else "Retracing"} {origins_count} cabled {model._meta.verbose_name_plural} '
+                f'in {len(shards)} shard(s) using {workers} worker(s)...'
+            )
+            start_time = time.monotonic()
+            stats = {'origins': 0, 'missing': 0, 'stale': 0}
+
+            def complete_shard(result):
+                for key, value in result.items():
+                    stats[key] += value
+                self.draw_progress_bar(min(stats['origins'] * 100 / origins_count, 100))
+                self.stdout.write(f' {self._get_throughput(stats["origins"], start_time)}', ending='')
+                self.stdout.flush()
+
+            kwargs = {'shard_field': shard_field, 'force': options['force'], 'diff_only': diff_only}
+            if workers == 1:
+                for shard_ids in shards:
+                    complete_shard(trace_shard(label, shard_ids=shard_ids, **kwargs))
+            else:
+                # Close database connections prior to forking, so that they are not shared with the worker processes
+                connections.close_all()
+                mp_context = multiprocessing.get_context('fork')
+                with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                    futures = [
+                        executor.submit(trace_shard, label, shard_ids=shard_ids, **kwargs) for shard_ids in shards
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            complete_shard(future.result())
+                    except BaseException:
+                        executor.shutdown(cancel_futures=True)
+                        raise
+
+            summary = f'{"Checked" if diff_only else "Retraced"} {stats["origins"]} {model._meta.verbose_name_plural}'
+            if diff_only:
+                summary += f': {stats["missing"]} missing and {stats["stale"]} stale paths'
+            self.stdout.write(self.style.SUCCESS(f'\n  {summary} {self._get_throughput(stats["origins"], start_time)}'))
+            for key, value in stats.items():
+                totals[key] += value
 
+        if diff_only:
+            style = self.style.WARNING if totals['missing'] or totals['stale'] else self.style.SUCCESS
+            self.stdout.write(style(
+                f'Found {totals["missing"]} missing and {totals["stale"]} stale cable paths among '
+                f'{totals["origins"]} cabled endpoints.'
+            ))
         self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -19,6 +19,7 @@ from dcim.choices import *
 from dcim.constants import *
 from dcim.exceptions import UnsupportedCablePath
 from dcim.fields import PathField
+from dcim.tracing import CableGraph
 from dcim.utils import decompile_path_node, object_to_path_node
 from netbox.choices import ColorChoices
 from netbox.models import ChangeLoggedModel, PrimaryModel
@@ -780,13 +781,19 @@ class CablePath(models.Model):
 
         super().save(*args, **kwargs)
 
-        # Record a direct reference to this CablePath on its originating object(s). Only PathEndpoint
-        # subclasses carry the denormalized `_path` back-reference; other valid origins (e.g.
-        # CircuitTermination) do not, so skip the update for them.
+        self.update_origins()
+
+    def update_origins(self):
+        """
+        Record a direct reference to this CablePath on its originating object(s). Only PathEndpoint subclasses carry
+        the denormalized `_path` back-reference; other valid origins (e.g. CircuitTermination) do not, so skip the
+        update for them.
+        """
         origin_model = self.origin_type.model_class()
         if issubclass(origin_model, PathEndpoint):
             origin_ids = [decompile_path_node(node)[1] for node in self.path[0]]
             origin_model.objects.filter(pk__in=origin_ids).update(_path=self.pk)
+    update_origins.alters_data = True
 
     def delete(self, *args, **kwargs):
         # Mirror save() - clear _path on origins to prevent stale references
@@ -846,16 +853,21 @@ class CablePath(models.Model):
         return int(len(self.path) / 3)
 
     @classmethod
-    def from_origin(cls, terminations):
+    def from_origin(cls, terminations, graph=None):
         """
         Create a new CablePath instance as traced from the given termination objects. These can be any object to which a
         Cable or WirelessLink connects (interfaces, console ports, circuit termination, etc.). All terminations must be
         of the same type and must belong to the same parent object.
+
+        A CableGraph may be passed to trace the path using objects which have already been retrieved (e.g. when
+        tracing many paths at once). Otherwise, objects are retrieved as each hop is traced.
         """
         from circuits.models import Circuit, CircuitTermination
 
         if not terminations:
             return None
+        if graph is None:
+            graph = CableGraph()
 
         # Ensure all originating terminations are attached to the same link
         if len(terminations) > 1 and not all(t.link == terminations[0].link for t in terminations[1:]):
@@ -972,7 +984,7 @@ class CablePath(models.Model):
                     if not term_position_pairs:
                         term_position_pairs = [(terminations[0], pos) for pos in positions or [None]]
 
-                    peer_results = cable_profile.get_peer_terminations(term_position_pairs)
+                    peer_results = graph.get_peer_terminations(cable_profile, term_position_pairs)
                     seen = set()
                     for peer, new_pos in peer_results:
                         # Deduplicate peer terminations by model type & PK.
@@ -993,25 +1005,11 @@ class CablePath(models.Model):
 
                 # Legacy (positionless) behavior
                 else:
-                    termination_type = ObjectType.objects.get_for_model(terminations[0])
-                    local_cable_terminations = CableTermination.objects.filter(
-                        termination_type=termination_type,
-                        termination_id__in=[t.pk for t in terminations]
-                    )
-
-                    q_filter = Q()
-                    for lct in local_cable_terminations:
-                        cable_end = 'A' if lct.cable_end == 'B' else 'B'
-                        q_filter |= Q(cable=lct.cable, cable_end=cable_end)
+                    remote_terminations = graph.get_far_end_terminations(terminations)
 
-                    # Make sure this filter has been populated; if not, we have probably been given invalid data
-                    if not q_filter:
+                    # If no CableTerminations were found, we have probably been given invalid data
+                    if remote_terminations is None:
                         break
-
-                    remote_cable_terminations = CableTermination.objects.filter(q_filter).prefetch_related(
-                        'termination'
-                    )
-                    remote_terminations = [ct.termination for ct in remote_cable_terminations]
             else:
                 # WirelessLink
                 remote_terminations = [
@@ -1039,11 +1037,7 @@ class CablePath(models.Model):
             if isinstance(remote_terminations[0], FrontPort):
                 # Follow FrontPorts to their corresponding RearPorts
                 if remote_terminations[0].positions > 1 and position_stack:
-                    positions = position_stack.pop()
-                    q_filter = Q()
-                    for rt in remote_terminations:
-                        q_filter |= Q(front_port=rt, front_port_position__in=positions)
-                    port_mappings = PortMapping.objects.filter(q_filter)
+                    port_mappings = graph.get_port_mappings(remote_terminations, positions=position_stack.pop())
                 elif remote_terminations[0].positions > 1:
                     is_split = True
                     logger.debug(
@@ -1052,7 +1046,7 @@ class CablePath(models.Model):
                     )
                     break
                 else:
-                    port_mappings = PortMapping.objects.filter(front_port__in=remote_terminations)
+                    port_mappings = graph.get_port_mappings(remote_terminations)
                 if not port_mappings:
                     break
 
@@ -1064,11 +1058,7 @@ class CablePath(models.Model):
             elif isinstance(remote_terminations[0], RearPort):
                 # Follow RearPorts to their corresponding FrontPorts
                 if remote_terminations[0].positions > 1 and position_stack:
-                    positions = position_stack.pop()
-                    q_filter = Q()
-                    for rt in remote_terminations:
-                        q_filter |= Q(rear_port=rt, rear_port_position__in=positions)
-                    port_mappings = PortMapping.objects.filter(q_filter)
+                    port_mappings = graph.get_port_mappings(remote_terminations, positions=position_stack.pop())
                 elif remote_terminations[0].positions > 1:
                     is_split = True
                     logger.debug(
@@ -1077,7 +1067,7 @@ class CablePath(models.Model):
                     )
                     break
                 else:
-                    port_mappings = PortMapping.objects.filter(rear_port__in=remote_terminations)
+                    port_mappings = graph.get_port_mappings(remote_terminations)
                 if not port_mappings:
                     break
 
@@ -23,6 +23,7 @@ from extras.models import ConfigContextModel, CustomField
 from extras.querysets import ConfigContextModelQuerySet
 from netbox.choices import ColorChoices
 from netbox.config import ConfigItem
+from netbox.context import provisioning_queue
 from netbox.models import NestedGroupModel, OrganizationalModel, PrimaryModel
 from netbox.models.features import ContactsMixin, ImageAttachmentsMixin
 from netbox.models.mixins import WeightMixin
@@ -1051,8 +1052,11 @@ class Device(
 
         super().save(*args, **kwargs)
 
-        # If this is a new Device, instantiate all the related components per the DeviceType definition
-        if is_new:
+        # If this is a new Device, instantiate all the related components per the DeviceType definition. Within a
+        # bulk provisioning block, this is deferred so that the components of all new devices are created at once.
+        if is_new and (queue := provisioning_queue.get()) is not None:
+            queue.append(self)
+        elif is_new:
             self._instantiate_components(self.device_type.consoleporttemplates.all())
             self._instantiate_components(self.device_type.consoleserverporttemplates.all())
             self._instantiate_components(self.device_type.powerporttemplates.all())
@@ -12,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 
 from dcim.choices import *
 from dcim.constants import *
+from dcim.occupancy import RackOccupancy
 from dcim.svg import RackElevationSVG
 from netbox.choices import ColorChoices
 from netbox.models import OrganizationalModel, PrimaryModel
@@ -512,8 +513,7 @@ class Rack(ContactsMixin, ImageAttachmentsMixin, TrackingModelMixin, RackBase):
         if not self._state.adding:
 
             # Retrieve all devices installed within the rack
-            devices = Device.objects.prefetch_related(
-                'device_type',
+            devices = Device.objects.select_related(
                 'device_type__manufacturer',
                 'role'
             ).annotate(
@@ -529,9 +529,9 @@ class Rack(ContactsMixin, ImageAttachmentsMixin, TrackingModelMixin, RackBase):
             )
 
             # Determine which devices the user has permission to view
-            permitted_device_ids = []
+            permitted_device_ids = set()
             if user is not None:
-                permitted_device_ids = self.devices.restrict(user, 'view').values_list('pk', flat=True)
+                permitted_device_ids = set(self.devices.restrict(user, 'view').values_list('pk', flat=True))
 
             for device in devices:
                 if expand_devices:
@@ -558,34 +558,13 @@ class Rack(ContactsMixin, ImageAttachmentsMixin, TrackingModelMixin, RackBase):
         :param exclude: List of devices IDs to exclude (useful when moving a device within a rack)
         :param ignore_excluded_devices: Ignore devices that are marked to exclude from utilization calculations
         """
-        # Gather all devices which consume U space within the rack
-        devices = self.devices.prefetch_related('device_type').filter(position__gte=1)
-        if ignore_excluded_devices:
-            devices = devices.exclude(device_type__exclude_from_utilization=True)
-
-        if exclude is not None:
-            devices = devices.exclude(pk__in=exclude)
-
-        # Initialize the rack unit skeleton
-        units = list(self.units)
-
-        # Remove units consumed by installed devices
-        for d in devices:
-            if rack_face is None or d.face == rack_face or d.device_type.is_full_depth:
-                for u in drange(d.position, d.position + d.device_type.u_height, 0.5):
-                    try:
-                        units.remove(u)
-                    except ValueError:
-                        # Found overlapping devices in the rack!
-                        pass
-
-        # Remove units without enough space above them to accommodate a device of the specified height
-        available_units = []
-        for u in units:
-            if set(drange(u, u + decimal.Decimal(u_height), 0.5)).issubset(units):
-                available_units.append(u)
-
-        return list(reversed(available_units))
+        occupancy = RackOccupancy.for_racks([self], include_reservations=False)[self.pk]
+        return occupancy.get_available_units(
+            u_height=u_height,
+            face=rack_face,
+            exclude=exclude,
+            ignore_excluded_devices=ignore_excluded_devices
+        )
 
     def get_reserved_units(self):
         """
@@ -643,20 +622,11 @@ class Rack(ContactsMixin, ImageAttachmentsMixin, TrackingModelMixin, RackBase):
         Determine the utilization rate of the rack and return it as a percentage. Occupied and reserved units both count
         as utilized.
         """
-        # Determine unoccupied units
-        total_units = len(list(self.units))
-        available_units = self.get_available_units(u_height=0.5, ignore_excluded_devices=True)
-
-        # Remove reserved units
-        for ru in self.get_reserved_units():
-            for u in drange(ru, ru + 1, 0.5):
-                if u in available_units:
-                    available_units.remove(u)
-
-        occupied_unit_count = total_units - len(available_units)
-        percentage = float(occupied_unit_count) / total_units * 100
+        # Return any utilization which has been calculated in bulk (e.g. by RackTable)
+        if (utilization := getattr(self, '_cached_utilization', None)) is not None:
+            return utilization
 
-        return percentage
+        return RackOccupancy.for_racks([self])[self.pk].get_utilization()
 
     def get_power_utilization(self):
         """
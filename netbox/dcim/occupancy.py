@@ -0,0 +1,161 @@
+import decimal
+from collections import defaultdict
+
+from django.apps import apps
+
+from dcim.choices import DeviceFaceChoices
+
+__all__ = (
+    'RackOccupancy',
+)
+
+FACES = (DeviceFaceChoices.FACE_FRONT, DeviceFaceChoices.FACE_REAR)
+
+
+class RackOccupancy:
+    """
+    A compact representation of the space occupied within a rack. Each face of the rack is represented as a bitmap
+    of half-unit slots, where bit 0 is the lowest half-unit of the rack (the starting unit). Full-depth devices occupy
+    both faces.
+
+    Use RackOccupancy.for_racks() to compute occupancy for many racks using a constant number of queries.
+
+    :param rack: The Rack
+    :param devices: An iterable of (pk, position, face, u_height, is_full_depth, exclude_from_utilization) tuples for
+        the devices installed within the rack
+    :param reserved_units: An iterable of unit numbers which have been reserved
+    """
+    def __init__(self, rack, devices=(), reserved_units=()):
+        self.rack = rack
+        self.starting_unit = decimal.Decimal(rack.starting_unit)
+        self.slots = int(rack.u_height * 2)
+        self.mask = (1 << self.slots) - 1
+
+        # Map each device to the slots it occupies and the faces on which it does so (None for all faces)
+        self.devices = {}
+        self.occupied = dict.fromkeys((None, *FACES), 0)
+        self.utilized = 0
+        for pk, position, face, u_height, is_full_depth, exclude_from_utilization in devices:
+            bits = self._get_span(position, u_height)
+            faces = None if is_full_depth else face
+            self.devices[pk] = (bits, faces, exclude_from_utilization)
+            self.occupied[None] |= bits
+            for f in FACES:
+                if faces is None or faces == f:
+                    self.occupied[f] |= bits
+            if not exclude_from_utilization:
+                self.utilized |= bits
+
+        self.reserved = 0
+        for u in reserved_units:
+            self.reserved |= self._get_span(u, 1)
+
+    @classmethod
+    def for_racks(cls, racks, include_reservations=True):
+        """
+        Return a dictionary mapping the primary key of each of the given racks to its RackOccupancy. Installed devices
+        (and optionally reservations) are retrieved for all racks at once.
+        """
+        Device = apps.get_model('dcim', 'Device')
+        RackReservation = apps.get_model('dcim', 'RackReservation')
+
+        racks = {rack.pk: rack for rack in racks}
+        devices = defaultdict(list)
+        reserved_units = defaultdict(list)
+        if racks:
+            for rack_id, *device in Device.objects.filter(
+                rack__in=racks,
+                position__gte=1,
+                device_type__u_height__gt=0
+            ).values_list(
+                'rack_id', 'pk', 'position', 'face', 'device_type__u_height', 'device_type__is_full_depth',
+                'device_type__exclude_from_utilization'
+            ):
+                devices[rack_id].append(device)
+            if include_reservations:
+                reservations = RackReservation.objects.filter(rack__in=racks).values_list('rack_id', 'units')
+                for rack_id, units in reservations:
+                    reserved_units[rack_id].extend(units)
+
+        return {
+            pk: cls(rack, devices[pk], reserved_units[pk]) for pk, rack in racks.items()
+        }
+
+    def _get_span(self, position, u_height):
+        """
+        Return a bitmap of the slots spanned by an object of the given height at the given position.
+        """
+        first = int((decimal.Decimal(position) - self.starting_unit) * 2)
+        count = int(decimal.Decimal(u_height) * 2)
+        if count <= 0:
+            return 0
+        if first < 0:
+            count += first
+            first = 0
+        return (((1 << max(count, 0)) - 1) << first) & self.mask
+
+    def _get_unit(self, slot):
+        return self.starting_unit + decimal.Decimal(slot) / 2
+
+    def get_free(self, face=None, exclude=None, ignore_excluded_devices=False):
+        """
+        Return a bitmap of free slots on the given face (or on both faces if None).
+
+        :param exclude: An iterable of device PKs to disregard
+        :param ignore_excluded_devices: Disregard devices which are excluded from utilization calculations
+        """
+        if not exclude and not ignore_excluded_devices:
+            return ~self.occupied[face] & self.mask
+        exclude = set(exclude or ())
+        occupied = 0
+        for pk, (bits, faces, exclude_from_utilization) in self.devices.items():
+            if pk in exclude or (ignore_excluded_devices and exclude_from_utilization):
+                continue
+            if face is None or faces is None or faces == face:
+                occupied |= bits
+        return ~occupied & self.mask
+
+    def get_available(self, u_height=1, face=None, exclude=None, ignore_excluded_devices=False):
+        """
+        Return a bitmap of the slots at which an object of the given height may be installed.
+        """
+        free = available = self.get_free(face, exclude, ignore_excluded_devices)
+        for i in range(1, int(decimal.Decimal(u_height) * 2)):
+            available &= free >> i
+        return available
+
+    def get_available_units(self, u_height=1, face=None, exclude=None, ignore_excluded_devices=False):
+        """
+        Return a list of units at which a device of the given height may be installed, in the same order as
+        Rack.get_available_units().
+        """
+        available = self.get_available(u_height, face, exclude, ignore_excluded_devices)
+        units = [self._get_unit(i) for i in range(self.slots) if available >> i & 1]
+        if self.rack.desc_units:
+            units.reverse()
+        return units
+
+    def has_available_units(self, u_height, face=None):
+        """
+        Return True if the given number of contiguous units are free on the given face (or both faces if None).
+        """
+        return bool(self.get_available(u_height, face))
+
+    def get_max_contiguous_units(self, face=None):
+        """
+        Return the largest number of contiguous free units on the given face (or both faces if None).
+        """
+        free = self.get_free(face)
+        longest = 0
+        while free:
+            free &= free >> 1
+            longest += 1
+        return decimal.Decimal(longest) / 2
+
+    def get_utilization(self):
+        """
+        Return the percentage of the rack which is occupied or reserved (as in Rack.get_utilization()).
+        """
+        if not self.slots:
+            return 0
+        return (self.utilized | self.reserved).bit_count() / self.slots * 100
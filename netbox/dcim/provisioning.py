@@ -0,0 +1,316 @@
+import copy
+import logging
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import router, transaction
+from django.db.models import Max, prefetch_related_objects
+from django_prometheus.models import model_inserts
+
+from core.changelog import buffered_change_logging
+from core.choices import ObjectChangeActionChoices
+from core.events import OBJECT_CREATED
+from extras.events import enqueue_event
+from extras.models import CustomField
+from netbox.context import changelog_buffer, current_request, events_queue, provisioning_queue, search_queue
+from utilities.counters import get_counters_for_model, update_counters
+from utilities.prefetch import get_prefetchable_fields
+
+from .models import (
+    Device,
+    FrontPortTemplate,
+    InterfaceTemplate,
+    InventoryItem,
+    ModuleBay,
+    PortMapping,
+    PowerPortTemplate,
+    RearPortTemplate,
+)
+
+__all__ = (
+    'bulk_provisioning',
+    'instantiate_device_components',
+    'provision_devices',
+)
+
+# The number of components written per INSERT
+PROVISIONING_BATCH_SIZE = 1000
+
+logger = logging.getLogger('netbox.dcim.provisioning')
+
+
+@contextmanager
+def bulk_provisioning():
+    """
+    Defer the instantiation of components for any devices created within the wrapped block. Once the block has
+    completed successfully, the components of all new devices are created at once. This should be entered within
+    the transaction in which devices are created.
+
+    If bulk provisioning is already active (e.g. in an enclosing block), it continues to be used.
+    """
+    if provisioning_queue.get() is not None:
+        yield
+        return
+
+    devices = []
+    token = provisioning_queue.set(devices)
+    try:
+        yield
+    finally:
+        provisioning_queue.reset(token)
+    with buffered_change_logging():
+        instantiate_device_components(devices)
+
+
+def provision_devices(devices):
+    """
+    Save the given (new) Device instances and instantiate all of their components in bulk. Returns the list of
+    devices.
+    """
+    devices = list(devices)
+    with (
+        transaction.atomic(using=router.db_for_write(Device)),
+        buffered_change_logging(),
+        bulk_provisioning(),
+    ):
+        for device in devices:
+            device.full_clean()
+            device.save()
+
+    return devices
+
+
+def _instantiate(template, device, created):
+    return template.instantiate(device=device)
+
+
+def _instantiate_power_outlet(template, device, created):
+    # Resolve the outlet's power port from those just created, rather than querying for it by name
+    power_port_id = template.power_port_id
+    template = copy.copy(template)
+    template.power_port = None
+    power_outlet = template.instantiate(device=device)
+    if power_port_id:
+        power_outlet.power_port = created[(PowerPortTemplate, power_port_id, device.pk)]
+    return power_outlet
+
+
+def _instantiate_inventory_item(template, device, created):
+    # Resolve the item's parent and assigned component from those just created, rather than querying for them by name
+    parent_id, component_type_id, component_id = template.parent_id, template.component_type_id, template.component_id
+    template = copy.copy(template)
+    template.parent = None
+    template.component = None
+    inventory_item = template.instantiate(device=device)
+    if parent_id:
+        inventory_item.parent = created[(type(template), parent_id, device.pk)]
+    if component_type_id:
+        component_template_model = ContentType.objects.get_for_id(component_type_id).model_class()
+        inventory_item.component = created[(component_template_model, component_id, device.pk)]
+    return inventory_item
+
+
+# Component templates are instantiated in the same order as under Device.save(), along with any related objects
+# referenced when instantiating each component
+COMPONENT_TEMPLATES = (
+    ('consoleporttemplates', _instantiate, ()),
+    ('consoleserverporttemplates', _instantiate, ()),
+    ('powerporttemplates', _instantiate, ()),
+    ('poweroutlettemplates', _instantiate_power_outlet, ()),
+    ('interfacetemplates', _instantiate, ()),
+    ('rearporttemplates', _instantiate, ()),
+    ('frontporttemplates', _instantiate, ()),
+    ('modulebaytemplates', _instantiate, ()),
+    ('devicebaytemplates', _instantiate, ()),
+    ('inventoryitemtemplates', _instantiate_inventory_item, ('role', 'manufacturer')),
+)
+
+
+def _set_tree_fields(node, children, tree_id, level=0, lft=1):
+    """
+    Assign MPTT fields to an unsaved node and its descendants, ordered as given. Returns the node's right value.
+    """
+    node.tree_id = tree_id
+    node.level = level
+    node.lft = lft
+    rght = lft + 1
+    for child in children[id(node)]:
+        rght = _set_tree_fields(child, children, tree_id, level + 1, rght) + 1
+    node.rght = rght
+    return rght
+
+
+def _get_next_tree_id(model, using):
+    return (model._base_manager.using(using).aggregate(Max('tree_id'))['tree_id__max'] or 0) + 1
+
+
+def instantiate_device_components(devices):
+    """
+    Instantiate the components of the given (saved) devices from the templates of their device types. Components of
+    each type are created for all devices at once, and the creation of components is reflected in the changelog,
+    event queue, search cache, and counter fields of their devices in aggregate rather than by a post_save signal for
+    each component.
+    """
+    if not devices:
+        return
+    using = router.db_for_write(Device)
+
+    devices_by_type = defaultdict(list)
+    for device in devices:
+        devices_by_type[device.device_type].append(device)
+
+    # Maps each component by (template model, template ID, device ID)
+    created = {}
+    components_by_model = {}
+
+    for accessor, instantiate, related_fields in COMPONENT_TEMPLATES:
+        components = []
+        for device_type, device_type_devices in devices_by_type.items():
+            templates = list(getattr(device_type, accessor).select_related(*related_fields))
+            if not templates:
+                continue
+            model = templates[0].component_model
+            cf_defaults = CustomField.objects.get_defaults_for_model(model)
+
+            for device in device_type_devices:
+                device_components = []
+                for template in templates:
+                    component = instantiate(template, device, created)
+                    created[(type(template), template.pk, device.pk)] = component
+                    device_components.append(component)
+
+                # Check for duplicate names after resolution {vc_position}
+                device._check_duplicate_component_names(device_components)
+
+                for component in device_components:
+                    # Set default values for any applicable custom fields
+                    if cf_defaults:
+                        component.custom_field_data = dict(cf_defaults)
+                    # Set denormalized references
+                    component._site = device.site
+                    component._location = device.location
+                    component._rack = device.rack
+                components.extend(device_components)
+
+        if not components:
+            continue
+        model = type(components[0])
+
+        if model is ModuleBay:
+            # Each module bay on a device is the root of its own tree
+            tree_id = _get_next_tree_id(model, using)
+            for module_bay in components:
+                module_bay.tree_id = tree_id
+                module_bay.lft = 1
+                module_bay.rght = 2
+                module_bay.level = 0
+                tree_id += 1
+            model.objects.using(using).bulk_create(components, batch_size=PROVISIONING_BATCH_SIZE)
+        elif model is InventoryItem:
+            # Lay out each tree of inventory items before saving any, and create the items one level at a time so
+            # that each item's parent has been assigned an ID
+            children = defaultdict(list)
+            for inventory_item in components:
+                if inventory_item.parent is not None:
+                    children[id(inventory_item.parent)].append(inventory_item)
+            tree_id = _get_next_tree_id(model, using)
+            for inventory_item in components:
+                if inventory_item.parent is None:
+                    _set_tree_fields(inventory_item, children, tree_id)
+                    tree_id += 1
+            for level in sorted({item.level for item in components}):
+                model.objects.using(using).bulk_create(
+                    [item for item in components if item.level == level],
+                    batch_size=PROVISIONING_BATCH_SIZE
+                )
+        else:
+            model.objects.using(using).bulk_create(components, batch_size=PROVISIONING_BATCH_SIZE)
+        components_by_model[model] = components
+
+    # Interface bridges can be set only once all interfaces have been created
+    bridged_interfaces = []
+    for device_type, device_type_devices in devices_by_type.items():
+        for template in device_type.interfacetemplates.exclude(bridge=None):
+            for device in device_type_devices:
+                interface = created[(InterfaceTemplate, template.pk, device.pk)]
+                interface.bridge = created[(InterfaceTemplate, template.bridge_id, device.pk)]
+                bridged_interfaces.append(interface)
+    if bridged_interfaces:
+        type(bridged_interfaces[0]).objects.using(using).bulk_update(
+            bridged_interfaces, ['bridge'], batch_size=PROVISIONING_BATCH_SIZE
+        )
+
+    # Replicate any front/rear port mappings from each DeviceType
+    port_mappings = []
+    for device_type, device_type_devices in devices_by_type.items():
+        for template in device_type.port_mappings.all():
+            for device in device_type_devices:
+                port_mappings.append(PortMapping(
+                    device_id=device.pk,
+                    front_port=created[(FrontPortTemplate, template.front_port_id, device.pk)],
+                    front_port_position=template.front_port_position,
+                    rear_port=created[(RearPortTemplate, template.rear_port_id, device.pk)],
+                    rear_port_position=template.rear_port_position,
+                ))
+    PortMapping.objects.using(using).bulk_create(port_mappings, batch_size=PROVISIONING_BATCH_SIZE)
+
+    for model, components in components_by_model.items():
+        _update_counters(model, components, using)
+        _cache_components(components)
+        _record_changes(model, components)
+        logger.debug(f"Created {len(components)} {model._meta.verbose_name_plural} for {len(devices)} devices")
+
+
+def _update_counters(model, components, using):
+    """
+    Increment the counter fields of the parents of newly created components, updating all parents for which the
+    increment is the same at once.
+    """
+    for field_name, counter_name in get_counters_for_model(model):
+        parent_model = model._meta.get_field(field_name).related_model
+        counts = Counter(getattr(component, field_name) for component in components)
+        counts.pop(None, None)
+        update_counters(parent_model, counter_name, counts, using=using)
+
+
+def _cache_components(components):
+    """
+    Cache the search representations of newly created components, or defer this if deferred indexing is active.
+    """
+    from netbox.search.backends import search_backend
+
+    if (queue := search_queue.get()) is not None:
+        for component in components:
+            search_backend.enqueue(queue, component)
+    else:
+        search_backend.cache(components, remove_existing=False)
+
+
+def _record_changes(model, components):
+    """
+    Record the creation of components in the changelog and enqueue their events, as the post_save signal handler
+    would for each component.
+    """
+    request = current_request.get()
+    if request is None:
+        return
+
+    # Prefetch related objects to minimize the queries needed to serialize each component
+    prefetch_related_objects(components, *get_prefetchable_fields(model))
+
+    buffer = changelog_buffer.get()
+    queue = events_queue.get()
+    for component in components:
+        objectchange = component.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+        if objectchange and objectchange.has_changes:
+            objectchange.user = request.user
+            objectchange.request_id = request.id
+            if buffer is not None:
+                buffer.add(objectchange)
+            else:
+                objectchange.save()
+        enqueue_event(queue, component, request, OBJECT_CREATED)
+    events_queue.set(queue)
+
+    model_inserts.labels(model._meta.model_name).inc(len(components))
@@ -13,6 +13,7 @@ from netbox.search.backends import search_backend
 from virtualization.models import Cluster, VMInterface
 from wireless.models import WirelessLAN
 
+from .elevations import invalidate_rack_elevations
 from .models import (
     Cable,
     CablePath,
@@ -21,10 +22,13 @@ from .models import (
     ConsoleServerPort,
     Device,
     DeviceBay,
+    DeviceRole,
+    DeviceType,
     FrontPort,
     Interface,
     InventoryItem,
     Location,
+    Manufacturer,
     ModuleBay,
     PathEndpoint,
     PortMapping,
@@ -32,13 +36,14 @@ from .models import (
     PowerPanel,
     PowerPort,
     Rack,
+    RackReservation,
     RearPort,
     Site,
     VirtualChassis,
 )
 from .models.cables import trace_paths
 from .search import DeviceIndex
-from .utils import create_cablepaths, rebuild_paths
+from .utils import create_cablepaths, rebuild_paths, retrace_cablepaths
 
 COMPONENT_MODELS = (
     ConsolePort,
@@ -206,10 +211,45 @@ def handle_device_site_change(instance, created, using=None, **kwargs):
             )
 
 
+#
+# Rack elevations
+#
+
+@receiver((post_save, post_delete), sender=Rack)
+def invalidate_rack_elevation(instance, **kwargs):
+    """
+    Invalidate the cached elevations of a Rack when it is saved or deleted.
+    """
+    invalidate_rack_elevations([instance.pk])
+
+
+@receiver((post_save, post_delete), sender=Device)
+@receiver((post_save, post_delete), sender=RackReservation)
+def invalidate_rack_elevation_contents(instance, **kwargs):
+    """
+    Invalidate the cached elevations of the Rack to which a Device or RackReservation is (or was) assigned.
+    """
+    rack_ids = {instance.rack_id}
+    if prechange_data := getattr(instance, '_prechange_snapshot', None):
+        rack_ids.add(prechange_data.get('rack'))
+    invalidate_rack_elevations(rack_ids)
+
+
+@receiver((post_save, post_delete), sender=DeviceRole)
+@receiver((post_save, post_delete), sender=DeviceType)
+@receiver((post_save, post_delete), sender=Manufacturer)
+def invalidate_all_rack_elevations(**kwargs):
+    """
+    Invalidate all cached rack elevations when an object depicted within them is modified.
+    """
+    invalidate_rack_elevations()
+
+
 #
 # Virtual chassis
 #
 
+
 @receiver(post_save, sender=VirtualChassis)
 def assign_virtualchassis_master(instance, created, **kwargs):
     """
@@ -286,8 +326,7 @@ def retrace_cable_paths(instance, **kwargs):
     """
     When a Cable is deleted, check for and update its connected endpoints
     """
-    for cablepath in CablePath.objects.filter(_nodes__contains=instance):
-        cablepath.retrace()
+    retrace_cablepaths(CablePath.objects.filter(_nodes__contains=instance), regroup=False)
 
 
 @receiver((post_delete, post_save), sender=PortMapping)
@@ -295,10 +334,12 @@ def update_passthrough_port_paths(instance, **kwargs):
     """
     When a PortMapping is created or deleted, retrace any CablePaths which traverse its front and/or rear ports.
     """
-    for cablepath in CablePath.objects.filter(
-        Q(_nodes__contains=instance.front_port) | Q(_nodes__contains=instance.rear_port)
-    ):
-        cablepath.retrace()
+    retrace_cablepaths(
+        CablePath.objects.filter(
+            Q(_nodes__contains=instance.front_port) | Q(_nodes__contains=instance.rear_port)
+        ),
+        regroup=False
+    )
 
 
 @receiver(post_delete, sender=CableTermination)
@@ -112,7 +112,7 @@ class RackElevationSVG:
         permitted_devices = self.rack.devices
         if user is not None:
             permitted_devices = permitted_devices.restrict(user, 'view')
-        self.permitted_device_ids = permitted_devices.values_list('pk', flat=True)
+        self.permitted_device_ids = set(permitted_devices.values_list('pk', flat=True))
 
         # Determine device(s) to highlight within the elevation (if any)
         self.highlight_devices = []
@@ -3,6 +3,7 @@ from django.utils.translation import gettext_lazy as _
 from django_tables2.utils import Accessor
 
 from dcim.models import Rack, RackGroup, RackReservation, RackRole, RackType
+from dcim.occupancy import RackOccupancy
 from netbox.tables import OrganizationalModelTable, PrimaryModelTable, columns
 from tenancy.tables import ContactsColumnMixin, TenancyColumnsMixin
 
@@ -211,6 +212,16 @@ class RackTable(TenancyColumnsMixin, ContactsColumnMixin, PrimaryModelTable):
             'u_height', 'device_count', 'get_utilization',
         )
 
+    def configure(self, request):
+        super().configure(request)
+
+        # Calculate space utilization for the current page of racks in bulk
+        if self.columns['get_utilization'].visible:
+            if page := getattr(self, 'page', None):
+                racks = [row.record for row in page.object_list]
+                for occupancy in RackOccupancy.for_racks(racks).values():
+                    occupancy.rack._cached_utilization = occupancy.get_utilization()
+
 
 class RackReservationTable(TenancyColumnsMixin, PrimaryModelTable):
     reservation = tables.Column(
@@ -1,15 +1,17 @@
 import json
 
 from django.conf import settings
-from django.test import tag
+from django.test import override_settings, tag
 from django.urls import reverse
 from django.utils.translation import gettext as _
 from rest_framework import status
 
-from core.models import ObjectType
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
 from dcim.choices import *
 from dcim.constants import *
 from dcim.models import *
+from extras.configcontexts import invalidate_config_contexts
 from extras.models import ConfigTemplate, Tag
 from ipam.choices import VLANQinQRoleChoices
 from ipam.models import ASN, RIR, VLAN, VRF, IPAddress
@@ -825,6 +827,65 @@ class RackTestCase(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_200_OK)
         self.assertEqual(response.get('Content-Type'), 'image/svg+xml')
 
+    @override_settings(RACK_ELEVATION_CACHE_TIMEOUT=60)
+    def test_get_rack_elevation_svg_etag(self):
+        """
+        Revalidate a rack elevation in SVG format using its ETag.
+        """
+        rack = Rack.objects.first()
+        self.add_permissions('dcim.view_rack', 'dcim.view_device')
+        url = '{}?render=svg'.format(reverse('dcim-api:rack-elevation', kwargs={'pk': rack.pk}))
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        etag = response.get('ETag')
+        self.assertIsNotNone(etag)
+
+        # An unchanged elevation is not returned
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertHttpStatus(response, status.HTTP_304_NOT_MODIFIED)
+
+        # Installing a device changes the elevation
+        create_test_device(name='Device A', site=rack.site, rack=rack, position=1, face=DeviceFaceChoices.FACE_FRONT)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotEqual(response.get('ETag'), etag)
+        self.assertIn('Device A', response.content.decode())
+
+    def test_get_rack_available_space(self):
+        """
+        GET the space available within multiple racks.
+        """
+        rack = Rack.objects.get(name='Rack 1')
+        self.add_permissions('dcim.view_rack')
+        url = reverse('dcim-api:rack-available-space')
+        create_test_device(
+            name='Device A',
+            site=rack.site,
+            rack=rack,
+            position=40,
+            face=DeviceFaceChoices.FACE_FRONT,
+        )
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        results = {result['rack']['id']: result for result in response.data['results']}
+        self.assertIn('39.0', results[rack.pk]['available_units'])
+        self.assertNotIn('40.0', results[rack.pk]['available_units'])
+        self.assertEqual(results[rack.pk]['max_contiguous_units'], '39.0')
+
+        # Racks lacking the requested space are omitted
+        response = self.client.get(f'{url}?available_units=42', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertNotIn(rack.pk, [result['rack']['id'] for result in response.data['results']])
+
+        # Full-depth devices occupy both faces
+        response = self.client.get(f'{url}?available_units=42&available_units_face=rear', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+
 
 class RackReservationTestCase(APIViewTestCases.APIViewTestCase):
     model = RackReservation
@@ -1893,6 +1954,79 @@ class DeviceTestCase(APIViewTestCases.APIViewTestCase):
 
         self.assertFalse('config_context' in response.data['results'][0])
 
+    def test_config_contexts(self):
+        """
+        Check that rendered config contexts are streamed for all matching devices.
+        """
+        self.add_permissions('dcim.view_device')
+        url = reverse('dcim-api:device-config-contexts') + '?name=Device 1&name=Device 2'
+        response = self.client.get(url, **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        results = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([result['name'] for result in results], ['Device 1', 'Device 2'])
+        self.assertEqual(results[0]['config_context'], {'A': 1})
+        self.assertEqual(results[1]['config_context'], {'B': 2})
+
+    @override_settings(CONFIG_CONTEXT_CACHE_TIMEOUT=60)
+    def test_config_context_cached_in_list_view(self):
+        """
+        Check that cached config context data is included in the devices list.
+        """
+        self.add_permissions('dcim.view_device')
+        # ConfigContexts created by setUpTestData() are never committed, so their invalidation never fires
+        invalidate_config_contexts()
+        url = reverse('dcim-api:device-list') + '?name=Device 1'
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.data['results'][0]['config_context'], {'A': 1})
+
+        # Modifying the device should invalidate its cached context
+        device = Device.objects.get(name='Device 1')
+        device.local_context_data = {'A': 2}
+        with self.captureOnCommitCallbacks(execute=True):
+            device.save()
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.data['results'][0]['config_context'], {'A': 2})
+
+    def test_provision_devices(self):
+        """
+        Check that devices created via the provisioning endpoint are created along with their components.
+        """
+        device_type = DeviceType.objects.get(slug='device-type-2')
+        InterfaceTemplate.objects.bulk_create([
+            InterfaceTemplate(device_type=device_type, name=f'Interface {i}', type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+            for i in range(1, 5)
+        ])
+        self.add_permissions('dcim.add_device')
+        url = reverse('dcim-api:device-provision')
+
+        response = self.client.post(url, self.create_data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual([device['name'] for device in response.data], [d['name'] for d in self.create_data])
+        for device_data in response.data:
+            self.assertEqual(device_data['interface_count'], 4)
+            self.assertEqual(Interface.objects.filter(device_id=device_data['id']).count(), 4)
+
+        # The creation of each interface is recorded in the changelog
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=ObjectType.objects.get_for_model(Interface),
+                action=ObjectChangeActionChoices.ACTION_CREATE
+            ).count(),
+            12
+        )
+
+    def test_provision_devices_without_permission(self):
+        """
+        Check that the provisioning endpoint requires permission to create devices.
+        """
+        url = reverse('dcim-api:device-provision')
+
+        response = self.client.post(url, self.create_data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Device.objects.filter(name='Test Device 4').exists())
+
     def test_unique_name_per_site_constraint(self):
         """
         Check that creating a device with a duplicate name within a site fails.
@@ -1960,6 +2094,32 @@ class DeviceTestCase(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_200_OK)
         self.assertEqual(response.data['content'], f'Config for device {device.name}')
 
+    def test_bulk_render_config(self):
+        configtemplate = ConfigTemplate.objects.create(
+            name='Config Template 1',
+            template_code='Config for device {{ device.name }} ({{ foo }})'
+        )
+        devices = list(Device.objects.order_by('pk')[:2])
+        for device in devices:
+            device.config_template = configtemplate
+            device.save()
+
+        self.add_permissions('dcim.render_config_device', 'dcim.view_device')
+        url = reverse('dcim-api:device-bulk-render-config')
+        response = self.client.post(
+            f'{url}?id={devices[0].pk}&id={devices[1].pk}', {'foo': 'bar'}, format='json', **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        results = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(results, [
+            {
+                'id': device.pk,
+                'name': device.name,
+                'config_template': configtemplate.pk,
+                'content': f'Config for device {device.name} (bar)',
+            } for device in devices
+        ])
+
     def test_render_config_without_permission(self):
         configtemplate = ConfigTemplate.objects.create(
             name='Config Template 1',
@@ -1,8 +1,12 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from circuits.models import *
 from dcim.choices import LinkStatusChoices
 from dcim.models import *
 from dcim.svg import CableTraceSVG
 from dcim.tests.utils import BaseCablePathTestCase
+from dcim.utils import rebuild_paths, retrace_cablepaths
 from utilities.exceptions import AbortRequest
 
 
@@ -2892,6 +2896,80 @@ class LegacyCablePathTestCase(BaseCablePathTestCase):
         interface3.refresh_from_db()
         self.assertPathIsNotSet(interface3)
 
+    def test_304_rebuild_paths_retains_unchanged_paths(self):
+        """
+        [IF1] --C1-- [FP1] [RP1] --C2-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1')
+        frontport1 = FrontPort.objects.create(device=self.device, name='Front Port 1')
+        PortMapping.objects.create(
+            device=self.device, front_port=frontport1, front_port_position=1,
+            rear_port=rearport1, rear_port_position=1,
+        )
+        cable1 = Cable(a_terminations=[interface1], b_terminations=[frontport1])
+        cable1.save()
+        cable2 = Cable(a_terminations=[rearport1], b_terminations=[interface2])
+        cable2.save()
+        path_ids = set(CablePath.objects.values_list('pk', flat=True))
+        self.assertEqual(len(path_ids), 2)
+
+        # Rebuilding paths which have not changed should write nothing
+        with CaptureQueriesContext(connection) as ctx:
+            rebuild_paths([frontport1, rearport1])
+        self.assertFalse([
+            q['sql'] for q in ctx.captured_queries if q['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+        ])
+        self.assertEqual(set(CablePath.objects.values_list('pk', flat=True)), path_ids)
+
+        # Changed paths should be updated in place
+        CablePath.objects.update(is_active=False)
+        rebuild_paths([cable2])
+        self.assertEqual(set(CablePath.objects.values_list('pk', flat=True)), path_ids)
+        path1 = self.assertPathExists(
+            (interface1, cable1, frontport1, rearport1, cable2, interface2),
+            is_complete=True,
+            is_active=True
+        )
+        interface1.refresh_from_db()
+        self.assertPathIsSet(interface1, path1)
+
+    def test_305_retrace_queries_do_not_grow_with_path_length(self):
+        """
+        [IF1] --C1-- [FP1] [RP1] --C2-- [IF2]
+        [IF3] --C3-- [FP2] [RP2] --C4-- [FP3] [RP3] --C5-- [FP4] [RP4] --C6-- [IF4]
+        """
+        def create_paths(name, hops):
+            terminations = [Interface.objects.create(device=self.device, name=f'{name} Interface 1')]
+            for i in range(1, hops + 1):
+                frontport = FrontPort.objects.create(device=self.device, name=f'{name} Front Port {i}')
+                rearport = RearPort.objects.create(device=self.device, name=f'{name} Rear Port {i}')
+                PortMapping.objects.create(
+                    device=self.device, front_port=frontport, front_port_position=1,
+                    rear_port=rearport, rear_port_position=1,
+                )
+                terminations.extend((frontport, rearport))
+            terminations.append(Interface.objects.create(device=self.device, name=f'{name} Interface 2'))
+            for a_termination, b_termination in zip(terminations[::2], terminations[1::2]):
+                Cable(a_terminations=[a_termination], b_terminations=[b_termination]).save()
+            return CablePath.objects.filter(_nodes__contains=terminations[0])
+
+        short_paths = create_paths('Short', 1)
+        long_paths = create_paths('Long', 3)
+        self.assertEqual(short_paths.count(), 2)
+        self.assertEqual(long_paths.count(), 2)
+
+        # Retracing a path should require the same number of queries regardless of its length
+        query_counts = []
+        for cable_paths in (short_paths, long_paths):
+            cable_paths.update(is_active=False)
+            with CaptureQueriesContext(connection) as ctx:
+                retrace_cablepaths(cable_paths)
+            query_counts.append(len(ctx.captured_queries))
+            self.assertFalse(cable_paths.filter(is_active=False).exists())
+        self.assertEqual(query_counts[0], query_counts[1])
+
     def test_401_exclude_midspan_devices(self):
         """
         [IF1] --C1-- [FP1][Test Device][RP1] --C2-- [RP2][Test Device][FP2] --C3-- [IF2]
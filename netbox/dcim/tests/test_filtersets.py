@@ -1124,6 +1124,31 @@ class RackTestCase(TestCase, ChangeLoggedFilterSetTests):
         params = {'rack_type': [rack_types[0].slug, rack_types[1].slug]}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
 
+    def test_available_units(self):
+        rack = Rack.objects.get(name='Rack 1')
+        device_type = DeviceType.objects.create(
+            manufacturer=Manufacturer.objects.first(),
+            model='Device Type 1',
+            slug='device-type-1',
+            u_height=40,
+            is_full_depth=False
+        )
+        Device.objects.create(
+            name='Device 1',
+            device_type=device_type,
+            role=DeviceRole.objects.create(name='Device Role 1', slug='device-role-1'),
+            site=rack.site,
+            rack=rack,
+            position=1,
+            face=DeviceFaceChoices.FACE_FRONT
+        )
+        params = {'available_units': 3}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 4)
+        params = {'available_units': 3, 'available_units_face': DeviceFaceChoices.FACE_REAR}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 5)
+        params = {'available_units': 3, 'name': ['Rack 1', 'Rack 2']}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
     def test_airflow(self):
         params = {'airflow': RackAirflowChoices.FRONT_TO_REAR}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
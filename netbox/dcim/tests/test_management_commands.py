@@ -6,8 +6,12 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase, override_settings
 
+from dcim.models import Cable, CablePath, Interface, Rack, Site
+from utilities.testing import create_test_device
+
 
 class BuildSchemaTestCase(TestCase):
     def test_output_is_valid_json(self):
@@ -33,6 +37,46 @@ class BuildSchemaTestCase(TestCase):
             self.assertIn(str(output_file), out.getvalue())
 
 
+class PrerenderRackElevationsTestCase(TestCase):
+    @override_settings(RACK_ELEVATION_CACHE_TIMEOUT=0)
+    def test_requires_caching_enabled(self):
+        with self.assertRaisesMessage(CommandError, 'RACK_ELEVATION_CACHE_TIMEOUT'):
+            call_command('prerender_rack_elevations', base_url='https://netbox.example.com/', stdout=StringIO())
+
+    @override_settings(RACK_ELEVATION_CACHE_TIMEOUT=60)
+    def test_renders_both_faces_of_selected_racks(self):
+        sites = (
+            Site.objects.create(name='Site 1', slug='site-1'),
+            Site.objects.create(name='Site 2', slug='site-2'),
+        )
+        Rack.objects.create(name='Rack 1', site=sites[0])
+        Rack.objects.create(name='Rack 2', site=sites[0])
+        Rack.objects.create(name='Rack 3', site=sites[1])
+        out = StringIO()
+
+        with patch('dcim.management.commands.prerender_rack_elevations.render_elevation_svg') as render:
+            call_command(
+                'prerender_rack_elevations', sites=['site-1'], base_url='https://netbox.example.com/', stdout=out
+            )
+
+        self.assertEqual(render.call_count, 4)
+        self.assertTrue(all(
+            elevation.base_url == 'https://netbox.example.com' for elevation, face in (
+                call.args for call in render.call_args_list
+            )
+        ))
+        self.assertEqual(
+            {elevation.rack.name for elevation, face in (call.args for call in render.call_args_list)},
+            {'Rack 1', 'Rack 2'}
+        )
+        self.assertIn('Rendered elevations for 2 racks', out.getvalue())
+
+    @override_settings(RACK_ELEVATION_CACHE_TIMEOUT=60)
+    def test_requires_base_url(self):
+        with self.assertRaisesMessage(CommandError, '--base-url'):
+            call_command('prerender_rack_elevations', stdout=StringIO())
+
+
 class TracePathsTestCase(TestCase):
     def test_no_cables(self):
         out = StringIO()
@@ -148,3 +192,32 @@ class TracePathsTestCase(TestCase):
         self.assertIn('Deleting 2 existing cable paths', out.getvalue())
         self.assertIn('Deleted 2 paths', out.getvalue())
         self.assertIn('Finished.', out.getvalue())
+
+    def test_diff_only_and_force_are_mutually_exclusive(self):
+        with self.assertRaises(CommandError):
+            call_command('trace_paths', force=True, diff_only=True, no_input=True, stdout=StringIO())
+
+    def test_diff_only_reports_missing_and_stale_paths(self):
+        device = create_test_device('Device 1')
+        interfaces = [
+            Interface.objects.create(device=device, name=f'Interface {i}') for i in range(1, 5)
+        ]
+        Cable(a_terminations=[interfaces[0]], b_terminations=[interfaces[1]]).save()
+        Cable(a_terminations=[interfaces[2]], b_terminations=[interfaces[3]]).save()
+        self.assertEqual(CablePath.objects.count(), 4)
+
+        # Delete one path and mark another as stale
+        CablePath.objects.filter(_nodes__contains=interfaces[0]).first().delete()
+        CablePath.objects.filter(_nodes__contains=interfaces[2]).update(is_active=False)
+
+        for shard_by in ('device', 'site'):
+            out = StringIO()
+            call_command('trace_paths', diff_only=True, shard_by=shard_by, no_input=True, stdout=out)
+
+            self.assertIn('Checked 4 interfaces: 1 missing and 2 stale paths', out.getvalue())
+            self.assertIn('paths/s', out.getvalue())
+            self.assertIn('Finished.', out.getvalue())
+
+        # No changes should have been written
+        self.assertEqual(CablePath.objects.count(), 3)
+        self.assertEqual(CablePath.objects.filter(is_active=False).count(), 2)
@@ -10,6 +10,7 @@ from circuits.models import *
 from core.models import ObjectType
 from dcim.choices import *
 from dcim.models import *
+from dcim.provisioning import provision_devices
 from extras.events import serialize_for_event
 from extras.models import CustomField
 from ipam.models import Prefix
@@ -670,6 +671,87 @@ class DeviceTestCase(TestCase):
         )
         self.assertEqual(inventoryitem.cf['cf1'], 'foo')
 
+    def test_provision_devices(self):
+        """
+        Check that the components instantiated for devices provisioned in bulk match those instantiated for a device
+        created individually.
+        """
+        site = Site.objects.first()
+        device_type = DeviceType.objects.first()
+        role = DeviceRole.objects.first()
+        interface_template = InterfaceTemplate.objects.get(device_type=device_type, name='Interface 1')
+        InterfaceTemplate(
+            device_type=device_type,
+            name='Interface 2',
+            type=InterfaceTypeChoices.TYPE_BRIDGE,
+            bridge=interface_template
+        ).save()
+        InventoryItemTemplate(
+            device_type=device_type,
+            parent=InventoryItemTemplate.objects.get(device_type=device_type, name='Inventory Item 1'),
+            name='Inventory Item 2',
+            component=interface_template
+        ).save()
+
+        device = Device(site=site, device_type=device_type, role=role, name='Test Device 1')
+        device.save()
+        provision_devices([
+            Device(site=site, device_type=device_type, role=role, name='Test Device 2'),
+            Device(site=site, device_type=device_type, role=role, name='Test Device 3'),
+        ])
+
+        component_models = (
+            ConsolePort, ConsoleServerPort, PowerPort, PowerOutlet, Interface, RearPort, FrontPort, ModuleBay,
+            DeviceBay, InventoryItem,
+        )
+        expected = {
+            model: sorted(model.objects.filter(device=device).values_list('name', flat=True))
+            for model in component_models
+        }
+        counts = Device.objects.filter(pk=device.pk).values(
+            'console_port_count', 'console_server_port_count', 'power_port_count', 'power_outlet_count',
+            'interface_count', 'front_port_count', 'rear_port_count', 'device_bay_count', 'module_bay_count',
+            'inventory_item_count'
+        ).get()
+
+        for device in Device.objects.filter(name__in=['Test Device 2', 'Test Device 3']):
+            for model in component_models:
+                self.assertEqual(
+                    sorted(model.objects.filter(device=device).values_list('name', flat=True)),
+                    expected[model]
+                )
+                for component in model.objects.filter(device=device):
+                    self.assertEqual(component.cf['cf1'], 'foo')
+                    self.assertEqual(component._site, site)
+
+            self.assertEqual(Device.objects.filter(pk=device.pk).values(*counts.keys()).get(), counts)
+
+            powerport = PowerPort.objects.get(device=device)
+            self.assertEqual(PowerOutlet.objects.get(device=device).power_port, powerport)
+            interface1 = Interface.objects.get(device=device, name='Interface 1')
+            self.assertEqual(Interface.objects.get(device=device, name='Interface 2').bridge, interface1)
+            self.assertTrue(PortMapping.objects.filter(
+                device=device,
+                front_port__name='Front Port 1',
+                rear_port__name='Rear Port 1',
+                rear_port_position=2
+            ).exists())
+
+            # Each module bay and inventory item tree is laid out as if its nodes had been saved individually
+            module_bay = ModuleBay.objects.get(device=device)
+            self.assertEqual((module_bay.lft, module_bay.rght, module_bay.level), (1, 2, 0))
+            item1 = InventoryItem.objects.get(device=device, name='Inventory Item 1')
+            item2 = InventoryItem.objects.get(device=device, name='Inventory Item 2')
+            self.assertEqual((item1.lft, item1.rght, item1.level), (1, 4, 0))
+            self.assertEqual((item2.lft, item2.rght, item2.level, item2.tree_id), (2, 3, 1, item1.tree_id))
+            self.assertEqual(item2.parent, item1)
+            self.assertEqual(item2.component, interface1)
+            self.assertEqual(list(item1.get_descendants()), [item2])
+
+        # Each tree is assigned a distinct ID
+        self.assertEqual(len(set(ModuleBay.objects.values_list('tree_id', flat=True))), 3)
+        self.assertEqual(len(set(InventoryItem.objects.values_list('tree_id', flat=True))), 3)
+
     def test_multiple_unnamed_devices(self):
 
         device1 = Device(
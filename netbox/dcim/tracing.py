@@ -0,0 +1,272 @@
+import itertools
+from collections import defaultdict
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+
+from dcim.utils import decompile_path_node
+
+__all__ = (
+    'CableGraph',
+)
+
+
+class CableGraph:
+    """
+    An in-memory view of the cabling objects traversed when tracing cable paths: cabled objects (along with their
+    cables and parent devices), CableTerminations, and PortMappings. CablePath.from_origin() consults the graph for
+    each hop rather than querying the database directly.
+
+    Objects are retrieved from the database as they are first needed, and cached thereafter. Use preload() to retrieve
+    everything traversed by a set of existing CablePaths using a fixed number of queries, so that retracing them
+    requires no further queries unless the topology has been extended beyond the objects they traverse.
+    """
+    def __init__(self):
+        # Cabled objects, by content type ID & PK (None where an object does not exist)
+        self.objects = defaultdict(dict)
+        # All CableTerminations of each cable, by cable ID
+        self.cable_terminations = {}
+        # CableTerminations by termination type & ID (None where an object has no CableTermination)
+        self.terminations = {}
+        # The PortMappings of each front and rear port, by port ID
+        self.port_mappings = {
+            'front_port': {},
+            'rear_port': {},
+        }
+
+    @staticmethod
+    def _get_type_id(model):
+        return ContentType.objects.get_for_model(model).pk
+
+    #
+    # Retrieval
+    #
+
+    def preload(self, cable_paths):
+        """
+        Retrieve all objects traversed by the given CablePaths: their cabled objects, the CableTerminations of their
+        cables and of any cables now attached to their cabled objects, and the PortMappings of their front and rear
+        ports.
+        """
+        CableTermination = apps.get_model('dcim', 'CableTermination')
+        PortMapping = apps.get_model('dcim', 'PortMapping')
+        Cable = apps.get_model('dcim', 'Cable')
+        cable_type_id = self._get_type_id(Cable)
+        front_port_type_id = self._get_type_id(apps.get_model('dcim', 'FrontPort'))
+        rear_port_type_id = self._get_type_id(apps.get_model('dcim', 'RearPort'))
+
+        object_ids = defaultdict(set)
+        for cp in cable_paths:
+            for node in itertools.chain(*cp.path):
+                type_id, object_id = decompile_path_node(node)
+                object_ids[type_id].add(object_id)
+        cable_ids = object_ids.pop(cable_type_id, set())
+
+        # Retrieve the terminations of all cables within the paths, or attached to any object within them
+        query = Q(cable_id__in=cable_ids) if cable_ids else Q()
+        for type_id, pks in object_ids.items():
+            query |= Q(termination_type_id=type_id, termination_id__in=pks)
+        if query:
+            self._load_cable_terminations(CableTermination.objects.filter(
+                cable_id__in=CableTermination.objects.filter(query).values('cable_id')
+            ), cable_ids)
+        for type_id, pks in object_ids.items():
+            for pk in pks:
+                self.terminations.setdefault((type_id, pk), None)
+        for terminations in self.cable_terminations.values():
+            for ct in terminations:
+                object_ids[ct.termination_type_id].add(ct.termination_id)
+
+        # Retrieve the mappings of all front and rear ports
+        front_port_ids = object_ids[front_port_type_id]
+        rear_port_ids = object_ids[rear_port_type_id]
+        if front_port_ids or rear_port_ids:
+            self._load_port_mappings(
+                PortMapping.objects.filter(Q(front_port_id__in=front_port_ids) | Q(rear_port_id__in=rear_port_ids)),
+                front_port=front_port_ids,
+                rear_port=rear_port_ids
+            )
+            for port_mappings in self.port_mappings['front_port'].values():
+                object_ids[rear_port_type_id].update(mapping.rear_port_id for mapping in port_mappings)
+            for port_mappings in self.port_mappings['rear_port'].values():
+                object_ids[front_port_type_id].update(mapping.front_port_id for mapping in port_mappings)
+
+        # Retrieve all cabled objects
+        for type_id, pks in object_ids.items():
+            self.get_objects(type_id, pks)
+
+    def get_objects(self, type_id, pks):
+        """
+        Return a dictionary mapping each of the given PKs to its object of the given content type, along with its
+        cable and parent device (if any). Objects which do not exist are omitted.
+        """
+        objects = self.objects[type_id]
+        if missing := [pk for pk in pks if pk not in objects]:
+            if model := ContentType.objects.get_for_id(type_id).model_class():
+                fields = {field.name for field in model._meta.concrete_fields}
+                queryset = model._base_manager.filter(pk__in=missing)
+                if related_fields := [name for name in ('cable', 'device') if name in fields]:
+                    queryset = queryset.select_related(*related_fields)
+                for obj in queryset:
+                    objects[obj.pk] = obj
+            for pk in missing:
+                objects.setdefault(pk, None)
+        return {pk: objects[pk] for pk in pks if objects[pk] is not None}
+
+    def _load_cable_terminations(self, queryset, cable_ids=()):
+        """
+        Record the CableTerminations in the given QuerySet, which must include all terminations of each cable.
+        Cables whose terminations have already been recorded are ignored.
+        """
+        loaded_cable_ids = set(self.cable_terminations)
+        for cable_id in cable_ids:
+            self.cable_terminations.setdefault(cable_id, [])
+        for ct in queryset:
+            if ct.cable_id in loaded_cable_ids:
+                continue
+            self.cable_terminations.setdefault(ct.cable_id, []).append(ct)
+            self.terminations[(ct.termination_type_id, ct.termination_id)] = ct
+
+    def get_cable_terminations(self, cable_ids):
+        """
+        Ensure that the CableTerminations of each of the given cables have been retrieved.
+        """
+        CableTermination = apps.get_model('dcim', 'CableTermination')
+
+        if missing := {pk for pk in cable_ids if pk not in self.cable_terminations}:
+            self._load_cable_terminations(CableTermination.objects.filter(cable_id__in=missing), missing)
+
+    def _load_port_mappings(self, queryset, **port_ids):
+        """
+        Record the PortMappings in the given QuerySet, which must include all mappings of each of the front_port and
+        rear_port IDs given.
+        """
+        for field_name, pks in port_ids.items():
+            for pk in pks:
+                self.port_mappings[field_name].setdefault(pk, [])
+        for mapping in queryset:
+            for field_name, pks in port_ids.items():
+                if (port_id := getattr(mapping, f'{field_name}_id')) in pks:
+                    self.port_mappings[field_name][port_id].append(mapping)
+
+    #
+    # Traversal
+    #
+
+    def get_far_end_terminations(self, terminations):
+        """
+        Return the objects terminating the opposite ends of the cables attached to the given terminations (all of the
+        same type), or None if none of them has a CableTermination.
+        """
+        CableTermination = apps.get_model('dcim', 'CableTermination')
+
+        type_id = self._get_type_id(terminations[0])
+        if missing := [t.pk for t in terminations if (type_id, t.pk) not in self.terminations]:
+            self._load_cable_terminations(CableTermination.objects.filter(
+                cable_id__in=CableTermination.objects.filter(
+                    termination_type_id=type_id,
+                    termination_id__in=missing
+                ).values('cable_id')
+            ))
+            for pk in missing:
+                self.terminations.setdefault((type_id, pk), None)
+
+        local_cable_terminations = [
+            ct for t in terminations if (ct := self.terminations[(type_id, t.pk)]) is not None
+        ]
+        if not local_cable_terminations:
+            return None
+
+        # Order the far-end CableTerminations as CableTermination.Meta.ordering does (with null connectors last)
+        remote_cable_terminations = {}
+        for lct in local_cable_terminations:
+            cable_end = 'A' if lct.cable_end == 'B' else 'B'
+            for ct in self.cable_terminations[lct.cable_id]:
+                if ct.cable_end == cable_end:
+                    remote_cable_terminations[ct.pk] = ct
+        remote_cable_terminations = sorted(
+            remote_cable_terminations.values(),
+            key=lambda ct: (ct.cable_id, ct.cable_end, ct.connector is None, ct.connector or 0, ct.pk)
+        )
+
+        return self._get_terminating_objects(remote_cable_terminations)
+
+    def get_peer_terminations(self, cable_profile, term_position_pairs):
+        """
+        Resolve (termination, position) pairs to their peer terminations across profiled cables, as
+        BaseCableProfile.get_peer_terminations() does.
+        """
+        lookup_keys = [
+            cable_profile._get_peer_lookup_key(termination, position)
+            for termination, position in term_position_pairs
+        ]
+        self.get_cable_terminations({key.cable_id for key in lookup_keys})
+
+        peer_cable_terminations = []
+        for key in lookup_keys:
+            peer_cable_terminations.append(next((
+                ct for ct in self.cable_terminations[key.cable_id]
+                if ct.cable_end == key.cable_end and ct.connector == key.connector and
+                key.position in (ct.positions or [])
+            ), None))
+        peers = iter(self._get_terminating_objects([ct for ct in peer_cable_terminations if ct is not None]))
+
+        results = []
+        for key, ct in zip(lookup_keys, peer_cable_terminations):
+            termination = next(peers) if ct is not None else None
+            results.append((termination, key.position if termination is not None else None))
+        return results
+
+    def get_port_mappings(self, ports, positions=None):
+        """
+        Return the PortMappings of the given front or rear ports (optionally limited to the given positions on those
+        ports), with their mapped ports.
+        """
+        FrontPort = apps.get_model('dcim', 'FrontPort')
+        PortMapping = apps.get_model('dcim', 'PortMapping')
+
+        if isinstance(ports[0], FrontPort):
+            field_name, mapped_field_name = 'front_port', 'rear_port'
+        else:
+            field_name, mapped_field_name = 'rear_port', 'front_port'
+        mapped_model = PortMapping._meta.get_field(mapped_field_name).related_model
+        mapped_type_id = self._get_type_id(mapped_model)
+        if missing := [port.pk for port in ports if port.pk not in self.port_mappings[field_name]]:
+            # Retrieve the mapped ports (along with their cables and devices) at the same time
+            queryset = PortMapping.objects.filter(**{f'{field_name}_id__in': missing}).select_related(
+                f'{mapped_field_name}__cable', f'{mapped_field_name}__device'
+            )
+            self._load_port_mappings(queryset, **{field_name: set(missing)})
+            for pk in missing:
+                for mapping in self.port_mappings[field_name][pk]:
+                    mapped_port = getattr(mapping, mapped_field_name)
+                    self.objects[mapped_type_id].setdefault(mapped_port.pk, mapped_port)
+
+        port_mappings = {
+            mapping.pk: mapping
+            for port in ports for mapping in self.port_mappings[field_name][port.pk]
+            if positions is None or getattr(mapping, f'{field_name}_position') in positions
+        }
+        port_mappings = [port_mappings[pk] for pk in sorted(port_mappings)]
+
+        mapped_ports = self.get_objects(
+            mapped_type_id, {getattr(mapping, f'{mapped_field_name}_id') for mapping in port_mappings}
+        )
+        port_mappings = [
+            mapping for mapping in port_mappings if getattr(mapping, f'{mapped_field_name}_id') in mapped_ports
+        ]
+        for mapping in port_mappings:
+            setattr(mapping, mapped_field_name, mapped_ports[getattr(mapping, f'{mapped_field_name}_id')])
+
+        return port_mappings
+
+    def _get_terminating_objects(self, cable_terminations):
+        """
+        Return the object terminating each of the given CableTerminations (None for any which no longer exist).
+        """
+        pks = defaultdict(set)
+        for ct in cable_terminations:
+            pks[ct.termination_type_id].add(ct.termination_id)
+        objects = {type_id: self.get_objects(type_id, type_pks) for type_id, type_pks in pks.items()}
+        return [objects[ct.termination_type_id].get(ct.termination_id) for ct in cable_terminations]
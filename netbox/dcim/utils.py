@@ -1,12 +1,20 @@
+import itertools
+import logging
 from collections import defaultdict
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.db import router, transaction
+from django.db.models import Case, Value, When
 from django.utils.translation import gettext as _
 
 from dcim.constants import MODULE_TOKEN
 
+# The number of originating objects updated per UPDATE when recording new cable paths
+PATH_ORIGINS_BATCH_SIZE = 1000
+
+logger = logging.getLogger('netbox.dcim.cable')
+
 
 def get_module_bay_positions(module_bay):
     """
@@ -104,19 +112,149 @@ def create_cablepaths(objects):
             cp.save()
 
 
+def get_path_origins(cable_paths, graph=None):
+    """
+    Return a dictionary mapping the PK of each of the given CablePaths to its list of originating objects. Origins are
+    retrieved (along with their attached cables) using a single query per object type, unless they are already present
+    in the given CableGraph.
+    """
+    from dcim.tracing import CableGraph
+
+    if graph is None:
+        graph = CableGraph()
+
+    object_ids = defaultdict(set)
+    for cp in cable_paths:
+        for node in cp.path[0] if cp.path else []:
+            ct_id, object_id = decompile_path_node(node)
+            object_ids[ct_id].add(object_id)
+
+    objects = {}
+    for ct_id, pks in object_ids.items():
+        for pk, obj in graph.get_objects(ct_id, pks).items():
+            objects[(ct_id, pk)] = obj
+
+    return {
+        cp.pk: [
+            objects[node] for node in map(decompile_path_node, cp.path[0] if cp.path else []) if node in objects
+        ]
+        for cp in cable_paths
+    }
+
+
+def diff_cablepaths(cable_paths, regroup=True):
+    """
+    Retrace the given CablePaths in memory from their originating objects and compare each against its existing
+    representation. Returns three lists: existing paths which have changed (updated in memory but not saved), existing
+    paths which no longer exist, and new (unsaved) paths which replace them. Unchanged paths are omitted.
+
+    The objects traversed by the paths are retrieved up front (see CableGraph.preload()), so the number of queries
+    does not depend on the number or length of the paths unless they now extend beyond the objects they traverse.
+
+    :param cable_paths: An iterable of CablePaths
+    :param regroup: If True, regroup the origins of each path by cable connector (as in create_cablepaths()), which
+        may replace a path with several new paths
+    """
+    from dcim.models import CablePath
+    from dcim.tracing import CableGraph
+
+    graph = CableGraph()
+    graph.preload(cable_paths)
+    origins = get_path_origins(cable_paths, graph)
+    updated_paths = []
+    deleted_paths = []
+    new_paths = []
+    for cp in cable_paths:
+        if regroup:
+            groups = defaultdict(list)
+            for obj in origins[cp.pk]:
+                groups[obj.cable_connector].append(obj)
+            groups = groups.values()
+        else:
+            groups = [origins[cp.pk]]
+        retraced_paths = [path for objects in groups if (path := CablePath.from_origin(objects, graph))]
+
+        # If the path still originates from the same objects, update it in place (if anything has changed)
+        if len(retraced_paths) == 1 and retraced_paths[0].path[0] == cp.path[0]:
+            retraced = retraced_paths[0]
+            if (retraced.path, retraced.is_active, retraced.is_complete, retraced.is_split) != (
+                cp.path, cp.is_active, cp.is_complete, cp.is_split
+            ):
+                cp.path = retraced.path
+                cp.is_active = retraced.is_active
+                cp.is_complete = retraced.is_complete
+                cp.is_split = retraced.is_split
+                cp._nodes = list(itertools.chain(*cp.path))
+                updated_paths.append(cp)
+        else:
+            deleted_paths.append(cp)
+            new_paths.extend(retraced_paths)
+
+    return updated_paths, deleted_paths, new_paths
+
+
+def retrace_cablepaths(cable_paths, regroup=True):
+    """
+    Retrace the given CablePaths from their originating objects, writing only those paths which have changed.
+
+    Changed paths are updated in place, paths which no longer exist are deleted, and any new paths are created, all
+    in bulk; unchanged paths are left untouched. See diff_cablepaths().
+
+    :param cable_paths: A QuerySet or iterable of CablePaths
+    :param regroup: If True, regroup each path's origins by cable connector before retracing
+    """
+    from dcim.models import CablePath
+
+    with transaction.atomic(using=router.db_for_write(CablePath)):
+        cable_paths = list(cable_paths)
+        updated_paths, deleted_paths, new_paths = diff_cablepaths(cable_paths, regroup=regroup)
+        logger.debug(
+            f"Retraced {len(cable_paths)} cable paths: {len(updated_paths)} updated, {len(deleted_paths)} deleted, "
+            f"{len(new_paths)} created"
+        )
+
+        # References to deleted paths from their origins are cleared by the database (SET_NULL)
+        if deleted_paths:
+            CablePath.objects.filter(pk__in=[cp.pk for cp in deleted_paths]).delete()
+        if updated_paths:
+            CablePath.objects.bulk_update(updated_paths, ('path', 'is_active', 'is_complete', 'is_split', '_nodes'))
+        for cp in new_paths:
+            cp._nodes = list(itertools.chain(*cp.path))
+        update_path_origins(CablePath.objects.bulk_create(new_paths))
+
+
+def update_path_origins(cable_paths):
+    """
+    Record a direct reference to each of the given (saved) CablePaths on its originating objects, as
+    CablePath.update_origins() does for a single path. Origins of each type are updated at once.
+    """
+    from dcim.models import PathEndpoint
+
+    path_ids = defaultdict(dict)
+    for cp in cable_paths:
+        origin_model = cp.origin_type.model_class()
+        if issubclass(origin_model, PathEndpoint):
+            for node in cp.path[0]:
+                path_ids[origin_model][decompile_path_node(node)[1]] = cp.pk
+
+    for origin_model, origin_path_ids in path_ids.items():
+        origin_path_ids = list(origin_path_ids.items())
+        for i in range(0, len(origin_path_ids), PATH_ORIGINS_BATCH_SIZE):
+            batch = origin_path_ids[i:i + PATH_ORIGINS_BATCH_SIZE]
+            origin_model.objects.filter(pk__in=[pk for pk, path_id in batch]).update(
+                _path=Case(*[When(pk=pk, then=Value(path_id)) for pk, path_id in batch])
+            )
+
+
 def rebuild_paths(terminations):
     """
     Rebuild all CablePaths which traverse the specified nodes.
     """
     from dcim.models import CablePath
 
-    for obj in terminations:
-        cable_paths = CablePath.objects.filter(_nodes__contains=obj)
-
-        with transaction.atomic(using=router.db_for_write(CablePath)):
-            for cp in cable_paths:
-                cp.delete()
-                create_cablepaths(cp.origins)
+    nodes = [object_to_path_node(obj) for obj in terminations]
+    if nodes:
+        retrace_cablepaths(CablePath.objects.filter(_nodes__overlap=nodes))
 
 
 def update_interface_bridges(device, interface_templates, module=None):
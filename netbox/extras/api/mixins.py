@@ -1,3 +1,12 @@
+import io
+import json
+import tarfile
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import OpenApiResponse, OpenApiTypes, extend_schema
 from rest_framework.decorators import action
@@ -5,11 +14,12 @@ from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_500_INTERNAL_SERVER_ERROR
 
+from extras.configcontexts import CONFIG_CONTEXT_CHUNK_SIZE, prefetch_config_contexts
 from extras.models import ConfigTemplate
 from netbox.api.authentication import TokenWritePermission
 from netbox.api.renderers import TextRenderer
 
-from .serializers import RenderConfigInputSerializer, RenderedConfigSerializer
+from .serializers import BulkRenderConfigInputSerializer, RenderConfigInputSerializer, RenderedConfigSerializer
 
 __all__ = (
     'ConfigContextQuerySetMixin',
@@ -34,6 +44,10 @@ class ConfigContextQuerySetMixin:
     Provides a get_queryset() method which deals with adding the config context
     data annotation or not.
     """
+    def _include_config_context(self):
+        request = self.get_serializer_context()['request']
+        return not (self.brief or 'config_context' in request.query_params.get('exclude', []))
+
     def get_queryset(self):
         """
         Build the proper queryset based on the request context
@@ -41,14 +55,67 @@ class ConfigContextQuerySetMixin:
         If the `brief` query param equates to True or the `exclude` query param
         includes `config_context` as a value, return the base queryset.
 
+        If CONFIG_CONTEXT_CACHE_TIMEOUT is set, rendered config contexts are instead
+        attached to each page of results (see paginate_queryset()), so return the base
+        queryset.
+
         Else, return the queryset annotated with config context data
         """
         queryset = super().get_queryset()
-        request = self.get_serializer_context()['request']
-        if self.brief or 'config_context' in request.query_params.get('exclude', []):
+        if not self._include_config_context() or settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
             return queryset
         return queryset.annotate_config_context_data()
 
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None and settings.CONFIG_CONTEXT_CACHE_TIMEOUT and self._include_config_context():
+            prefetch_config_contexts(page)
+        return page
+
+    def get_serializer(self, *args, **kwargs):
+        # If the results have not been paginated, attach the rendered config contexts of all objects at once rather
+        # than retrieving each object's context individually
+        if (
+            args and isinstance(args[0], QuerySet) and kwargs.get('many') and
+            settings.CONFIG_CONTEXT_CACHE_TIMEOUT and self._include_config_context()
+        ):
+            objects = list(args[0])
+            prefetch_config_contexts(objects)
+            args = (objects, *args[1:])
+        return super().get_serializer(*args, **kwargs)
+
+    @extend_schema(
+        responses={
+            200: OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description=_(
+                    "Newline-delimited JSON objects, each containing the `id`, `name`, and rendered "
+                    "`config_context` of a matching object."
+                ),
+            ),
+        },
+    )
+    @action(detail=False, methods=['get'], url_path='config-contexts')
+    def config_contexts(self, request):
+        """
+        Stream the rendered config contexts of all matching objects as newline-delimited JSON.
+        """
+        queryset = self.filter_queryset(self.queryset).prefetch_related(None).only('pk', 'name', 'local_context_data')
+
+        def stream():
+            last_pk = 0
+            while chunk := list(queryset.filter(pk__gt=last_pk).order_by('pk')[:CONFIG_CONTEXT_CHUNK_SIZE]):
+                prefetch_config_contexts(chunk)
+                for obj in chunk:
+                    yield json.dumps({
+                        'id': obj.pk,
+                        'name': obj.name,
+                        'config_context': obj.get_config_context(),
+                    }, cls=DjangoJSONEncoder) + '\n'
+                last_pk = chunk[-1].pk
+
+        return StreamingHttpResponse(stream(), content_type='application/x-ndjson')
+
 
 class ConfigTemplateRenderMixin:
     """
@@ -81,7 +148,7 @@ class RenderConfigMixin(ConfigTemplateRenderMixin):
 
     def get_permissions(self):
         # For render_config action, check only token write ability (not model permissions)
-        if self.action == 'render_config':
+        if self.action in ('render_config', 'bulk_render_config'):
             return [TokenWritePermission()]
         return super().get_permissions()
 
@@ -139,3 +206,144 @@ class RenderConfigMixin(ConfigTemplateRenderMixin):
         context_data.update({object_type: instance})
 
         return self.render_configtemplate(request, configtemplate, context_data)
+
+    def _iter_rendered_configs(self, queryset, configtemplate, context):
+        """
+        Render the config template for each object in the queryset, yielding an (object, template, output, error)
+        four-tuple for each. Objects are processed in chunks: config contexts are resolved in bulk for each chunk,
+        and objects sharing a template are rendered together.
+        """
+        object_type = queryset.model._meta.model_name
+        last_pk = 0
+        while chunk := list(queryset.filter(pk__gt=last_pk).order_by('pk')[:CONFIG_CONTEXT_CHUNK_SIZE]):
+            prefetch_config_contexts(chunk)
+
+            # Group objects by their resolved config template
+            templates = {}
+            grouped = defaultdict(list)
+            for obj in chunk:
+                template = configtemplate or obj.get_config_template()
+                if template is None:
+                    yield obj, None, None, _('No config template found for this {object_type}.').format(
+                        object_type=object_type
+                    )
+                    continue
+                templates[template.pk] = template
+                grouped[template.pk].append(obj)
+
+            for template_pk, objects in grouped.items():
+                template = templates[template_pk]
+                contexts = (
+                    {**obj.get_config_context(), **context, object_type: obj} for obj in objects
+                )
+                for obj, (output, error) in zip(objects, template.render_many(contexts)):
+                    if error is not None:
+                        error = template.format_render_error(error)
+                    yield obj, template, output, error
+
+            last_pk = chunk[-1].pk
+
+    @extend_schema(
+        request=BulkRenderConfigInputSerializer,
+        responses={
+            200: OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description=_(
+                    "Newline-delimited JSON objects, each containing the `id`, `name`, and `config_template` of a "
+                    "matching object along with its rendered `content` (or an `error`). If `output` is `tar`, a tar "
+                    "archive containing one file per successfully rendered object is returned instead."
+                ),
+            ),
+            400: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                description=_("The request data is invalid."),
+            ),
+        },
+    )
+    @action(detail=False, methods=['post'], url_path='render-config', url_name='bulk-render-config')
+    def bulk_render_config(self, request):
+        """
+        Render the preferred (or specified) ConfigTemplate for all matching Devices or Virtual Machines, streaming
+        the results.
+        """
+        queryset = self.queryset.model.objects.restrict(request.user, 'render_config').restrict(request.user, 'view')
+        queryset = self.filter_queryset(queryset).select_related(
+            'config_template', 'role__config_template', 'platform__config_template',
+        ).prefetch_related(None)
+
+        serializer = BulkRenderConfigInputSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
+        output_format = serializer.validated_data['output']
+
+        # Check for an optional config_template_id override in the request data
+        configtemplate = None
+        if config_template_id := serializer.validated_data.get('config_template_id'):
+            try:
+                configtemplate = ConfigTemplate.objects.restrict(request.user, 'view').get(pk=config_template_id)
+            except ConfigTemplate.DoesNotExist:
+                return Response({
+                    'error': _('Config template with ID {id} not found.').format(id=config_template_id)
+                }, status=HTTP_400_BAD_REQUEST)
+
+        # Any remaining request data is passed to each template as context
+        context = {k: v for k, v in request.data.items() if k not in ('config_template_id', 'output')}
+        results = self._iter_rendered_configs(queryset, configtemplate, context)
+
+        if output_format == 'tar':
+            response = StreamingHttpResponse(self._stream_tar(results), content_type='application/x-tar')
+            response['Content-Disposition'] = (
+                f'attachment; filename="{self.queryset.model._meta.verbose_name_plural}.tar"'
+            )
+            return response
+
+        def stream():
+            for obj, template, output, error in results:
+                data = {
+                    'id': obj.pk,
+                    'name': obj.name,
+                    'config_template': template.pk if template else None,
+                }
+                if error is None:
+                    data['content'] = output
+                else:
+                    data['error'] = error
+                yield json.dumps(data, cls=DjangoJSONEncoder) + '\n'
+
+        return StreamingHttpResponse(stream(), content_type='application/x-ndjson')
+
+    @staticmethod
+    def _stream_tar(results):
+        """
+        Write each rendered config to a streaming tar archive, yielding the archive content as it is written. Each
+        file is named for its object's primary key and name. Any errors are recorded in a trailing errors.ndjson file.
+        """
+        buffer = io.BytesIO()
+        errors = []
+
+        def flush():
+            data = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return data
+
+        def add_file(archive, name, content):
+            content = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+
+        with tarfile.open(fileobj=buffer, mode='w|') as archive:
+            for obj, template, output, error in results:
+                if error is not None:
+                    errors.append(json.dumps({'id': obj.pk, 'name': obj.name, 'error': error}) + '\n')
+                    continue
+                name = f'{obj.pk}-{obj.name or ""}'.replace('/', '_')
+                if template.file_extension:
+                    name = f'{name}.{template.file_extension}'
+                add_file(archive, name, output)
+                if data := flush():
+                    yield data
+            if errors:
+                add_file(archive, 'errors.ndjson', ''.join(errors))
+        yield flush()
@@ -9,6 +9,7 @@ from netbox.api.serializers.features import TaggableModelSerializer
 from users.api.serializers_.mixins import OwnerMixin
 
 __all__ = (
+    'BulkRenderConfigInputSerializer',
     'ConfigTemplateSerializer',
     'RenderConfigInputSerializer',
     'RenderedConfigSerializer',
@@ -67,6 +68,26 @@ class RenderConfigInputSerializerExtension(OpenApiSerializerExtension):
         return schema
 
 
+class BulkRenderConfigInputSerializer(RenderConfigInputSerializer):
+    """
+    Describes the request body for the device/VM list-level /render-config/ endpoints. Any additional keys
+    supplied are passed through as context variables to each rendered template.
+    """
+    output = serializers.ChoiceField(
+        choices=['ndjson', 'tar'],
+        required=False,
+        default='ndjson',
+        help_text=_(
+            "The format in which rendered configurations are streamed: newline-delimited JSON (default) or a "
+            "tar archive containing one file per object."
+        )
+    )
+
+
+class BulkRenderConfigInputSerializerExtension(RenderConfigInputSerializerExtension):
+    target_class = 'extras.api.serializers_.configtemplates.BulkRenderConfigInputSerializer'
+
+
 class RenderedConfigSerializer(serializers.Serializer):
     """
     Describes the JSON response returned by the /render-config/ and /render/ endpoints.
@@ -0,0 +1,89 @@
+import logging
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+__all__ = (
+    'get_cache_key',
+    'invalidate_config_contexts',
+    'prefetch_config_contexts',
+)
+
+CONFIG_CONTEXT_VERSION_CACHE_KEY = 'config_context_version'
+
+# The number of objects for which config contexts are resolved at once when streaming
+CONFIG_CONTEXT_CHUNK_SIZE = 1000
+
+logger = logging.getLogger('netbox.config_contexts')
+
+
+def get_cache_version():
+    """
+    Return the current version of the rendered config context cache.
+    """
+    cache.add(CONFIG_CONTEXT_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    return cache.get(CONFIG_CONTEXT_VERSION_CACHE_KEY)
+
+
+def get_cache_key(obj, version):
+    """
+    Return the cache key under which the rendered config context for a Device or VirtualMachine is stored.
+    """
+    return f'config_context:{version}:{obj._meta.label_lower}:{obj.pk}'
+
+
+def prefetch_config_contexts(objects):
+    """
+    Attach the rendered config context to each of the given Devices or VirtualMachines (which must all be of the
+    same type). Rendered contexts are retrieved from the cache where possible; any remaining objects have their
+    source ConfigContext data resolved in a single query. Newly rendered contexts are written back to the cache if
+    CONFIG_CONTEXT_CACHE_TIMEOUT is set.
+    """
+    if not objects:
+        return
+    model = type(objects[0])
+    timeout = settings.CONFIG_CONTEXT_CACHE_TIMEOUT
+
+    # Retrieve any cached contexts
+    if timeout:
+        version = get_cache_version()
+        keys = {get_cache_key(obj, version): obj for obj in objects}
+        cached = cache.get_many(keys.keys())
+        for key, data in cached.items():
+            keys[key]._rendered_config_context = data
+        misses = [obj for key, obj in keys.items() if key not in cached]
+    else:
+        misses = list(objects)
+    if not misses:
+        return
+
+    # Resolve the applicable ConfigContext data for all remaining objects at once
+    config_context_data = dict(
+        model.objects.filter(
+            pk__in=[obj.pk for obj in misses]
+        ).annotate_config_context_data().values_list('pk', 'config_context_data')
+    )
+    for obj in misses:
+        obj.config_context_data = config_context_data.get(obj.pk)
+        obj._rendered_config_context = obj.render_config_context()
+
+    if timeout:
+        cache.set_many({
+            get_cache_key(obj, version): obj._rendered_config_context for obj in misses
+        }, timeout)
+        logger.debug(f"Cached {len(misses)} rendered config contexts for {model._meta.verbose_name_plural}")
+
+
+def invalidate_config_contexts(objects=None):
+    """
+    Invalidate the cached config contexts for the given Devices or VirtualMachines. If no objects are specified,
+    the entire cache is invalidated by replacing its version.
+    """
+    if not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+        return
+    if objects is None:
+        cache.set(CONFIG_CONTEXT_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        return
+    version = get_cache_version()
+    cache.delete_many([get_cache_key(obj, version) for obj in objects])
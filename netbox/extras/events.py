@@ -1,7 +1,9 @@
 import logging
+import uuid
 from collections import UserDict, defaultdict
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext as _
@@ -18,10 +20,16 @@ from utilities.rqworker import get_rq_retry
 from utilities.serialization import serialize_object
 
 from .choices import EventRuleActionChoices
+from .conditions import ConditionSet, InvalidCondition
 from .models import EventRule
 
+EVENT_RULES_VERSION_CACHE_KEY = 'event_rules_version'
+
 logger = logging.getLogger('netbox.events_processor')
 
+# The process-wide EventRuleIndex (see get_event_rule_index())
+_event_rule_index = None
+
 
 class EventContext(UserDict):
     """
@@ -165,9 +173,10 @@ def enqueue_event(queue, instance, request, event_type):
         queue[key].freeze_data(instance)
 
 
-def process_event_rules(event_rules, object_type, event):
+def process_event_rules(event_rules, object_type, event, deliveries=None):
     """
-    Process a list of EventRules against an event.
+    Process a list of EventRules against an event. If a list of deliveries is passed, webhook actions are appended
+    to it (for batched delivery) rather than being enqueued individually.
 
     Notes on event sources:
     - Object change events (created/updated/deleted) are enqueued via
@@ -211,10 +220,6 @@ def process_event_rules(event_rules, object_type, event):
         # Webhooks
         if event_rule.action_type == EventRuleActionChoices.WEBHOOK:
 
-            # Select the appropriate RQ queue
-            queue_name = get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT)
-            rq_queue = get_queue(queue_name)
-
             # For job lifecycle events, `username` may be absent because
             # there is no request context.
             # Prefer the associated user object when present, falling
@@ -230,15 +235,20 @@ def process_event_rules(event_rules, object_type, event):
                 'snapshots': event.get('snapshots'),
                 'timestamp': timezone.now().isoformat(),
                 'username': username,
-                'retry': get_rq_retry(),
             }
             if 'request' in event:
                 # Exclude FILES - webhooks don't need uploaded files,
                 # which can cause pickle errors with Pillow.
                 params['request'] = copy_safe_request(event['request'], include_files=False)
 
+            # Defer the delivery for batching
+            if deliveries is not None:
+                deliveries.append(params)
+                continue
+
             # Enqueue the task
-            rq_queue.enqueue('extras.webhooks.send_webhook', **params)
+            queue_name = get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT)
+            get_queue(queue_name).enqueue('extras.webhooks.send_webhook', **params, retry=get_rq_retry())
 
         # Scripts
         elif event_rule.action_type == EventRuleActionChoices.SCRIPT:
@@ -280,33 +290,126 @@ def process_event_rules(event_rules, object_type, event):
             ))
 
 
+class EventRuleIndex:
+    """
+    An in-memory index of all enabled EventRules by object type and event type, along with their compiled
+    conditions. This allows for determining which rules (if any) apply to an event without querying the database.
+    """
+    def __init__(self, version=None):
+        self.version = version
+        self.rule_ids = defaultdict(list)
+        self.condition_sets = {}
+
+        rules = EventRule.objects.filter(enabled=True).values_list('pk', 'event_types', 'conditions')
+        event_types = {}
+        for pk, rule_event_types, conditions in rules:
+            event_types[pk] = rule_event_types
+            # Compile the rule's conditions. Any invalid conditions are left to be reported by eval_conditions().
+            if conditions:
+                try:
+                    self.condition_sets[pk] = ConditionSet(conditions)
+                except (InvalidCondition, ValueError):
+                    pass
+
+        assignments = EventRule.object_types.through.objects.filter(
+            eventrule__enabled=True
+        ).values_list('eventrule_id', 'contenttype_id')
+        for pk, object_type_id in assignments:
+            for event_type in event_types.get(pk, []):
+                self.rule_ids[(object_type_id, event_type)].append(pk)
+
+    def get_rule_ids(self, object_type, event_type):
+        """
+        Return the IDs of all enabled EventRules which apply to the given object type and event type.
+        """
+        if object_type is None:
+            return []
+        return self.rule_ids.get((object_type.pk, event_type), [])
+
+    def get_event_rules(self, rule_ids):
+        """
+        Return a list of the EventRules with the given IDs, with their compiled conditions attached.
+        """
+        event_rules = list(EventRule.objects.filter(pk__in=rule_ids, enabled=True))
+        for event_rule in event_rules:
+            if event_rule.pk in self.condition_sets:
+                event_rule.condition_set = self.condition_sets[event_rule.pk]
+
+        return event_rules
+
+
+def get_event_rule_index():
+    """
+    Return the process-wide EventRuleIndex, rebuilding it if the event rules version stored in the cache has changed
+    since it was built.
+    """
+    global _event_rule_index
+
+    cache.add(EVENT_RULES_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    version = cache.get(EVENT_RULES_VERSION_CACHE_KEY)
+    if _event_rule_index is None or version is None or _event_rule_index.version != version:
+        _event_rule_index = EventRuleIndex(version)
+        logger.debug(f"Rebuilt event rule index (version {version})")
+
+    return _event_rule_index
+
+
+def invalidate_event_rule_index():
+    """
+    Invalidate all cached EventRuleIndexes by incrementing the version stored in the cache.
+    """
+    cache.set(EVENT_RULES_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def get_event_rules(object_type, event_type):
+    """
+    Return a list of all enabled EventRules which apply to the given object type and event type.
+    """
+    index = get_event_rule_index()
+    if rule_ids := index.get_rule_ids(object_type, event_type):
+        return index.get_event_rules(rule_ids)
+    return []
+
+
 def process_event_queue(events):
     """
     Flush a list of object representation to RQ for EventRule processing.
 
     This is the default processor listed in EVENTS_PIPELINE.
     """
-    events_cache = defaultdict(dict)
+    index = get_event_rule_index()
 
+    # Determine which EventRules apply to each event. Events with no applicable rules are skipped entirely (and thus
+    # never serialized).
+    matched_events = []
+    rule_ids = set()
     for event in events:
-        event_type = event['event_type']
-        object_type = event['object_type']
-
-        # Cache applicable Event Rules
-        if object_type not in events_cache[event_type]:
-            events_cache[event_type][object_type] = EventRule.objects.filter(
-                event_types__contains=[event['event_type']],
-                object_types=object_type,
-                enabled=True
-            )
-        event_rules = events_cache[event_type][object_type]
+        if event_rule_ids := index.get_rule_ids(event['object_type'], event['event_type']):
+            matched_events.append((event, event_rule_ids))
+            rule_ids.update(event_rule_ids)
+    if not matched_events:
+        return
+
+    # Retrieve all applicable EventRules in a single query
+    event_rules = index.get_event_rules(rule_ids)
 
+    # If batching is enabled, collect webhook deliveries to be enqueued in chunks
+    batch_size = settings.WEBHOOK_BATCH_SIZE
+    deliveries = [] if batch_size else None
+
+    for event, event_rule_ids in matched_events:
         process_event_rules(
-            event_rules=event_rules,
-            object_type=object_type,
+            event_rules=[event_rule for event_rule in event_rules if event_rule.pk in event_rule_ids],
+            object_type=event['object_type'],
             event=event,
+            deliveries=deliveries,
         )
 
+    if deliveries:
+        rq_queue = get_queue(get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT))
+        for i in range(0, len(deliveries), batch_size):
+            rq_queue.enqueue('extras.webhooks.send_webhooks', deliveries=deliveries[i:i + batch_size])
+
 
 def flush_events(events):
     """
@@ -274,8 +274,23 @@ class WebhookBulkEditForm(OwnerMixin, NetBoxModelBulkEditForm):
         required=False,
         label=_('CA file path')
     )
+    max_concurrency = forms.IntegerField(
+        required=False,
+        min_value=1,
+        label=_('Maximum concurrency')
+    )
+    rate_limit = forms.IntegerField(
+        required=False,
+        min_value=1,
+        label=_('Rate limit')
+    )
+    batch_events = forms.NullBooleanField(
+        required=False,
+        widget=BulkEditNullBooleanSelect(),
+        label=_('Batch events')
+    )
 
-    nullable_fields = ('secret', 'ca_file_path')
+    nullable_fields = ('secret', 'ca_file_path', 'max_concurrency', 'rate_limit')
 
 
 class EventRuleBulkEditForm(OwnerMixin, NetBoxModelBulkEditForm):
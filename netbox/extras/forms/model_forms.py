@@ -538,6 +538,7 @@ class WebhookForm(OwnerMixin, NetBoxModelForm):
             name=_('HTTP Request')
         ),
         FieldSet('ssl_verification', 'ca_file_path', name=_('SSL')),
+        FieldSet('max_concurrency', 'rate_limit', 'batch_events', name=_('Delivery')),
     )
 
     class Meta:
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Annotated
 
 import strawberry
 import strawberry_django
+from django.conf import settings
 from strawberry.types import Info
 
 from extras.models import CustomField, ImageAttachment, JournalEntry
@@ -29,7 +30,10 @@ class ConfigContextMixin:
     def get_queryset(cls, queryset, info: Info, **kwargs):
         queryset = super().get_queryset(queryset, info, **kwargs)
 
-        # If `config_context` is requested, call annotate_config_context_data() on the queryset
+        # If `config_context` is requested, call annotate_config_context_data() on the queryset (unless rendered
+        # contexts are being cached, in which case each is retrieved from the cache on resolution)
+        if settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+            return queryset
         selected = {f.name for f in info.selected_fields[0].selections}
         if 'config_context' in selected and hasattr(queryset, 'annotate_config_context_data'):
             return queryset.annotate_config_context_data()
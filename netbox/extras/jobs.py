@@ -5,6 +5,7 @@ from contextlib import ExitStack
 from django.db import DEFAULT_DB_ALIAS, router, transaction
 from django.utils.translation import gettext as _
 
+from core.changelog import buffered_change_logging
 from core.signals import clear_events
 from dcim.models import Device
 from extras.models import Script as ScriptModel
@@ -53,11 +54,13 @@ class ScriptJob(JobRunner):
                     # if there are any raised exceptions.
                     if changeloged_db != DEFAULT_DB_ALIAS:
                         with transaction.atomic(using=changeloged_db):
-                            script.output = script.run(data, commit)
+                            with buffered_change_logging():
+                                script.output = script.run(data, commit)
                             if not commit:
                                 raise AbortTransaction()
                     else:
-                        script.output = script.run(data, commit)
+                        with buffered_change_logging():
+                            script.output = script.run(data, commit)
                         if not commit:
                             raise AbortTransaction()
             except AbortTransaction:
@@ -1,9 +1,36 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
+from extras.models import CachedValue
 from netbox.registry import registry
-from netbox.search.backends import search_backend
+from netbox.search.backends import CachedValueSearchBackend, search_backend
+
+CHECKPOINT_CACHE_KEY = 'reindex_checkpoint'
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def reindex_chunk(label, lower, upper, remove_existing=False):
+    """
+    Cache all objects of the specified model with a primary key greater than `lower` and less than or equal to `upper`
+    (either of which may be None). The chunk is written within a single transaction, so it is either cached entirely
+    or not at all.
+    """
+    indexer = registry['search'][label]
+    queryset = indexer.model.objects.order_by('pk')
+    if lower is not None:
+        queryset = queryset.filter(pk__gt=lower)
+    if upper is not None:
+        queryset = queryset.filter(pk__lte=upper)
+
+    with transaction.atomic():
+        return search_backend.cache(queryset.iterator(), indexer=indexer, remove_existing=remove_existing)
 
 
 class Command(BaseCommand):
@@ -21,6 +48,28 @@ class Command(BaseCommand):
             action='store_true',
             help="For each model, reindex objects only if no cache entries already exist"
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="Number of worker processes across which to distribute the reindexing of models"
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help=f"Number of objects to index per chunk when reindexing in chunks (default: {DEFAULT_CHUNK_SIZE})"
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help="Resume the most recent interrupted reindex, skipping any chunks which have already been completed"
+        )
+        parser.add_argument(
+            '--online',
+            action='store_true',
+            help="Replace existing cache entries chunk by chunk (instead of clearing them first) so that search "
+                 "continues to return results during the reindex"
+        )
 
     def _get_indexers(self, *model_names):
         indexers = {}
@@ -60,6 +109,15 @@ class Command(BaseCommand):
         return indexers
 
     def handle(self, *model_labels, **kwargs):
+        if kwargs['workers'] < 1:
+            raise CommandError(_("The number of workers must be at least 1."))
+        if kwargs['chunk_size'] is not None and kwargs['chunk_size'] < 1:
+            raise CommandError(_("The chunk size must be at least 1."))
+
+        # Reindex in checkpointed chunks if any related option has been specified
+        if kwargs['workers'] > 1 or kwargs['chunk_size'] or kwargs['resume'] or kwargs['online']:
+            self._handle_chunked(*model_labels, **kwargs)
+            return
 
         # Determine which models to reindex
         indexers = self._get_indexers(*model_labels)
@@ -103,3 +161,136 @@ class Command(BaseCommand):
         if total_count := search_backend.size:
             msg += f' Total entries: {total_count}'
         self.stdout.write(msg, self.style.SUCCESS)
+
+    def _get_chunks(self, model, chunk_size):
+        """
+        Divide the objects of a model into chunks of (at most) chunk_size objects using keyset pagination on the
+        primary key. Returns a list of (lower, upper) bounds; the last chunk is open-ended to include any objects
+        created after it has been planned.
+        """
+        chunks = []
+        lower = None
+        pks = model.objects.order_by('pk').values_list('pk', flat=True)
+        while True:
+            queryset = pks.filter(pk__gt=lower) if lower is not None else pks
+            upper = list(queryset[chunk_size - 1:chunk_size])
+            if not upper:
+                chunks.append((lower, None))
+                return chunks
+            chunks.append((lower, upper[0]))
+            lower = upper[0]
+
+    def _plan(self, indexers, chunk_size, lazy=False):
+        """
+        Compile the list of chunks to be indexed for each model.
+        """
+        chunks = []
+        for model in indexers.keys():
+            label = model._meta.label_lower
+            if lazy:
+                content_type = ContentType.objects.get_for_model(model)
+                if cached_count := search_backend.count(object_types=[content_type]):
+                    self.stdout.write(f'  Skipping {label} (found {cached_count} existing).')
+                    continue
+            chunks.extend((label, lower, upper) for lower, upper in self._get_chunks(model, chunk_size))
+
+        return chunks
+
+    def _handle_chunked(self, *model_labels, **kwargs):
+        """
+        Reindex models in chunks, optionally distributed across a pool of worker processes. Progress is recorded in a
+        checkpoint (stored in the cache) after each chunk completes, so that an interrupted run can be resumed.
+        """
+        if kwargs['resume']:
+            checkpoint = cache.get(CHECKPOINT_CACHE_KEY)
+            if checkpoint is None:
+                raise CommandError(_("No interrupted reindex was found to resume."))
+            self.stdout.write(
+                f"Resuming reindex started at {checkpoint['started']} "
+                f"({len(checkpoint['completed'])}/{len(checkpoint['chunks'])} chunks completed)."
+            )
+
+        else:
+            # Determine which models to reindex
+            indexers = self._get_indexers(*model_labels)
+            if not indexers:
+                raise CommandError(_("No indexers found!"))
+            self.stdout.write(f'Reindexing {len(indexers)} models.')
+
+            chunk_size = kwargs['chunk_size'] or DEFAULT_CHUNK_SIZE
+            chunks = self._plan(indexers, chunk_size, lazy=kwargs['lazy'])
+            checkpoint = {
+                'started': timezone.now(),
+                'online': kwargs['online'],
+                # Only models being reindexed (i.e. not skipped lazily) are subject to the removal of stale entries
+                'labels': list(dict.fromkeys(label for label, lower, upper in chunks)),
+                'chunks': chunks,
+                'completed': [],
+            }
+            cache.set(CHECKPOINT_CACHE_KEY, checkpoint, timeout=None)
+
+            # Clear cached values for the specified models (unless being lazy or reindexing online)
+            if not kwargs['lazy'] and not kwargs['online']:
+                if model_labels:
+                    content_types = [ContentType.objects.get_for_model(model) for model in indexers.keys()]
+                else:
+                    content_types = None
+
+                self.stdout.write('Clearing cached values... ', ending='')
+                self.stdout.flush()
+                deleted_count = search_backend.clear(object_types=content_types)
+                self.stdout.write(f'{deleted_count} entries deleted.')
+
+        completed = set(checkpoint['completed'])
+        pending = [
+            (i, chunk) for i, chunk in enumerate(checkpoint['chunks']) if i not in completed
+        ]
+        workers = kwargs['workers']
+        self.stdout.write(f'Indexing {len(pending)} chunks using {workers} worker(s)')
+
+        def complete_chunk(i, label, count):
+            checkpoint['completed'].append(i)
+            cache.set(CHECKPOINT_CACHE_KEY, checkpoint, timeout=None)
+            self.stdout.write(
+                f"  [{len(checkpoint['completed'])}/{len(checkpoint['chunks'])}] {label}: {count} entries cached."
+            )
+            self.stdout.flush()
+
+        # When reindexing online, each chunk replaces the existing entries for its objects
+        remove_existing = checkpoint['online']
+        if workers == 1:
+            for i, (label, lower, upper) in pending:
+                complete_chunk(i, label, reindex_chunk(label, lower, upper, remove_existing))
+        else:
+            # Close database connections prior to forking, so that they are not shared with the worker processes
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = {
+                    executor.submit(reindex_chunk, label, lower, upper, remove_existing): (i, label)
+                    for i, (label, lower, upper) in pending
+                }
+                try:
+                    for future in as_completed(futures):
+                        i, label = futures[future]
+                        complete_chunk(i, label, future.result())
+                except BaseException:
+                    # Abandon any pending chunks; they will be picked up by --resume
+                    executor.shutdown(cancel_futures=True)
+                    raise
+
+        # When reindexing online, remove any entries which predate the reindex (e.g. for objects deleted without
+        # triggering a signal)
+        if checkpoint['online'] and isinstance(search_backend, CachedValueSearchBackend):
+            content_types = [
+                ContentType.objects.get_for_model(registry['search'][label].model) for label in checkpoint['labels']
+            ]
+            stale = CachedValue.objects.filter(object_type__in=content_types, timestamp__lt=checkpoint['started'])
+            if deleted_count := stale._raw_delete(using=stale.db):
+                self.stdout.write(f'{deleted_count} stale entries deleted.')
+
+        cache.delete(CHECKPOINT_CACHE_KEY)
+
+        msg = 'Completed.'
+        if total_count := search_backend.size:
+            msg += f' Total entries: {total_count}'
+        self.stdout.write(msg, self.style.SUCCESS)
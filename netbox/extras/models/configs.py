@@ -12,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 from jinja2.exceptions import TemplateError
 from jsonschema.exceptions import ValidationError as JSONValidationError
 
+from extras.configcontexts import prefetch_config_contexts
 from extras.models.mixins import RenderTemplateMixin
 from extras.querysets import ConfigContextQuerySet
 from netbox.models import ChangeLoggedModel, PrimaryModel
@@ -236,9 +237,20 @@ class ConfigContextModel(models.Model):
         abstract = True
 
     def get_config_context(self):
+        """
+        Return the rendered configuration context for a device or VM. If CONFIG_CONTEXT_CACHE_TIMEOUT is set, the
+        rendered context is retrieved from (or stored to) the cache.
+        """
+        if hasattr(self, '_rendered_config_context'):
+            return self._rendered_config_context
+        if settings.CONFIG_CONTEXT_CACHE_TIMEOUT and not hasattr(self, 'config_context_data'):
+            prefetch_config_contexts([self])
+            return self._rendered_config_context
+        return self.render_config_context()
+
+    def render_config_context(self):
         """
         Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs.
-        Return the rendered configuration context for a device or VM.
         """
         data = {}
 
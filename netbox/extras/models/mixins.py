@@ -15,7 +15,7 @@ from django.utils.translation import gettext_lazy as _
 from core.models import ObjectType
 from extras.constants import DEFAULT_MIME_TYPE, JINJA_ENV_PARAMS_ALLOWED, SCRIPT_MODULE_NAME_PREFIX
 from extras.utils import filename_from_model, filename_from_object
-from utilities.jinja2 import render_jinja2
+from utilities.jinja2 import get_jinja2_template, render_jinja2
 
 __all__ = (
     'PythonModuleMixin',
@@ -234,6 +234,29 @@ class RenderTemplateMixin(models.Model):
 
         return output
 
+    def render_many(self, contexts):
+        """
+        Render the template once for each of the provided contexts, sharing the base template context and compiled
+        template among all renders. Yields an (output, error) two-tuple for each context; if rendering fails, the
+        exception is returned in place of the output so that a single failure does not abort the remaining renders.
+        """
+        base_context = self.get_context()
+        template = get_jinja2_template(
+            self.template_code,
+            self.get_environment_params(),
+            getattr(self, 'data_file', None),
+            debug=getattr(self, 'debug', False)
+        )
+        for context in contexts:
+            try:
+                output = template.render(**{**base_context, **context})
+            except Exception as e:
+                yield None, e
+                continue
+
+            # Replace CRLF-style line terminators
+            yield output.replace('\r\n', '\n'), None
+
     def render_to_response(self, context=None, queryset=None):
         output = self.render(context=context, queryset=queryset)
         mime_type = self.mime_type or DEFAULT_MIME_TYPE
@@ -6,10 +6,11 @@ from pathlib import Path
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.postgres.fields import ArrayField
-from django.core.validators import ValidationError
+from django.core.validators import MinValueValidator, ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
@@ -154,6 +155,13 @@ class EventRule(CustomFieldsMixin, ExportTemplatesMixin, OwnerMixin, TagsMixin,
         if self.action_data is not None and not isinstance(self.action_data, dict):
             raise ValidationError({'action_data': _('Action data must be a JSON object or null.')})
 
+    @cached_property
+    def condition_set(self):
+        """
+        The compiled ConditionSet for the event rule's conditions.
+        """
+        return ConditionSet(self.conditions)
+
     def eval_conditions(self, data):
         """
         Test whether the given data meets the conditions of the event rule (if any). Return True
@@ -165,7 +173,7 @@ class EventRule(CustomFieldsMixin, ExportTemplatesMixin, OwnerMixin, TagsMixin,
         logger = logging.getLogger('netbox.event_rules')
 
         try:
-            result = ConditionSet(self.conditions).eval(data)
+            result = self.condition_set.eval(data)
             logger.debug(f'{self.name}: Evaluated as {result}')
             return result
         except InvalidCondition as e:
@@ -256,6 +264,34 @@ class Webhook(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, OwnerMixin, Ch
             "The specific CA certificate file to use for SSL verification. Leave blank to use the system defaults."
         )
     )
+    max_concurrency = models.PositiveSmallIntegerField(
+        verbose_name=_('maximum concurrency'),
+        blank=True,
+        null=True,
+        validators=(MinValueValidator(1),),
+        help_text=_(
+            "The maximum number of simultaneous requests to send to the receiver within each batched delivery task "
+            "(requires WEBHOOK_BATCH_SIZE). Leave blank for no limit."
+        )
+    )
+    rate_limit = models.PositiveSmallIntegerField(
+        verbose_name=_('rate limit'),
+        blank=True,
+        null=True,
+        validators=(MinValueValidator(1),),
+        help_text=_(
+            "The maximum number of requests per second to send to the receiver within each batched delivery task "
+            "(requires WEBHOOK_BATCH_SIZE). Leave blank for no limit."
+        )
+    )
+    batch_events = models.BooleanField(
+        verbose_name=_('batch events'),
+        default=False,
+        help_text=_(
+            "Combine multiple events into a single request during batched delivery. The request body will be a JSON "
+            "array of the individually rendered event bodies."
+        )
+    )
     events = GenericRelation(
         EventRule,
         content_type_field='action_object_type',
@@ -1,11 +1,15 @@
+from functools import partial
+
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from core.events import *
 from core.signals import job_end, job_start
-from extras.events import EventContext, process_event_rules
-from extras.models import EventRule, Notification, Subscription
+from extras.configcontexts import invalidate_config_contexts
+from extras.events import EventContext, get_event_rules, invalidate_event_rule_index, process_event_rules
+from extras.models import ConfigContext, ConfigContextModel, EventRule, Notification, Subscription, Tag
 from netbox.config import get_config
 from netbox.models.features import has_feature
 from netbox.signals import post_clean
@@ -102,20 +106,82 @@ def validate_assigned_tags(sender, instance, action, model, pk_set, **kwargs):
             raise AbortRequest(f"Tag {tag} cannot be assigned to {ct.model} objects.")
 
 
+#
+# Config contexts
+#
+
+def handle_config_context_changed(**kwargs):
+    """
+    Invalidate all cached config contexts whenever a ConfigContext (or an object which determines to which devices
+    and virtual machines ConfigContexts apply, such as a region or platform) changes. As with event rules, this is
+    deferred until the change has been committed.
+    """
+    transaction.on_commit(invalidate_config_contexts)
+
+
+def handle_config_context_object_changed(instance, **kwargs):
+    """
+    Invalidate the cached config context of a device or virtual machine once its save or deletion has been committed.
+    """
+    instance.__dict__.pop('_rendered_config_context', None)
+    # The instance's PK is cleared upon deletion, so identify the object now
+    obj = type(instance)(pk=instance.pk)
+    transaction.on_commit(partial(invalidate_config_contexts, [obj]))
+
+
+def handle_config_context_object_tags_changed(instance, action, **kwargs):
+    """
+    Invalidate cached config contexts when tags are assigned to or removed from an object.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if isinstance(instance, ConfigContextModel):
+        handle_config_context_object_changed(instance)
+    elif isinstance(instance, Tag):
+        handle_config_context_changed()
+
+
+post_save.connect(handle_config_context_changed, sender=ConfigContext)
+post_delete.connect(handle_config_context_changed, sender=ConfigContext)
+for field in ConfigContext._meta.many_to_many:
+    m2m_changed.connect(handle_config_context_changed, sender=field.remote_field.through)
+for model in (
+    'dcim.Region', 'dcim.SiteGroup', 'dcim.Site', 'dcim.Location', 'dcim.DeviceType', 'dcim.DeviceRole',
+    'dcim.Platform', 'virtualization.ClusterType', 'virtualization.ClusterGroup', 'virtualization.Cluster',
+    'tenancy.TenantGroup', 'tenancy.Tenant', 'extras.Tag',
+):
+    post_save.connect(handle_config_context_changed, sender=model)
+    post_delete.connect(handle_config_context_changed, sender=model)
+for model in ('dcim.Device', 'virtualization.VirtualMachine'):
+    post_save.connect(handle_config_context_object_changed, sender=model)
+    post_delete.connect(handle_config_context_object_changed, sender=model)
+m2m_changed.connect(handle_config_context_object_tags_changed, sender=TaggedItem)
+
+
 #
 # Event rules
 #
 
+def handle_event_rule_changed(**kwargs):
+    """
+    Invalidate the cached EventRuleIndex whenever an EventRule (or its assignment to object types) changes. This is
+    deferred until the change has been committed; otherwise, another process could rebuild the index from the prior
+    state under the new version.
+    """
+    transaction.on_commit(invalidate_event_rule_index)
+
+
+post_save.connect(handle_event_rule_changed, sender=EventRule)
+post_delete.connect(handle_event_rule_changed, sender=EventRule)
+m2m_changed.connect(handle_event_rule_changed, sender=EventRule.object_types.through)
+
+
 @receiver(job_start)
 def process_job_start_event_rules(sender, **kwargs):
     """
     Process event rules for jobs starting.
     """
-    event_rules = EventRule.objects.filter(
-        event_types__contains=[JOB_STARTED],
-        enabled=True,
-        object_types=sender.object_type
-    )
+    event_rules = get_event_rules(sender.object_type, JOB_STARTED)
     event = EventContext(
         event_type=JOB_STARTED,
         data=sender.data,
@@ -129,11 +195,7 @@ def process_job_end_event_rules(sender, **kwargs):
     """
     Process event rules for jobs terminating.
     """
-    event_rules = EventRule.objects.filter(
-        event_types__contains=[JOB_COMPLETED],
-        enabled=True,
-        object_types=sender.object_type
-    )
+    event_rules = get_event_rules(sender.object_type, JOB_COMPLETED)
     event = EventContext(
         event_type=JOB_COMPLETED,
         data=sender.data,
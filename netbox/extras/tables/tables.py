@@ -487,6 +487,9 @@ class WebhookTable(NetBoxTable):
     ssl_verification = columns.BooleanColumn(
         verbose_name=_('SSL Verification'),
     )
+    batch_events = columns.BooleanColumn(
+        verbose_name=_('Batch Events'),
+    )
     owner = tables.Column(
         linkify=True,
         verbose_name=_('Owner')
@@ -499,7 +502,8 @@ class WebhookTable(NetBoxTable):
         model = Webhook
         fields = (
             'pk', 'id', 'name', 'http_method', 'payload_url', 'http_content_type', 'secret', 'ssl_verification',
-            'ca_file_path', 'description', 'tags', 'created', 'last_updated',
+            'ca_file_path', 'max_concurrency', 'rate_limit', 'batch_events', 'description', 'tags', 'created',
+            'last_updated',
         )
         default_columns = (
             'pk', 'name', 'http_method', 'payload_url', 'description',
@@ -8,11 +8,13 @@ from unittest.mock import Mock, patch
 import django_rq
 from django.conf import settings
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase, tag
+from django.test import RequestFactory, TestCase, override_settings, tag
 from django.urls import reverse
 from PIL import Image
 from requests import Session
+from requests.exceptions import RequestException
 from rest_framework import status
+from rq import Retry
 
 from core.choices import JobNotificationChoices, ManagedFileRootPathChoices
 from core.events import *
@@ -20,11 +22,19 @@ from core.models import Job, ObjectType
 from dcim.choices import SiteStatusChoices
 from dcim.models import DeviceType, Interface, Manufacturer, Site
 from extras.choices import EventRuleActionChoices
-from extras.events import enqueue_event, flush_events, serialize_for_event
+from extras.events import (
+    EventContext,
+    enqueue_event,
+    flush_events,
+    get_event_rule_index,
+    invalidate_event_rule_index,
+    process_event_queue,
+    serialize_for_event,
+)
 from extras.models import EventRule, Notification, Script, ScriptModule, Tag, Webhook
 from extras.scripts import Script as ScriptBase
 from extras.signals import process_job_end_event_rules
-from extras.webhooks import generate_signature, send_webhook
+from extras.webhooks import generate_signature, send_webhook, send_webhooks
 from netbox.context_managers import event_tracking
 from utilities.testing import APITestCase, create_test_device
 from utilities.testing.mixins import RQQueueTestMixin
@@ -39,6 +49,9 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         self.queue = django_rq.get_queue('default')
         self.queue.empty()
 
+        # EventRules created by setUpTestData() are never committed, so their invalidation of the index never fires
+        invalidate_event_rule_index()
+
     def tearDown(self):
         super().tearDown()
 
@@ -135,6 +148,61 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         # Evaluate the conditions (status='active')
         self.assertTrue(event_rule.eval_conditions(data))
 
+    def test_event_rule_index(self):
+        """
+        Test the mapping of EventRules by object type and event type, and its invalidation upon changes.
+        """
+        site_type = ObjectType.objects.get_for_model(Site)
+        tag_type = ObjectType.objects.get_for_model(Tag)
+        event_rule = EventRule.objects.get(name='Event Rule 1')
+
+        index = get_event_rule_index()
+        self.assertEqual(index.get_rule_ids(site_type, OBJECT_CREATED), [event_rule.pk])
+        self.assertEqual(index.get_rule_ids(tag_type, OBJECT_CREATED), [])
+
+        # Assigning the rule to another object type should invalidate the index once committed
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule.object_types.add(tag_type)
+            self.assertIs(get_event_rule_index(), index)
+        index = get_event_rule_index()
+        self.assertEqual(index.get_rule_ids(tag_type, OBJECT_CREATED), [event_rule.pk])
+
+        # Disabling the rule should remove it from the index
+        event_rule.enabled = False
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule.save()
+        index = get_event_rule_index()
+        self.assertEqual(index.get_rule_ids(site_type, OBJECT_CREATED), [])
+
+    def test_event_rule_index_compiles_conditions(self):
+        event_rule = EventRule.objects.get(name='Event Rule 1')
+        event_rule.conditions = {'attr': 'status.value', 'value': 'active'}
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule.save()
+
+        index = get_event_rule_index()
+        event_rules = index.get_event_rules([event_rule.pk])
+        self.assertIs(event_rules[0].condition_set, index.condition_sets[event_rule.pk])
+
+    def test_process_event_queue_skips_unmatched_events(self):
+        """
+        Events with no applicable EventRules should be discarded without querying the database or serializing
+        the object.
+        """
+        tag = Tag.objects.first()
+        event = EventContext(
+            object_type=ObjectType.objects.get_for_model(Tag),
+            object_id=tag.pk,
+            object=tag,
+            event_type=OBJECT_CREATED,
+        )
+        get_event_rule_index()
+
+        with self.assertNumQueries(0):
+            process_event_queue([event])
+        self.assertNotIn('data', event)
+        self.assertEqual(self.queue.count, 0)
+
     def test_single_create_process_eventrule(self):
         """
         Check that creating an object with an applicable EventRule queues a background task for the rule's action.
@@ -426,6 +494,117 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         with patch.object(Session, 'send', dummy_send):
             send_webhook(**job.kwargs)
 
+    @override_settings(WEBHOOK_BATCH_SIZE=2)
+    def test_batched_webhook_deliveries(self):
+        """
+        Check that webhook deliveries are enqueued in batches when WEBHOOK_BATCH_SIZE is set.
+        """
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+        webhooks_queue = {}
+        for i in range(1, 4):
+            site = Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+            enqueue_event(webhooks_queue, instance=site, request=request, event_type=OBJECT_CREATED)
+        flush_events(list(webhooks_queue.values()))
+
+        # Three events should be split across two batch jobs
+        self.assertEqual(self.queue.count, 2)
+        self.assertEqual(self.queue.jobs[0].func_name, 'extras.webhooks.send_webhooks')
+        self.assertEqual(len(self.queue.jobs[0].kwargs['deliveries']), 2)
+        self.assertEqual(len(self.queue.jobs[1].kwargs['deliveries']), 1)
+        delivery = self.queue.jobs[0].kwargs['deliveries'][0]
+        self.assertEqual(delivery['event_rule'], EventRule.objects.get(name='Event Rule 1'))
+        self.assertEqual(delivery['data']['name'], 'Site 1')
+        self.assertNotIn('retry', delivery)
+
+    @override_settings(WEBHOOK_BATCH_SIZE=10)
+    def test_send_webhooks_batch_events(self):
+        """
+        Check that events for a Webhook with batch_events enabled are combined into a single request.
+        """
+        Webhook.objects.filter(name='Webhook 1').update(batch_events=True, max_concurrency=1, rate_limit=100)
+        sent_requests = []
+
+        def dummy_send(_, request, **kwargs):
+            sent_requests.append(request)
+            return HttpResponse()
+
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+        webhooks_queue = {}
+        for i in range(1, 4):
+            site = Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+            enqueue_event(webhooks_queue, instance=site, request=request, event_type=OBJECT_CREATED)
+        flush_events(list(webhooks_queue.values()))
+        job = self.queue.jobs[0]
+
+        with patch.object(Session, 'send', dummy_send):
+            send_webhooks(**job.kwargs)
+
+        # All three events should have been delivered in a single, signed request
+        self.assertEqual(len(sent_requests), 1)
+        request = sent_requests[0]
+        webhook = Webhook.objects.get(name='Webhook 1')
+        self.assertEqual(request.headers['X-Hook-Signature'], generate_signature(request.body, webhook.secret))
+        body = json.loads(request.body)
+        self.assertEqual(len(body), 3)
+        self.assertEqual([event['data']['name'] for event in body], ['Site 1', 'Site 2', 'Site 3'])
+
+    @override_settings(WEBHOOK_BATCH_SIZE=10)
+    def test_send_webhooks_retries_failures(self):
+        """
+        Check that failed deliveries from a batch are re-enqueued individually.
+        """
+        def dummy_send(_, request, **kwargs):
+            return HttpResponse(status=500)
+
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+        webhooks_queue = {}
+        for i in range(1, 3):
+            site = Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+            enqueue_event(webhooks_queue, instance=site, request=request, event_type=OBJECT_CREATED)
+        flush_events(list(webhooks_queue.values()))
+        job = self.queue.jobs[0]
+        self.queue.empty()
+
+        with patch.object(Session, 'send', dummy_send):
+            with patch('extras.webhooks.get_rq_retry', return_value=Retry(max=1)):
+                send_webhooks(**job.kwargs)
+
+        self.assertEqual(self.queue.count, 2)
+        for retry_job in self.queue.jobs:
+            self.assertEqual(retry_job.func_name, 'extras.webhooks.send_webhook')
+
+    @override_settings(WEBHOOK_BATCH_SIZE=10)
+    def test_send_webhooks_does_not_retry_render_errors(self):
+        """
+        Check that deliveries which cannot be rendered are not re-enqueued.
+        """
+        Webhook.objects.filter(name='Webhook 1').update(body_template='{% if %}')
+
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+        webhooks_queue = {}
+        for i in range(1, 3):
+            site = Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+            enqueue_event(webhooks_queue, instance=site, request=request, event_type=OBJECT_CREATED)
+        flush_events(list(webhooks_queue.values()))
+        job = self.queue.jobs[0]
+        self.queue.empty()
+
+        with patch.object(Session, 'send') as send:
+            with patch('extras.webhooks.get_rq_retry', return_value=Retry(max=1)):
+                with self.assertRaisesMessage(RequestException, '2 could not be rendered'):
+                    send_webhooks(**job.kwargs)
+
+        send.assert_not_called()
+        self.assertEqual(self.queue.count, 0)
+
     def test_job_completed_webhook_username_fallback(self):
         """
         Ensure job_end event processing can enqueue a webhook even when the EventContext
@@ -437,14 +616,15 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         script_type = ObjectType.objects.get_for_model(Script)
         webhook_type = ObjectType.objects.get_for_model(Webhook)
         webhook = Webhook.objects.get(name='Webhook 1')
-        event_rule = EventRule.objects.create(
-            name='Event Rule Job Completed',
-            event_types=[JOB_COMPLETED],
-            action_type=EventRuleActionChoices.WEBHOOK,
-            action_object_type=webhook_type,
-            action_object_id=webhook.pk,
-        )
-        event_rule.object_types.set([script_type])
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule = EventRule.objects.create(
+                name='Event Rule Job Completed',
+                event_types=[JOB_COMPLETED],
+                action_type=EventRuleActionChoices.WEBHOOK,
+                action_object_type=webhook_type,
+                action_object_id=webhook.pk,
+            )
+            event_rule.object_types.set([script_type])
         # Mimic the `core.job_end` signal sender expected by extras.signals.process_job_end_event_rules
         # (notably: no request, and thus no legacy `username`)
         sender = Mock(object_type=script_type, data={}, user=self.user)
@@ -554,14 +734,15 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         peer interface in connected_endpoints and link_peers.
         """
         webhook = Webhook.objects.get(name='Webhook 1')
-        event_rule = EventRule.objects.create(
-            name='Interface Update Rule',
-            event_types=[OBJECT_UPDATED],
-            action_type=EventRuleActionChoices.WEBHOOK,
-            action_object_type=ObjectType.objects.get_for_model(Webhook),
-            action_object_id=webhook.id,
-        )
-        event_rule.object_types.set([ObjectType.objects.get_for_model(Interface)])
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule = EventRule.objects.create(
+                name='Interface Update Rule',
+                event_types=[OBJECT_UPDATED],
+                action_type=EventRuleActionChoices.WEBHOOK,
+                action_object_type=ObjectType.objects.get_for_model(Webhook),
+                action_object_id=webhook.id,
+            )
+            event_rule.object_types.set([ObjectType.objects.get_for_model(Interface)])
 
         device = create_test_device('Device 1')
         interface_a = Interface.objects.create(device=device, name='eth0')
@@ -649,15 +830,16 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         webhook = Webhook.objects.get(name='Webhook 1')
         webhook_type = ObjectType.objects.get_for_model(Webhook)
 
-        bad_rule = EventRule.objects.create(
-            name='Bad action_data rule',
-            event_types=[OBJECT_CREATED],
-            action_type=EventRuleActionChoices.WEBHOOK,
-            action_object_type=webhook_type,
-            action_object_id=webhook.pk,
-            action_data={},
-        )
-        bad_rule.object_types.set([site_type])
+        with self.captureOnCommitCallbacks(execute=True):
+            bad_rule = EventRule.objects.create(
+                name='Bad action_data rule',
+                event_types=[OBJECT_CREATED],
+                action_type=EventRuleActionChoices.WEBHOOK,
+                action_object_type=webhook_type,
+                action_object_id=webhook.pk,
+                action_data={},
+            )
+            bad_rule.object_types.set([site_type])
 
         # Simulate a legacy row that predates model validation.
         EventRule.objects.filter(pk=bad_rule.pk).update(action_data='not a dict')
@@ -700,14 +882,15 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
 
         # Create an event rule that triggers on DeviceType update with Script action
         devicetype_type = ObjectType.objects.get_for_model(DeviceType)
-        event_rule = EventRule.objects.create(
-            name='Test Script Event Rule with Files',
-            event_types=[OBJECT_UPDATED],
-            action_type=EventRuleActionChoices.SCRIPT,
-            action_object_type=script_type,
-            action_object_id=script.pk,
-        )
-        event_rule.object_types.set([devicetype_type])
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule = EventRule.objects.create(
+                name='Test Script Event Rule with Files',
+                event_types=[OBJECT_UPDATED],
+                action_type=EventRuleActionChoices.SCRIPT,
+                action_object_type=script_type,
+                action_object_id=script.pk,
+            )
+            event_rule.object_types.set([devicetype_type])
 
         # Create a manufacturer and DeviceType
         manufacturer = Manufacturer.objects.create(
@@ -781,14 +964,15 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
             is_executable=True,
         )
 
-        event_rule = EventRule.objects.create(
-            name='Test Script Defaults Event Rule',
-            event_types=[OBJECT_CREATED],
-            action_type=EventRuleActionChoices.SCRIPT,
-            action_object_type=ObjectType.objects.get_for_model(Script),
-            action_object_id=script.pk,
-        )
-        event_rule.object_types.set([ObjectType.objects.get_for_model(DeviceType)])
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule = EventRule.objects.create(
+                name='Test Script Defaults Event Rule',
+                event_types=[OBJECT_CREATED],
+                action_type=EventRuleActionChoices.SCRIPT,
+                action_object_type=ObjectType.objects.get_for_model(Script),
+                action_object_id=script.pk,
+            )
+            event_rule.object_types.set([ObjectType.objects.get_for_model(DeviceType)])
 
         manufacturer = Manufacturer.objects.create(name='Test Manufacturer', slug='test-manufacturer')
         self.add_permissions('dcim.add_devicetype')
@@ -840,14 +1024,15 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         webhook = Webhook.objects.get(name='Webhook 1')
         webhook_type = ObjectType.objects.get_for_model(Webhook)
         devicetype_type = ObjectType.objects.get_for_model(DeviceType)
-        event_rule = EventRule.objects.create(
-            name='Test Webhook Event Rule with Files',
-            event_types=[OBJECT_UPDATED],
-            action_type=EventRuleActionChoices.WEBHOOK,
-            action_object_type=webhook_type,
-            action_object_id=webhook.pk,
-        )
-        event_rule.object_types.set([devicetype_type])
+        with self.captureOnCommitCallbacks(execute=True):
+            event_rule = EventRule.objects.create(
+                name='Test Webhook Event Rule with Files',
+                event_types=[OBJECT_UPDATED],
+                action_type=EventRuleActionChoices.WEBHOOK,
+                action_object_type=webhook_type,
+                action_object_id=webhook.pk,
+            )
+            event_rule.object_types.set([devicetype_type])
 
         # Create a manufacturer and DeviceType
         manufacturer = Manufacturer.objects.create(
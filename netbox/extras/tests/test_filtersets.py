@@ -219,6 +219,9 @@ class WebhookTestCase(TestCase, BaseFilterSetTests):
                 payload_url='http://example.com/?1',
                 http_method='GET',
                 ssl_verification=True,
+                max_concurrency=1,
+                rate_limit=10,
+                batch_events=True,
                 description='foobar1'
             ),
             Webhook(
@@ -226,6 +229,9 @@ class WebhookTestCase(TestCase, BaseFilterSetTests):
                 payload_url='http://example.com/?2',
                 http_method='POST',
                 ssl_verification=True,
+                max_concurrency=2,
+                rate_limit=20,
+                batch_events=True,
                 description='foobar2'
             ),
             Webhook(
@@ -270,6 +276,18 @@ class WebhookTestCase(TestCase, BaseFilterSetTests):
         params = {'ssl_verification': True}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
 
+    def test_max_concurrency(self):
+        params = {'max_concurrency': [1, 2]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    def test_rate_limit(self):
+        params = {'rate_limit': [10]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
+    def test_batch_events(self):
+        params = {'batch_events': True}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
 
 class EventRuleTestCase(TestCase, BaseFilterSetTests):
     queryset = EventRule.objects.all()
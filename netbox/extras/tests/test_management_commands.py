@@ -3,16 +3,19 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase
+from django.utils import timezone
 
 from core.choices import JobNotificationChoices
 from dcim.choices import InterfaceTypeChoices
 from dcim.models import Device, DeviceRole, DeviceType, Interface, Manufacturer, Site
 from extras.management.commands import renaturalize, webhook_receiver
+from extras.management.commands.reindex import CHECKPOINT_CACHE_KEY
 from extras.management.commands.webhook_receiver import WebhookHandler
-from extras.models import ImageAttachment
+from extras.models import CachedValue, ImageAttachment
 from extras.scripts import Script, StringVar
 from extras.tests.test_models import OverwriteStyleMemoryStorage, UnreadableSizeMemoryStorage
 from users.models import User
@@ -162,6 +165,73 @@ class ReindexTestCase(TestCase):
             call_command('reindex', 'dcim.rack.extra', stdout=StringIO())
 
 
+class ReindexChunkedTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)
+        ])
+
+    def setUp(self):
+        cache.delete(CHECKPOINT_CACHE_KEY)
+
+    def _get_cached_site_ids(self):
+        content_type = ContentType.objects.get_for_model(Site)
+        return list(
+            CachedValue.objects.filter(object_type=content_type, field='name').values_list('object_id', flat=True)
+        )
+
+    def test_reindex_in_chunks(self):
+        out = StringIO()
+        call_command('reindex', 'dcim.site', chunk_size=2, stdout=out)
+
+        self.assertCountEqual(self._get_cached_site_ids(), Site.objects.values_list('pk', flat=True))
+        self.assertIn('[3/3]', out.getvalue())
+        self.assertIsNone(cache.get(CHECKPOINT_CACHE_KEY))
+
+    def test_reindex_resume(self):
+        site_ids = list(Site.objects.order_by('pk').values_list('pk', flat=True))
+        cache.set(CHECKPOINT_CACHE_KEY, {
+            'started': timezone.now(),
+            'online': False,
+            'labels': ['dcim.site'],
+            'chunks': [('dcim.site', None, site_ids[1]), ('dcim.site', site_ids[1], None)],
+            'completed': [0],
+        })
+
+        out = StringIO()
+        call_command('reindex', resume=True, stdout=out)
+
+        # Only the incomplete chunk should have been indexed
+        self.assertCountEqual(self._get_cached_site_ids(), site_ids[2:])
+        self.assertIn('[2/2]', out.getvalue())
+        self.assertIsNone(cache.get(CHECKPOINT_CACHE_KEY))
+
+    def test_reindex_resume_without_checkpoint(self):
+        with self.assertRaisesMessage(CommandError, 'No interrupted reindex was found to resume.'):
+            call_command('reindex', resume=True, stdout=StringIO())
+
+    def test_reindex_online(self):
+        call_command('reindex', 'dcim.site', stdout=StringIO())
+        call_command('reindex', 'dcim.site', online=True, chunk_size=2, stdout=StringIO())
+
+        # Existing entries should have been replaced rather than duplicated
+        self.assertCountEqual(self._get_cached_site_ids(), Site.objects.values_list('pk', flat=True))
+
+    def test_reindex_online_lazy_retains_skipped_models(self):
+        call_command('reindex', 'dcim.site', stdout=StringIO())
+        site_ids = self._get_cached_site_ids()
+
+        call_command('reindex', 'dcim', online=True, lazy=True, chunk_size=2, stdout=StringIO())
+
+        # Cached entries for a lazily skipped model must not be removed as stale
+        self.assertCountEqual(self._get_cached_site_ids(), site_ids)
+
+    def test_invalid_workers(self):
+        with self.assertRaisesMessage(CommandError, 'The number of workers must be at least 1.'):
+            call_command('reindex', workers=0, stdout=StringIO())
+
+
 class RenaturalizeTestCase(TestCase):
     @classmethod
     def setUpTestData(cls):
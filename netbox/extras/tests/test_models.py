@@ -13,7 +13,7 @@ from django.core.files.storage import Storage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import connection
 from django.forms import ValidationError
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.test.utils import CaptureQueriesContext
 from jinja2 import DebugUndefined, StrictUndefined, TemplateError, TemplateSyntaxError, UndefinedError
 from PIL import Image
@@ -21,6 +21,7 @@ from PIL import Image
 from core.events import OBJECT_CREATED
 from core.models import AutoSyncRecord, DataSource, ObjectType
 from dcim.models import Device, DeviceRole, DeviceType, Location, Manufacturer, Platform, Region, Site, SiteGroup
+from extras.configcontexts import get_cache_version
 from extras.constants import DEFAULT_MIME_TYPE
 from extras.models import (
     ConfigContext,
@@ -37,7 +38,7 @@ from extras.models import (
 from extras.models.mixins import RenderTemplateMixin
 from tenancy.models import Tenant, TenantGroup
 from utilities.exceptions import AbortRequest
-from utilities.jinja2 import env_filter, render_jinja2, sanitize_http_header
+from utilities.jinja2 import env_filter, get_jinja2_template, render_jinja2, sanitize_http_header
 from utilities.tables import get_table_for_model
 from virtualization.models import Cluster, ClusterGroup, ClusterType, VirtualMachine
 
@@ -1005,6 +1006,38 @@ class ConfigContextTestCase(TestCase):
         self.assertEqual(ConfigContext.objects.get_for_object(device).count(), 2)
         self.assertEqual(device.get_config_context(), annotated_queryset[0].get_config_context())
 
+    @override_settings(CONFIG_CONTEXT_CACHE_TIMEOUT=60)
+    def test_config_context_cache(self):
+        tag1 = Tag.objects.get(slug='tag')
+        with self.captureOnCommitCallbacks(execute=True):
+            context = ConfigContext.objects.create(name='context 1', weight=100, data={'a': 123})
+            tagged_context = ConfigContext.objects.create(name='context 2', weight=200, data={'b': 456})
+            tagged_context.tags.add(tag1)
+        self.assertEqual(Device.objects.first().get_config_context(), {'a': 123})
+
+        # Subsequent lookups should be served from the cache
+        device = Device.objects.first()
+        with self.assertNumQueries(0):
+            self.assertEqual(device.get_config_context(), {'a': 123})
+
+        # Assigning a tag to the device should invalidate its cached context once committed
+        with self.captureOnCommitCallbacks(execute=True):
+            device.tags.add(tag1)
+            self.assertEqual(Device.objects.first().get_config_context(), {'a': 123})
+        self.assertEqual(Device.objects.first().get_config_context(), {'a': 123, 'b': 456})
+
+        # Modifying a ConfigContext should invalidate all cached contexts
+        context.data = {'a': 789}
+        with self.captureOnCommitCallbacks(execute=True):
+            context.save()
+        self.assertEqual(Device.objects.first().get_config_context(), {'a': 789, 'b': 456})
+
+        # Modifying a TenantGroup (which is matched by its descendants) should invalidate all cached contexts
+        version = get_cache_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            TenantGroup.objects.create(name='Tenant Group 2', slug='tenant-group-2')
+        self.assertNotEqual(get_cache_version(), version)
+
     @tag('performance', 'regression')
     def test_config_context_annotation_query_optimization(self):
         """
@@ -1206,6 +1239,31 @@ class ConfigTemplateDebugTestCase(TestCase):
         with self.assertRaises(TemplateSyntaxError):
             render_jinja2("{% debug %}", {}, debug=False)
 
+    def test_get_jinja2_template_cached(self):
+        """Compiled templates are reused for identical template code and environment parameters."""
+        template = get_jinja2_template("Hello {{ name }}")
+        self.assertIs(get_jinja2_template("Hello {{ name }}"), template)
+        self.assertIsNot(get_jinja2_template("Hello {{ name }}", {'trim_blocks': True}), template)
+        self.assertIsNot(get_jinja2_template("Hello {{ name }}", debug=True), template)
+        self.assertEqual(render_jinja2("Hello {{ name }}", {'name': 'world'}), "Hello world")
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=0)
+    def test_get_jinja2_template_cache_disabled(self):
+        self.assertIsNot(get_jinja2_template("Hello {{ name }}"), get_jinja2_template("Hello {{ name }}"))
+
+    def test_render_many(self):
+        """render_many() renders each context independently, returning any errors in place of output."""
+        t = self._make_template("{{ name }}{{ 1 // divisor }}")
+        results = list(t.render_many([
+            {'name': 'a', 'divisor': 1},
+            {'name': 'b', 'divisor': 0},
+            {'name': 'c', 'divisor': 1},
+        ]))
+        self.assertEqual(results[0], ('a1', None))
+        self.assertIsNone(results[1][0])
+        self.assertIsInstance(results[1][1], ZeroDivisionError)
+        self.assertEqual(results[2], ('c1', None))
+
     def test_format_render_error_debug_redacts_install_path(self):
         """format_render_error() strips the repo install-path prefix from debug tracebacks."""
         t = ConfigTemplate(name='redact-test', template_code='hello', debug=True)
@@ -12,6 +12,7 @@ from dcim.choices import SiteStatusChoices
 from dcim.models import Region, Site
 from extras import signals
 from extras.choices import CustomFieldTypeChoices, EventRuleActionChoices
+from extras.events import invalidate_event_rule_index
 from extras.models import CustomField, EventRule, Notification, Subscription, Tag, Webhook
 from extras.validators import CustomValidator
 from netbox.context_managers import event_tracking
@@ -195,6 +196,10 @@ class JobEventRulesSignalTestCase(TestCase):
         )
         cls.end_rule.object_types.set([cls.site_type])
 
+    def setUp(self):
+        # The EventRules above are never committed, so their invalidation of the index never fires
+        invalidate_event_rule_index()
+
     def _create_job(self):
         return Job.objects.create(
             object_type=self.site_type,
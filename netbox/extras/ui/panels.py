@@ -348,6 +348,14 @@ class WebhookSSLPanel(panels.ObjectAttributesPanel):
     ca_file_path = attrs.TextAttr('ca_file_path', label=_('CA file path'))
 
 
+class WebhookDeliveryPanel(panels.ObjectAttributesPanel):
+    title = _('Delivery')
+
+    max_concurrency = attrs.NumericAttr('max_concurrency', label=_('Maximum concurrency'))
+    rate_limit = attrs.NumericAttr('rate_limit', label=_('Rate limit'))
+    batch_events = attrs.BooleanAttr('batch_events', label=_('Batch events'))
+
+
 #
 # EventRule panels
 #
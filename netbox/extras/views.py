@@ -771,6 +771,7 @@ class WebhookView(generic.ObjectView):
             panels.WebhookPanel(),
             panels.WebhookHTTPPanel(),
             panels.WebhookSSLPanel(),
+            panels.WebhookDeliveryPanel(),
         ],
         right_panels=[
             TextCodePanel('additional_headers', title=_('Additional Headers')),
@@ -1,13 +1,21 @@
 import hashlib
 import hmac
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from django_rq import job
+from django.conf import settings
+from django_rq import get_queue, job
 from jinja2.exceptions import TemplateError
+from requests.adapters import HTTPAdapter
 
+from netbox.config import get_config
+from netbox.constants import RQ_QUEUE_DEFAULT
 from netbox.registry import registry
 from utilities.proxy import resolve_proxies
+from utilities.rqworker import get_rq_retry
 
 from .constants import WEBHOOK_EVENT_TYPES
 
@@ -15,10 +23,17 @@ __all__ = (
     'generate_signature',
     'register_webhook_callback',
     'send_webhook',
+    'send_webhooks',
 )
 
 logger = logging.getLogger('netbox.webhooks')
 
+# Process-wide HTTP sessions and delivery limiters, keyed by webhook (see get_session() and get_limiter()). As RQ
+# workers run each job in a newly forked process, these are shared only among the requests of a send_webhooks() batch.
+_sessions = {}
+_limiters = {}
+_lock = threading.Lock()
+
 
 def register_webhook_callback(func):
     """
@@ -41,13 +56,69 @@ def generate_signature(request_body, secret):
     return hmac_prep.hexdigest()
 
 
-@job('default')
-def send_webhook(event_rule, object_type, event_type, data, timestamp, username, request=None, snapshots=None):
+class DeliveryLimiter:
     """
-    Make a POST request to the defined Webhook
+    Enforce a webhook's maximum concurrency and rate limit across all threads in the current process.
+
+    Parameters:
+        max_concurrency: The maximum number of simultaneous requests (None for no limit)
+        rate_limit: The maximum number of requests per second (None for no limit)
     """
-    webhook = event_rule.action_object
+    def __init__(self, max_concurrency=None, rate_limit=None):
+        self.semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self.interval = 1 / rate_limit if rate_limit else 0
+        self.next_slot = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        if self.semaphore:
+            self.semaphore.acquire()
+        if self.interval:
+            # Reserve the next available time slot, then wait for it
+            with self.lock:
+                now = time.monotonic()
+                slot = max(now, self.next_slot)
+                self.next_slot = slot + self.interval
+            if slot > now:
+                time.sleep(slot - now)
+        return self
+
+    def __exit__(self, *args):
+        if self.semaphore:
+            self.semaphore.release()
+
+
+def get_session(webhook):
+    """
+    Return a pooled requests Session for the given Webhook, reusing connections across deliveries.
+    """
+    key = (webhook.pk, webhook.ssl_verification, webhook.ca_file_path)
+    with _lock:
+        if key not in _sessions:
+            session = requests.Session()
+            session.verify = webhook.ca_file_path or webhook.ssl_verification
+            adapter = HTTPAdapter(pool_maxsize=settings.WEBHOOK_MAX_WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[key] = session
+        return _sessions[key]
+
 
+def get_limiter(webhook):
+    """
+    Return the DeliveryLimiter for the given Webhook.
+    """
+    key = (webhook.pk, webhook.max_concurrency, webhook.rate_limit)
+    with _lock:
+        if key not in _limiters:
+            _limiters[key] = DeliveryLimiter(webhook.max_concurrency, webhook.rate_limit)
+        return _limiters[key]
+
+
+def render_webhook_request(webhook, object_type, event_type, data, timestamp, username, request=None, snapshots=None):
+    """
+    Render the HTTP request parameters (method, URL, headers, and body) for a webhook event.
+    """
     # Prepare context data for headers & body templates
     context = {
         'event': WEBHOOK_EVENT_TYPES.get(event_type, event_type),
@@ -98,17 +169,23 @@ def send_webhook(event_rule, object_type, event_type, data, timestamp, username,
         logger.error(f"Error rendering request body for webhook {webhook}: {e}")
         raise e
 
-    # Prepare the HTTP request
-    url = webhook.render_payload_url(context)
-    params = {
+    logger.info(
+        f"Rendered {webhook.http_method} request for webhook {webhook} ({context['object_type']} {context['event']})"
+    )
+    return {
         'method': webhook.http_method,
-        'url': url,
+        'url': webhook.render_payload_url(context),
         'headers': headers,
         'data': body.encode('utf8'),
     }
-    logger.info(
-        f"Sending {params['method']} request to {params['url']} ({context['object_type']} {context['event']})"
-    )
+
+
+def deliver_webhook(webhook, params):
+    """
+    Send a rendered HTTP request to the receiver of the given Webhook, honoring its delivery limits. Raises
+    RequestException if the request could not be sent or a non-2xx response was received.
+    """
+    logger.info(f"Sending {params['method']} request to {params['url']}")
     logger.debug(params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -121,11 +198,9 @@ def send_webhook(event_rule, object_type, event_type, data, timestamp, username,
         prepared_request.headers['X-Hook-Signature'] = generate_signature(prepared_request.body, webhook.secret)
 
     # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        proxies = resolve_proxies(url=url, context={'client': webhook})
+    session = get_session(webhook)
+    proxies = resolve_proxies(url=params['url'], context={'client': webhook})
+    with get_limiter(webhook):
         response = session.send(prepared_request, proxies=proxies)
 
     if 200 <= response.status_code <= 299:
@@ -135,3 +210,82 @@ def send_webhook(event_rule, object_type, event_type, data, timestamp, username,
     raise requests.exceptions.RequestException(
         f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
     )
+
+
+@job('default')
+def send_webhook(event_rule, object_type, event_type, data, timestamp, username, request=None, snapshots=None):
+    """
+    Make a POST request to the defined Webhook
+    """
+    webhook = event_rule.action_object
+    params = render_webhook_request(
+        webhook, object_type, event_type, data, timestamp, username, request=request, snapshots=snapshots
+    )
+    return deliver_webhook(webhook, params)
+
+
+@job('default')
+def send_webhooks(deliveries):
+    """
+    Deliver a batch of webhook events concurrently. Each delivery is a dictionary of send_webhook() arguments.
+
+    Requests are rendered up front and sent using a pool of WEBHOOK_MAX_WORKERS threads. Events destined for a
+    Webhook with batch_events enabled are combined into a single request per payload URL. Failed deliveries are
+    re-enqueued individually (as send_webhook jobs) if RQ_RETRY_MAX is set. Events whose requests cannot be rendered
+    are logged and skipped, as rendering them again would fail in the same way.
+    """
+    # Render all requests, grouping combinable events by webhook & URL
+    requests_to_send = []
+    batches = {}
+    failed = []
+    render_errors = 0
+    for delivery in deliveries:
+        webhook = delivery['event_rule'].action_object
+        try:
+            params = render_webhook_request(webhook, **{k: v for k, v in delivery.items() if k != 'event_rule'})
+        except (TemplateError, ValueError):
+            # The error has been logged by render_webhook_request()
+            render_errors += 1
+            continue
+        if not webhook.batch_events:
+            requests_to_send.append((webhook, params, [delivery]))
+            continue
+        key = (webhook.pk, params['method'], params['url'])
+        if key not in batches:
+            batches[key] = (webhook, {**params, 'data': []}, [])
+            requests_to_send.append(batches[key])
+        batches[key][1]['data'].append(params['data'])
+        batches[key][2].append(delivery)
+
+    # Combine batched event bodies into a JSON array
+    for webhook, params, batch in batches.values():
+        params['data'] = b'[' + b','.join(params['data']) + b']'
+
+    # Send all requests concurrently
+    with ThreadPoolExecutor(max_workers=settings.WEBHOOK_MAX_WORKERS) as executor:
+        futures = [
+            (executor.submit(deliver_webhook, webhook, params), batch)
+            for webhook, params, batch in requests_to_send
+        ]
+    for future, batch in futures:
+        if exc := future.exception():
+            logger.warning(f"Delivery of {len(batch)} webhook event(s) failed: {exc}")
+            failed.extend(batch)
+
+    if not failed and not render_errors:
+        return f"{len(deliveries)} webhook event(s) delivered in {len(requests_to_send)} request(s)."
+
+    # Retry failed deliveries individually
+    delivered = len(deliveries) - len(failed) - render_errors
+    if failed and (retry := get_rq_retry()):
+        rq_queue = get_queue(get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT))
+        for delivery in failed:
+            rq_queue.enqueue('extras.webhooks.send_webhook', **delivery, retry=retry)
+        return (
+            f"{delivered} webhook event(s) delivered; {len(failed)} re-enqueued for retry; {render_errors} could not "
+            f"be rendered."
+        )
+    raise requests.exceptions.RequestException(
+        f"Failed to deliver {len(failed) + render_errors} of {len(deliveries)} webhook event(s) "
+        f"({render_errors} could not be rendered)."
+    )
@@ -16,6 +16,7 @@ from ipam.fields import IPAddressField, IPNetworkField
 from ipam.lookups import Host
 from ipam.managers import IPAddressManager
 from ipam.querysets import IPRangeQuerySet, PrefixQuerySet
+from ipam.trie import PrefixTrie
 from ipam.validators import DNSValidator
 from netbox.config import get_config
 from netbox.models import OrganizationalModel, PrimaryModel
@@ -43,8 +44,8 @@ class GetAvailablePrefixesMixin:
         if hasattr(self, 'vrf'):
             params['vrf'] = self.vrf
 
-        child_prefixes = Prefix.objects.filter(**params).values_list('prefix', flat=True)
-        return netaddr.IPSet(self.prefix) - netaddr.IPSet(child_prefixes)
+        child_prefixes = Prefix.objects.filter(**params).values_list('pk', 'prefix')
+        return netaddr.IPSet(PrefixTrie(child_prefixes).get_available_prefixes(self.prefix))
 
     def get_first_available_prefix(self):
         """
@@ -596,6 +597,10 @@ class Prefix(ContactsMixin, GetAvailablePrefixesMixin, CachedScopeMixin, Primary
         Determine the utilization of the prefix and return it as a percentage. For Prefixes with a status of
         "container", calculate utilization based on child prefixes. For all others, count child IP addresses.
         """
+        # Return the utilization calculated by prefetch_utilization(), if any
+        if (utilization := getattr(self, '_cached_utilization', None)) is not None:
+            return utilization
+
         if self.mark_utilized:
             return 100
 
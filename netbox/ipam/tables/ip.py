@@ -4,6 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from django_tables2.utils import Accessor
 
 from ipam.models import *
+from ipam.utils import prefetch_utilization
 from netbox.tables import NetBoxTable, OrganizationalModelTable, PrimaryModelTable, columns
 from tenancy.tables import ContactsColumnMixin, TenancyColumnsMixin, TenantColumn
 
@@ -248,6 +249,14 @@ class PrefixTable(TenancyColumnsMixin, ContactsColumnMixin, PrimaryModelTable):
             'class': lambda record: 'success' if not record.pk else '',
         }
 
+    def configure(self, request):
+        super().configure(request)
+
+        # Calculate utilization for the current page of prefixes in bulk (ignoring any available prefixes)
+        if 'utilization' in self.columns.names() and self.columns['utilization'].visible:
+            if page := getattr(self, 'page', None):
+                prefetch_utilization([row.record for row in page.object_list if row.record.pk])
+
 
 #
 # IP ranges
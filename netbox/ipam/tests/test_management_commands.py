@@ -23,7 +23,7 @@ class RebuildPrefixesTestCase(TestCase):
             call_command('rebuild_prefixes', stdout=out)
 
         rebuild_prefixes.assert_called_once_with(None)
-        prefix_model.objects.update.assert_called_once_with(_depth=0, _children=0)
+        prefix_model.objects.update.assert_not_called()
         self.assertIn('Rebuilding 0 prefixes', out.getvalue())
         self.assertIn('Finished.', out.getvalue())
 
@@ -47,6 +47,26 @@ class RebuildPrefixesTestCase(TestCase):
         self.assertEqual(Prefix.objects.get(prefix=IPNetwork('10.0.0.0/24'))._depth, 2)
         self.assertEqual(Prefix.objects.get(prefix=IPNetwork('10.0.0.0/24'))._children, 0)
 
+    def test_rebuild_skips_unchanged_prefixes(self):
+        Prefix.objects.bulk_create(
+            [
+                Prefix(prefix=IPNetwork('10.0.0.0/8')),
+                Prefix(prefix=IPNetwork('10.0.0.0/16')),
+                Prefix(prefix=IPNetwork('10.1.0.0/16')),
+            ]
+        )
+
+        # Prefixes created in bulk have no hierarchy computed
+        out = StringIO()
+        call_command('rebuild_prefixes', stdout=out)
+        self.assertIn('Updated 3 prefixes', out.getvalue())
+        self.assertEqual(Prefix.objects.get(prefix=IPNetwork('10.0.0.0/8'))._children, 2)
+
+        # A second rebuild has nothing to write
+        out = StringIO()
+        call_command('rebuild_prefixes', stdout=out)
+        self.assertIn('Updated 0 prefixes', out.getvalue())
+
     def test_rebuilds_prefix_tree_for_each_vrf(self):
         class FakeVRF:
             pk = 123
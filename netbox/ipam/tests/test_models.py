@@ -9,7 +9,7 @@ from dcim.models import Location, Region, Site, SiteGroup
 from ipam.choices import *
 from ipam.constants import SERVICE_PORT_MAX, SERVICE_PORT_MIN
 from ipam.models import *
-from ipam.utils import rebuild_prefixes
+from ipam.utils import prefetch_utilization, rebuild_prefixes
 from utilities.data import string_to_ranges
 from virtualization.models import VirtualMachine
 
@@ -515,6 +515,26 @@ class PrefixTestCase(TestCase):
 
         self.assertEqual(available_prefixes, missing_prefixes)
 
+    def test_get_available_prefixes_nested_children(self):
+
+        prefixes = Prefix.objects.bulk_create((
+            Prefix(prefix=IPNetwork('10.0.0.0/16')),  # Parent prefix
+            Prefix(prefix=IPNetwork('10.0.0.0/20')),
+            Prefix(prefix=IPNetwork('10.0.0.0/24')),  # Nested within 10.0.0.0/20
+            Prefix(prefix=IPNetwork('10.0.128.0/18')),
+            Prefix(prefix=IPNetwork('10.0.128.0/18')),  # Duplicate
+            Prefix(prefix=IPNetwork('10.1.0.0/24')),  # Outside the parent
+        ))
+        missing_prefixes = IPSet([
+            IPNetwork('10.0.16.0/20'),
+            IPNetwork('10.0.32.0/19'),
+            IPNetwork('10.0.64.0/18'),
+            IPNetwork('10.0.192.0/18'),
+        ])
+        available_prefixes = prefixes[0].get_available_prefixes()
+
+        self.assertEqual(available_prefixes, missing_prefixes)
+
     def test_get_available_ips(self):
 
         parent_prefix = Prefix.objects.create(prefix=IPNetwork('10.0.0.0/28'))
@@ -1098,6 +1118,45 @@ class PrefixTestCase(TestCase):
         # Union is .10-.24 => 15 hosts, not 20.
         self.assertEqual(prefix.get_utilization(), 15 / 254 * 100)
 
+    def test_prefetch_utilization(self):
+        vrf = VRF.objects.create(name='VRF 1')
+        Prefix.objects.bulk_create((
+            Prefix(prefix=IPNetwork('10.0.0.0/16'), status=PrefixStatusChoices.STATUS_CONTAINER),
+            Prefix(prefix=IPNetwork('10.0.0.0/24')),
+            Prefix(prefix=IPNetwork('10.0.1.0/24'), vrf=vrf),
+            Prefix(prefix=IPNetwork('10.0.2.0/24'), mark_utilized=True),
+            Prefix(prefix=IPNetwork('10.0.0.0/26')),
+            Prefix(prefix=IPNetwork('2001:db8::/126')),
+        ))
+        IPRange.objects.create(
+            start_address=IPNetwork('10.0.0.10/24'),
+            end_address=IPNetwork('10.0.0.19/24'),
+            mark_utilized=True,
+        )
+        IPRange.objects.create(
+            start_address=IPNetwork('10.0.0.15/24'),
+            end_address=IPNetwork('10.0.0.24/24'),
+            mark_utilized=True,
+        )
+        IPAddress.objects.bulk_create((
+            IPAddress(address=IPNetwork('10.0.0.1/24')),
+            IPAddress(address=IPNetwork('10.0.0.1/32')),
+            IPAddress(address=IPNetwork('10.0.0.12/24')),
+            IPAddress(address=IPNetwork('10.0.0.100/24')),
+            IPAddress(address=IPNetwork('10.0.1.1/24'), vrf=vrf),
+            IPAddress(address=IPNetwork('10.0.1.2/24')),
+            IPAddress(address=IPNetwork('2001:db8::1/126')),
+        ))
+
+        # Calculate utilization individually and in bulk
+        expected = [prefix.get_utilization() for prefix in Prefix.objects.order_by('pk')]
+        prefixes = list(Prefix.objects.order_by('pk'))
+        with self.assertNumQueries(3):
+            prefetch_utilization(prefixes)
+        with self.assertNumQueries(0):
+            self.assertEqual([prefix.get_utilization() for prefix in prefixes], expected)
+        self.assertEqual(prefixes[1].get_utilization(), 17 / 254 * 100)
+
     def test_get_utilization_fully_utilized_range(self):
         prefix = Prefix.objects.create(
             prefix=IPNetwork('192.0.2.0/24'),
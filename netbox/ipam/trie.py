@@ -0,0 +1,148 @@
+from array import array
+from bisect import bisect_left
+
+import netaddr
+
+__all__ = (
+    'PrefixTrie',
+)
+
+ADDRESS_WIDTH = {
+    4: 32,
+    6: 128,
+}
+
+
+def iter_range_cidrs(version, first, last):
+    """
+    Yield the minimal list of CIDRs covering the integer range [first, last] for the given IP version.
+    """
+    width = ADDRESS_WIDTH[version]
+    while first <= last:
+        # The largest block aligned on `first` which does not extend beyond `last`
+        size = min(
+            (first & -first).bit_length() - 1 if first else width,
+            (last - first + 1).bit_length() - 1
+        )
+        yield netaddr.IPNetwork(f'{netaddr.IPAddress(first, version)}/{width - size}')
+        first += 1 << size
+
+
+class PrefixTrie:
+    """
+    A compact, read-only trie of IPv4 and/or IPv6 prefixes, built in a single pass.
+
+    Each prefix is keyed by its integer (version, first address, prefix length), and nodes are stored in pre-order so
+    that every node is immediately followed by all of its descendants. Only populated prefixes are stored: a node's
+    parent is the nearest prefix which contains it. Duplicate prefixes share a single node.
+
+    :param prefixes: An iterable of (key, prefix) two-tuples, where key identifies the prefix (e.g. its primary key)
+    """
+    def __init__(self, prefixes):
+        nodes = {}
+        for key, prefix in prefixes:
+            if not isinstance(prefix, netaddr.IPNetwork):
+                prefix = netaddr.IPNetwork(prefix)
+            nodes.setdefault((prefix.version, prefix.first, prefix.prefixlen), []).append(key)
+
+        self.keys = []
+        self.versions = array('B')
+        self.prefixlens = array('B')
+        self.firsts = []
+        self.lasts = []
+        self.parents = array('q')
+        self.depths = array('q')
+        self.sizes = array('q')
+
+        stack = []
+        for (version, first, prefixlen), keys in sorted(nodes.items()):
+            # Close any nodes which do not contain this prefix. Because nodes are sorted, a node contains the prefix
+            # if and only if it shares its version and ends at or beyond the prefix's first address.
+            while stack and (self.versions[stack[-1]] != version or self.lasts[stack[-1]] < first):
+                self._close(stack.pop())
+
+            self.keys.append(keys)
+            self.versions.append(version)
+            self.prefixlens.append(prefixlen)
+            self.firsts.append(first)
+            self.lasts.append(first + (1 << (ADDRESS_WIDTH[version] - prefixlen)) - 1)
+            self.parents.append(stack[-1] if stack else -1)
+            self.depths.append(len(stack))
+            self.sizes.append(0)
+            stack.append(len(self.keys) - 1)
+
+        while stack:
+            self._close(stack.pop())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _close(self, index):
+        # All nodes appended since this one are its descendants
+        self.sizes[index] = len(self.keys) - index - 1
+
+    def get_prefix(self, index):
+        """
+        Return the prefix stored at the given node as a netaddr.IPNetwork.
+        """
+        version = self.versions[index]
+        return netaddr.IPNetwork(f'{netaddr.IPAddress(self.firsts[index], version)}/{self.prefixlens[index]}')
+
+    def get_hierarchy(self):
+        """
+        Yield a (keys, depth, children) three-tuple for each node, where depth is the number of unique prefixes
+        containing the node and children is the number of unique prefixes contained by it.
+        """
+        yield from zip(self.keys, self.depths, self.sizes)
+
+    def get_children(self, index=None):
+        """
+        Yield the indexes of the immediate children of the given node (or the root nodes if no index is specified).
+        """
+        if index is None:
+            i, end = 0, len(self) - 1
+        else:
+            i, end = index + 1, index + self.sizes[index]
+        while i <= end:
+            yield i
+            i += self.sizes[i] + 1
+
+    def _iter_covering(self, prefix):
+        """
+        Yield the indexes of the outermost nodes contained within (but not equal to) the given prefix, in order.
+        """
+        version, first, last = prefix.version, prefix.first, prefix.last
+        i = bisect_left(
+            range(len(self)),
+            (version, first, prefix.prefixlen),
+            key=lambda n: (self.versions[n], self.firsts[n], self.prefixlens[n])
+        )
+        # Skip the node for the prefix itself, if one exists
+        if i < len(self) and self.firsts[i] == first and self.prefixlens[i] == prefix.prefixlen and \
+                self.versions[i] == version:
+            i += 1
+        while i < len(self) and self.versions[i] == version and self.firsts[i] <= last:
+            yield i
+            i += self.sizes[i] + 1
+
+    def get_covered_size(self, prefix):
+        """
+        Return the number of addresses within the given prefix which are covered by its child prefixes.
+        """
+        prefix = netaddr.IPNetwork(prefix)
+        return sum(self.lasts[i] - self.firsts[i] + 1 for i in self._iter_covering(prefix))
+
+    def get_available_prefixes(self, prefix):
+        """
+        Return the list of CIDRs within the given prefix which are not covered by any of its child prefixes.
+        """
+        prefix = netaddr.IPNetwork(prefix)
+        available = []
+        cursor = prefix.first
+        for i in self._iter_covering(prefix):
+            if self.firsts[i] > cursor:
+                available.extend(iter_range_cidrs(prefix.version, cursor, self.firsts[i] - 1))
+            cursor = self.lasts[i] + 1
+        if cursor <= prefix.last:
+            available.extend(iter_range_cidrs(prefix.version, cursor, prefix.last))
+        return available
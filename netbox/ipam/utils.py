@@ -1,10 +1,16 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
 
 import netaddr
 from django.apps import apps
+from django.db import connection
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
+from .choices import PrefixStatusChoices
 from .constants import *
+from .trie import PrefixTrie
 
 __all__ = (
     'AvailableIPSpace',
@@ -12,9 +18,16 @@ __all__ = (
     'add_requested_prefixes',
     'annotate_ip_space',
     'get_next_available_prefix',
+    'prefetch_utilization',
     'rebuild_prefixes',
 )
 
+# The number of prefixes read or written per query when rebuilding the prefix hierarchy
+PREFIX_REBUILD_BATCH_SIZE = 1000
+
+# The maximum number of address segments for which child IPs are counted in a single query
+UTILIZATION_SEGMENT_BATCH_SIZE = 5000
+
 
 @dataclass
 class AvailableIPSpace:
@@ -53,8 +66,8 @@ def add_requested_prefixes(parent, prefix_list, show_available=True, show_assign
         # IMPORTANT: These are unsaved Prefix instances (pk=None). If this is ever changed to use
         # saved Prefix instances with real pks, bulk delete will fail for mixed-type selections
         # due to single-model form validation. See: https://github.com/netbox-community/netbox/issues/21176
-        available_prefixes = netaddr.IPSet(parent) ^ netaddr.IPSet([p.prefix for p in prefix_list])
-        available_prefixes = [Prefix(prefix=p, status=None) for p in available_prefixes.iter_cidrs()]
+        trie = PrefixTrie((p.pk, p.prefix) for p in prefix_list)
+        available_prefixes = [Prefix(prefix=p, status=None) for p in trie.get_available_prefixes(parent)]
         child_prefixes = child_prefixes + available_prefixes
 
     # Add assigned prefixes to the table if requested
@@ -200,65 +213,136 @@ def add_available_vlans(vlans, vlan_group):
 
 def rebuild_prefixes(vrf):
     """
-    Rebuild the prefix hierarchy for all prefixes in the specified VRF (or global table).
+    Rebuild the prefix hierarchy for all prefixes in the specified VRF (or global table). The hierarchy is computed
+    in memory from a single query, and only prefixes whose depth or children count has changed are written back.
+    Returns the number of prefixes updated.
     """
     Prefix = apps.get_model('ipam', 'Prefix')
-    prefix_queryset = Prefix.objects.filter(vrf=vrf)
-
-    def contains(parent, child):
-        return child in parent and child != parent
-
-    def push_to_stack(prefix):
-        # Increment child count on parent nodes
-        for n in stack:
-            n['children'] += 1
-        stack.append({
-            'pk': [prefix['pk']],
-            'prefix': prefix['prefix'],
-            'children': 0,
-        })
+    queryset = Prefix.objects.filter(vrf=vrf).order_by().values_list('pk', 'prefix', '_depth', '_children')
 
-    stack = []
-    update_queue = []
-    prefixes = prefix_queryset.order_by('prefix', 'pk').values('pk', 'prefix')
+    prefixes = {}
+    current = {}
+    for pk, prefix, depth, children in queryset.iterator(chunk_size=PREFIX_REBUILD_BATCH_SIZE):
+        prefixes[pk] = prefix
+        current[pk] = (depth, children)
+    trie = PrefixTrie(prefixes.items())
 
-    # Iterate through all Prefixes in the table, growing and shrinking the stack as we go
-    for p in prefixes:
+    update_queue = [
+        Prefix(pk=pk, _depth=depth, _children=children)
+        for pks, depth, children in trie.get_hierarchy()
+        for pk in pks
+        if current[pk] != (depth, children)
+    ]
+    Prefix.objects.bulk_update(update_queue, ['_depth', '_children'], batch_size=PREFIX_REBUILD_BATCH_SIZE)
 
-        # Grow the stack if this is a child of the most recent prefix
-        if not stack or contains(stack[-1]['prefix'], p['prefix']):
-            push_to_stack(p)
+    return len(update_queue)
 
-        # Handle duplicate prefixes
-        elif stack[-1]['prefix'] == p['prefix']:
-            stack[-1]['pk'].append(p['pk'])
 
-        # If this is a sibling or parent of the most recent prefix, pop nodes from the
-        # stack until we reach a parent prefix (or the root)
+def prefetch_utilization(prefixes):
+    """
+    Calculate the utilization of each of the given Prefixes in bulk, caching the result on each instance for
+    Prefix.get_utilization(). A constant number of queries is used regardless of the number of prefixes: one to find
+    the utilized IP ranges within non-container prefixes, one to count their child IP addresses, and one to find the
+    child prefixes of container prefixes.
+    """
+    Prefix = apps.get_model('ipam', 'Prefix')
+    IPRange = apps.get_model('ipam', 'IPRange')
+    IPAddress = apps.get_model('ipam', 'IPAddress')
+
+    containers = []
+    networks = []
+    for prefix in prefixes:
+        if prefix.mark_utilized:
+            prefix._cached_utilization = 100
+        elif prefix.status == PrefixStatusChoices.STATUS_CONTAINER:
+            containers.append(prefix)
         else:
-            while stack and not contains(stack[-1]['prefix'], p['prefix']):
-                node = stack.pop()
-                for pk in node['pk']:
-                    update_queue.append(
-                        Prefix(pk=pk, _depth=len(stack), _children=node['children'])
-                    )
-            push_to_stack(p)
-
-        # Flush the update queue once it reaches 100 Prefixes
-        if len(update_queue) >= 100:
-            Prefix.objects.bulk_update(update_queue, ['_depth', '_children'])
-            update_queue = []
-
-    # Clear out any prefixes remaining in the stack
-    while stack:
-        node = stack.pop()
-        for pk in node['pk']:
-            update_queue.append(
-                Prefix(pk=pk, _depth=len(stack), _children=node['children'])
+            networks.append(prefix)
+
+    # Container utilization is the portion of the prefix covered by its child prefixes
+    if containers:
+        query = Q()
+        for prefix in containers:
+            query |= Q(vrf=prefix.vrf_id, prefix__net_contained=str(prefix.prefix))
+        children = defaultdict(list)
+        for vrf_id, child in Prefix.objects.filter(query).order_by().values_list('vrf_id', 'prefix'):
+            children[vrf_id].append(child)
+        tries = {vrf_id: PrefixTrie(enumerate(child_prefixes)) for vrf_id, child_prefixes in children.items()}
+        for prefix in containers:
+            covered_size = tries[prefix.vrf_id].get_covered_size(prefix.prefix) if prefix.vrf_id in tries else 0
+            prefix._cached_utilization = min(float(covered_size) / prefix.prefix.size * 100, 100)
+
+    if not networks:
+        return
+
+    # Find all utilized IP ranges within each prefix, grouped by VRF and family and sorted by start address
+    query = Q()
+    for prefix in networks:
+        bounds = (
+            netaddr.IPAddress(prefix.prefix.first, version=prefix.prefix.version),
+            netaddr.IPAddress(prefix.prefix.last, version=prefix.prefix.version),
+        )
+        query |= Q(vrf=prefix.vrf_id, start_address__host_between=bounds, end_address__host_between=bounds)
+    ranges = defaultdict(list)
+    utilized_ranges = IPRange.objects.filter(query, mark_utilized=True).order_by()
+    for vrf_id, start_address, end_address in utilized_ranges.values_list('vrf_id', 'start_address', 'end_address'):
+        ranges[(vrf_id, start_address.version)].append((int(start_address.ip), int(end_address.ip)))
+    for intervals in ranges.values():
+        intervals.sort()
+
+    # Identify the address segments within each prefix not covered by a utilized range. Child IPs are counted only
+    # within these segments.
+    utilized_counts = {}
+    segments = []
+    for i, prefix in enumerate(networks):
+        first, last = prefix.prefix.first, prefix.prefix.last
+        intervals = ranges.get((prefix.vrf_id, prefix.prefix.version), [])
+        starts = [start for start, end in intervals]
+        next_address = first
+        utilized_count = 0
+        for start, end in intervals[bisect_left(starts, first):bisect_right(starts, last)]:
+            if end > last or end < next_address:
+                continue
+            if start > next_address:
+                segments.append((i, prefix.vrf_id, prefix.prefix.version, next_address, start - 1))
+            utilized_count += end - max(start, next_address) + 1
+            next_address = end + 1
+        if next_address <= last:
+            segments.append((i, prefix.vrf_id, prefix.prefix.version, next_address, last))
+        utilized_counts[i] = utilized_count
+
+    child_ip_counts = defaultdict(int)
+    for offset in range(0, len(segments), UTILIZATION_SEGMENT_BATCH_SIZE):
+        batch = segments[offset:offset + UTILIZATION_SEGMENT_BATCH_SIZE]
+        params = []
+        for i, vrf_id, version, start, end in batch:
+            params.extend([
+                i,
+                vrf_id,
+                str(netaddr.IPAddress(start, version=version)),
+                str(netaddr.IPAddress(end, version=version)),
+            ])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT segment.id, COUNT(DISTINCT CAST(HOST(ip."address") AS inet)) '
+                f'FROM (VALUES {", ".join(["(%s, %s::bigint, %s::inet, %s::inet)"] * len(batch))}) '
+                'AS segment(id, vrf_id, start_address, end_address) '
+                f'JOIN "{IPAddress._meta.db_table}" ip '
+                'ON CAST(HOST(ip."address") AS inet) BETWEEN segment.start_address AND segment.end_address '
+                'AND ip."vrf_id" IS NOT DISTINCT FROM segment.vrf_id '
+                'GROUP BY segment.id',
+                params
             )
+            for i, count in cursor.fetchall():
+                child_ip_counts[i] += count
 
-    # Final flush of any remaining Prefixes
-    Prefix.objects.bulk_update(update_queue, ['_depth', '_children'])
+    for i, prefix in enumerate(networks):
+        prefix_size = prefix._get_utilization_denominator()
+        if utilized_counts[i] >= prefix_size:
+            prefix._cached_utilization = 100
+        else:
+            utilization = float(utilized_counts[i] + child_ip_counts[i]) / prefix_size * 100
+            prefix._cached_utilization = min(utilization, 100)
 
 
 def get_next_available_prefix(ipset, prefix_size):
@@ -1,5 +1,6 @@
 import warnings
 
+from django.conf import settings
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import ValidationError
@@ -8,6 +9,16 @@ from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from netbox.api.exceptions import QuerySetNotOrdered
 from netbox.config import get_config
+from netbox.constants import COUNT_MODE_EXACT, COUNT_MODES
+from utilities.keyset import (
+    apply_keyset_ordering,
+    decode_cursor,
+    encode_cursor,
+    filter_after,
+    get_keyset_ordering,
+    get_keyset_values,
+)
+from utilities.query import get_queryset_count
 
 
 class NetBoxPagination(LimitOffsetPagination):
@@ -25,18 +36,34 @@ class NetBoxPagination(LimitOffsetPagination):
     to ensure pagination is consistent. This approach is less human-friendly but offers superior performance to
     offset-based pagination. In cursor mode, `count` is omitted (null) for performance.
 
-    Offset- and cursor-based pagination are mutually exclusive: Only `offset` _or_ `start` is permitted for a request.
+    Keyset pagination employs `cursor` and (optionally) `limit` parameters to page through results following any
+    ordering. `cursor` is an opaque, signed token encoding the ordering values of the last object on the previous page,
+    as provided in the `next` link; an empty cursor begins with the first object. Each page is retrieved by filtering on
+    the ordering fields rather than skipping objects, so every page costs the same to retrieve. As with cursor-based
+    pagination, `count` is omitted (null) and only a `next` link is provided.
+
+    Offset-, cursor-, and keyset-based pagination are mutually exclusive: Only one of `offset`, `start`, or `cursor`
+    is permitted for a request.
 
     `limit` may be set to zero (`?limit=0`). This returns all objects matching a query, but retains the same format as
     a paginated request. The limit can only be disabled if `MAX_PAGE_SIZE` has been set to 0 or None.
+
+    In offset mode, the means of determining `count` may be selected using the `count_mode` parameter (defaulting to
+    PAGINATION_COUNT_MODE): `exact`, `estimate`, `cached`, or `none`. For all modes other than `exact`, the presence of
+    a next page is determined by fetching one additional result, and `count` may be approximate (or null).
     """
     start_query_param = 'start'
+    cursor_query_param = 'cursor'
+    count_mode_query_param = 'count_mode'
 
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
         self.start = None
         self._page_length = 0
         self._last_pk = None
+        self._has_more = None
+        self.cursor = None
+        self._next_cursor = None
 
     def paginate_queryset(self, queryset, request, view=None):
 
@@ -47,9 +74,23 @@ class NetBoxPagination(LimitOffsetPagination):
             )
 
         self.start = self.get_start(request)
+        self.cursor = request.query_params.get(self.cursor_query_param)
         self.limit = self.get_limit(request)
         self.request = request
 
+        # Keyset-based pagination
+        if self.cursor is not None:
+            if self.start is not None or self.offset_query_param in request.query_params:
+                raise ValidationError(
+                    _("'{cursor_param}' cannot be specified in conjunction with '{start_param}' or '{offset_param}'.")
+                    .format(
+                        cursor_param=self.cursor_query_param,
+                        start_param=self.start_query_param,
+                        offset_param=self.offset_query_param,
+                    )
+                )
+            return self.paginate_keyset(queryset)
+
         # Cursor-based pagination
         if self.start is not None:
             if self.offset_query_param in request.query_params:
@@ -75,17 +116,28 @@ class NetBoxPagination(LimitOffsetPagination):
             return results
 
         # Offset-based pagination
+        count_mode = self.get_count_mode(request)
         if isinstance(queryset, QuerySet):
-            self.count = self.get_queryset_count(queryset)
+            self.count = get_queryset_count(queryset, count_mode, count=lambda: self.get_queryset_count(queryset))
         else:
             # We're dealing with an iterable, not a QuerySet
+            count_mode = COUNT_MODE_EXACT
             self.count = len(queryset)
 
         self.offset = self.get_offset(request)
 
-        if self.limit and self.count > self.limit and self.template is not None:
+        if self.limit and self.count is not None and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
+        if count_mode != COUNT_MODE_EXACT:
+            # The count may be approximate (or absent), so fetch one extra result to determine whether another page
+            # follows this one
+            if not self.limit:
+                return list(queryset[self.offset:])
+            results = list(queryset[self.offset:self.offset + self.limit + 1])
+            self._has_more = len(results) > self.limit
+            return results[:self.limit]
+
         if self.count == 0 or self.offset > self.count:
             return list()
 
@@ -93,6 +145,39 @@ class NetBoxPagination(LimitOffsetPagination):
             return list(queryset[self.offset:self.offset + self.limit])
         return list(queryset[self.offset:])
 
+    def paginate_keyset(self, queryset):
+        if not isinstance(queryset, QuerySet):
+            raise ValidationError(
+                _("'{param}' is not supported for this endpoint.").format(param=self.cursor_query_param)
+            )
+        try:
+            ordering = get_keyset_ordering(queryset)
+        except ValueError as e:
+            raise ValidationError(str(e))
+        queryset = apply_keyset_ordering(queryset, ordering)
+
+        if self.cursor:
+            try:
+                values = decode_cursor(queryset, ordering, self.cursor)
+            except ValueError as e:
+                raise ValidationError(
+                    _("Invalid '{param}' parameter: {error}").format(param=self.cursor_query_param, error=e)
+                )
+            queryset = filter_after(queryset, ordering, values)
+
+        self.count = None
+        self.offset = 0
+
+        if not self.limit:
+            return list(queryset)
+
+        # Fetch one extra result to determine whether another page follows this one
+        results = list(queryset[:self.limit + 1])
+        if len(results) > self.limit:
+            results = results[:self.limit]
+            self._next_cursor = encode_cursor(queryset, ordering, get_keyset_values(queryset, ordering, results[-1]))
+        return results
+
     def get_start(self, request):
         try:
             value = int(request.query_params[self.start_query_param])
@@ -136,6 +221,19 @@ class NetBoxPagination(LimitOffsetPagination):
 
         return max_limit
 
+    def get_count_mode(self, request):
+        count_mode = request.query_params.get(self.count_mode_query_param)
+        if count_mode is None:
+            return settings.PAGINATION_COUNT_MODE
+        if count_mode not in COUNT_MODES:
+            raise ValidationError(
+                _("Invalid '{param}' parameter: must be one of {modes}.").format(
+                    param=self.count_mode_query_param,
+                    modes=', '.join(COUNT_MODES),
+                )
+            )
+        return count_mode
+
     def get_queryset_count(self, queryset):
         return queryset.count()
 
@@ -145,6 +243,14 @@ class NetBoxPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset mode
+        if self.cursor is not None:
+            if self._next_cursor is None:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.cursor_query_param, self._next_cursor)
+            return replace_query_param(url, self.limit_query_param, self.limit)
+
         # Cursor mode
         if self.start is not None:
             if self._page_length < self.limit:
@@ -155,6 +261,14 @@ class NetBoxPagination(LimitOffsetPagination):
             url = remove_query_param(url, self.offset_query_param)
             return url
 
+        # Count is approximate or absent
+        if self._has_more is not None:
+            if not self._has_more:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -163,8 +277,8 @@ class NetBoxPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
-        # Cursor mode: forward-only
-        if self.start is not None:
+        # Cursor & keyset modes: forward-only
+        if self.start is not None or self.cursor is not None:
             return None
 
         return super().get_previous_link()
@@ -183,6 +297,32 @@ class NetBoxPagination(LimitOffsetPagination):
                 'type': 'integer',
             },
         })
+        parameters.append({
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': (
+                'Keyset pagination: return results following the opaque cursor provided in the previous page\'s next '
+                'link, in any ordering. An empty value returns the first page. Mutually exclusive with offset and '
+                'start.'
+            ),
+            'schema': {
+                'type': 'string',
+            },
+        })
+        parameters.append({
+            'name': self.count_mode_query_param,
+            'required': False,
+            'in': 'query',
+            'description': (
+                'Offset-based pagination: the means of determining the total count of results. Counts other than '
+                'exact may be approximate or null.'
+            ),
+            'schema': {
+                'type': 'string',
+                'enum': list(COUNT_MODES),
+            },
+        })
         return parameters
 
 
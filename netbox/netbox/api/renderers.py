@@ -1,7 +1,10 @@
-from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
 
 __all__ = (
+    'CSVStreamingRenderer',
     'FormlessBrowsableAPIRenderer',
+    'NDJSONStreamingRenderer',
+    'StreamingRenderer',
     'TextRenderer',
 )
 
@@ -26,3 +29,27 @@ class TextRenderer(BaseRenderer):
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         return str(data)
+
+
+class StreamingRenderer(JSONRenderer):
+    """
+    Base class for formats in which list views stream all matching objects (see StreamingExportMixin). Only the
+    format is negotiated: objects are streamed by the view, and any other responses (such as errors) are rendered
+    as JSON.
+    """
+
+
+class NDJSONStreamingRenderer(StreamingRenderer):
+    """
+    Stream objects as newline-delimited JSON.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class CSVStreamingRenderer(StreamingRenderer):
+    """
+    Stream objects as CSV.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
@@ -19,7 +19,9 @@ class WritableNestedSerializer(BaseModelSerializer):
         queryset = self.Meta.model.objects.all()
         request = self.context.get('request')
         user = request.user if request else None
-        return get_related_object_by_attrs(queryset, data, user=user)
+        return get_related_object_by_attrs(
+            queryset, data, user=user, related_objects=self.context.get('related_objects')
+        )
 
 
 # Declared here for use by PrimaryModelSerializer
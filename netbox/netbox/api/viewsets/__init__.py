@@ -11,9 +11,14 @@ from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from core.changelog import buffered_change_logging
 from netbox.api.serializers.features import ChangeLogMessageSerializer
 from netbox.constants import ADVISORY_LOCK_KEYS
-from utilities.api import get_annotations_for_serializer, get_prefetches_for_serializer
+from utilities.api import (
+    get_annotations_for_serializer,
+    get_prefetches_for_serializer,
+    resolve_related_objects,
+)
 from utilities.exceptions import AbortRequest, PreconditionFailed
 from utilities.query import reapply_model_ordering
 
@@ -149,6 +154,7 @@ class BaseViewSet(GenericViewSet):
 class NetBoxReadOnlyModelViewSet(
     ETagMixin,
     mixins.CustomFieldsMixin,
+    mixins.StreamingExportMixin,
     mixins.ExportTemplatesMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.ListModelMixin,
@@ -163,6 +169,7 @@ class NetBoxModelViewSet(
     mixins.BulkDestroyModelMixin,
     mixins.ObjectValidationMixin,
     mixins.CustomFieldsMixin,
+    mixins.StreamingExportMixin,
     mixins.ExportTemplatesMixin,
     drf_mixins.CreateModelMixin,
     drf_mixins.RetrieveModelMixin,
@@ -174,6 +181,9 @@ class NetBoxModelViewSet(
     """
     Extend DRF's ModelViewSet to support bulk update and delete functions.
     """
+    # Related objects resolved in advance for a bulk create or update (see resolve_related_objects())
+    related_objects = None
+
     def get_object_with_snapshot(self):
         """
         Save a pre-change snapshot of the object immediately after retrieving it. This snapshot will be used to
@@ -195,6 +205,21 @@ class NetBoxModelViewSet(
 
         return super().get_serializer(*args, **kwargs)
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        if self.related_objects is not None:
+            context['related_objects'] = self.related_objects
+
+        return context
+
+    def resolve_related_objects(self, data):
+        """
+        Resolve the related objects referenced by all objects being created or updated in bulk at once, rather than
+        as each object is validated.
+        """
+        self.related_objects = resolve_related_objects(self.get_serializer(), data, self.request.user)
+
     def dispatch(self, request, *args, **kwargs):
         logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
 
@@ -226,6 +251,8 @@ class NetBoxModelViewSet(
     # Creates
 
     def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            self.resolve_related_objects(request.data)
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         bulk_create = getattr(serializer, 'many', False)
@@ -261,7 +288,7 @@ class NetBoxModelViewSet(
 
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic(using=router.db_for_write(model)):
+            with transaction.atomic(using=router.db_for_write(model)), buffered_change_logging():
                 instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
@@ -2,12 +2,16 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import router, transaction
 from django.http import Http404
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from core.changelog import buffered_change_logging
 from core.models import ObjectType
 from extras.models import ExportTemplate
+from netbox.api.renderers import CSVStreamingRenderer, NDJSONStreamingRenderer, StreamingRenderer
 from netbox.api.serializers import BulkOperationSerializer
 from netbox.api.serializers.bulk import get_bulk_update_serializer_class
+from utilities.export import stream_serialized_csv_response, stream_serialized_ndjson_response
 
 __all__ = (
     'BulkDestroyModelMixin',
@@ -16,6 +20,7 @@ __all__ = (
     'ExportTemplatesMixin',
     'ObjectValidationMixin',
     'SequentialBulkCreatesMixin',
+    'StreamingExportMixin',
 )
 
 
@@ -54,6 +59,38 @@ class ExportTemplatesMixin:
         return super().list(request, *args, **kwargs)
 
 
+class StreamingExportMixin:
+    """
+    Enable list views to stream all matching objects as newline-delimited JSON or CSV, selected by the `format` query
+    parameter (e.g. `?format=ndjson`) or the Accept header. Streamed results are not paginated or counted: objects are
+    retrieved and serialized in chunks, so that memory usage remains constant regardless of the number of objects.
+    """
+    streaming_renderer_classes = (NDJSONStreamingRenderer, CSVStreamingRenderer)
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if self.action == 'list':
+            renderers.extend(renderer() for renderer in self.streaming_renderer_classes)
+        return renderers
+
+    def list(self, request, *args, **kwargs):
+        if isinstance(request.accepted_renderer, StreamingRenderer) and 'export' not in request.GET:
+            queryset = self.filter_queryset(self.get_queryset())
+            if isinstance(request.accepted_renderer, CSVStreamingRenderer):
+                return stream_serialized_csv_response(queryset, self.get_serializer)
+            return stream_serialized_ndjson_response(queryset, self.get_serializer)
+
+        return super().list(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Any response which is not streamed (e.g. an error) is rendered as JSON
+        renderer = getattr(request, 'accepted_renderer', None)
+        if isinstance(response, Response) and isinstance(renderer, StreamingRenderer):
+            request.accepted_renderer = JSONRenderer()
+            request.accepted_media_type = JSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
 class SequentialBulkCreatesMixin:
     """
     Perform bulk creation of new objects sequentially, rather than all at once. This ensures that any validation
@@ -61,7 +98,7 @@ class SequentialBulkCreatesMixin:
     appropriately.
     """
     def create(self, request, *args, **kwargs):
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), buffered_change_logging():
             if not isinstance(request.data, list):
                 # Creating a single object
                 return super().create(request, *args, **kwargs)
@@ -112,6 +149,9 @@ class BulkUpdateModelMixin:
             obj.pop('id'): obj for obj in request.data
         }
 
+        # Resolve the related objects referenced by all objects at once
+        self.resolve_related_objects(list(update_data.values()))
+
         object_pks = self.perform_bulk_update(qs, update_data, partial=partial)
 
         # Prefetch related objects for all updated instances
@@ -122,7 +162,7 @@ class BulkUpdateModelMixin:
 
     def perform_bulk_update(self, objects, update_data, partial):
         updated_pks = []
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), buffered_change_logging():
             for obj in objects:
                 data = update_data.get(obj.id)
                 if hasattr(obj, 'snapshot'):
@@ -185,7 +225,7 @@ class BulkDestroyModelMixin:
 
     def perform_bulk_destroy(self, objects, changelog_messages=None):
         changelog_messages = changelog_messages or {}
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), buffered_change_logging():
             for obj in objects:
                 if hasattr(obj, 'snapshot'):
                     obj.snapshot()
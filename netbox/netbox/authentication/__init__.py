@@ -10,11 +10,10 @@ from django.core.exceptions import ImproperlyConfigured
 from django.db.models import Q
 
 from netbox.settings_utils import load_ldap_config
-from users.constants import CONSTRAINT_TOKEN_USER
 from users.models import Group, ObjectPermission, User
 from utilities.permissions import (
+    get_constraint_filter,
     permission_is_exempt,
-    qs_filter_from_constraints,
     resolve_permission,
     resolve_permission_type,
 )
@@ -152,10 +151,7 @@ class ObjectPermissionMixin:
             return False
 
         # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            CONSTRAINT_TOKEN_USER: user_obj,
-        }
-        qs_filter = qs_filter_from_constraints(object_permissions[perm], tokens)
+        qs_filter, _ = get_constraint_filter(user_obj, perm, permission_model)
 
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
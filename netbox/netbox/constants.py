@@ -18,6 +18,24 @@ RQ_QUEUE_DEFAULT = 'default'
 RQ_QUEUE_HIGH = 'high'
 RQ_QUEUE_LOW = 'low'
 
+# Search indexing modes (see SEARCH_INDEXING_MODE)
+SEARCH_INDEXING_SYNC = 'sync'
+SEARCH_INDEXING_DEFERRED = 'deferred'
+SEARCH_INDEXING_BACKGROUND = 'background'
+SEARCH_INDEXING_MODES = (SEARCH_INDEXING_SYNC, SEARCH_INDEXING_DEFERRED, SEARCH_INDEXING_BACKGROUND)
+
+# Counter cache modes (see COUNTER_CACHE_MODE)
+COUNTER_CACHE_IMMEDIATE = 'immediate'
+COUNTER_CACHE_DEFERRED = 'deferred'
+COUNTER_CACHE_MODES = (COUNTER_CACHE_IMMEDIATE, COUNTER_CACHE_DEFERRED)
+
+# Object count modes for paginated lists (see PAGINATION_COUNT_MODE)
+COUNT_MODE_EXACT = 'exact'
+COUNT_MODE_ESTIMATE = 'estimate'
+COUNT_MODE_CACHED = 'cached'
+COUNT_MODE_NONE = 'none'
+COUNT_MODES = (COUNT_MODE_EXACT, COUNT_MODE_ESTIMATE, COUNT_MODE_CACHED, COUNT_MODE_NONE)
+
 # Keys for PostgreSQL advisory locks. These are arbitrary bigints used by the advisory_lock
 # context manager. When a lock is acquired, one of these keys will be used to identify said lock.
 # When adding a new key, pick something arbitrary and unique so that it is easily searchable in
@@ -1,12 +1,20 @@
 from contextvars import ContextVar
 
 __all__ = (
+    'changelog_buffer',
+    'counter_queue',
     'current_request',
     'events_queue',
+    'provisioning_queue',
     'query_cache',
+    'search_queue',
 )
 
 
+changelog_buffer = ContextVar('changelog_buffer', default=None)
+counter_queue = ContextVar('counter_queue', default=None)
 current_request = ContextVar('current_request', default=None)
 events_queue = ContextVar('events_queue', default=dict())
+provisioning_queue = ContextVar('provisioning_queue', default=None)
 query_cache = ContextVar('query_cache', default=None)
+search_queue = ContextVar('search_queue', default=None)
@@ -1,9 +1,15 @@
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
 
 from extras.events import flush_events
-from netbox.context import current_request, events_queue, query_cache
+from netbox.constants import COUNTER_CACHE_IMMEDIATE, SEARCH_INDEXING_SYNC
+from netbox.context import counter_queue, current_request, events_queue, query_cache, search_queue
 from netbox.utils import register_request_processor
+from utilities.counters import flush_counter_queue
 
 
 @register_request_processor
@@ -32,3 +38,59 @@ def event_tracking(request):
         current_request.reset(request_token)
         events_queue.reset(queue_token)
         query_cache.reset(cache_token)
+
+
+@register_request_processor
+@contextmanager
+def search_indexing(request):
+    """
+    Record objects created, updated, or deleted while processing a request, then refresh their cached search
+    representations in bulk once all changes have been committed. This is bypassed if SEARCH_INDEXING_MODE is "sync".
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    if settings.SEARCH_INDEXING_MODE == SEARCH_INDEXING_SYNC:
+        yield
+        return
+
+    # Import here to avoid initializing the search backend during app loading
+    from netbox.search.backends import flush_search_queue
+
+    queue_token = search_queue.set({})
+
+    try:
+        yield
+
+    finally:
+        # The queue is flushed even if the wrapped block raised an exception, since any changes committed before the
+        # failure still need to be reflected. Refreshing an object which was never committed is a no-op.
+        if queue := search_queue.get():
+            transaction.on_commit(partial(flush_search_queue, queue), robust=True)
+        search_queue.reset(queue_token)
+
+
+@register_request_processor
+@contextmanager
+def deferred_counters(request):
+    """
+    Accumulate the increments to cached counter fields made while processing a request, then apply them with a single
+    UPDATE for each counter and increment once all changes have been committed. This is bypassed if
+    COUNTER_CACHE_MODE is "immediate".
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    if settings.COUNTER_CACHE_MODE == COUNTER_CACHE_IMMEDIATE:
+        yield
+        return
+
+    queue = {}
+    queue_token = counter_queue.set(queue)
+
+    try:
+        yield
+
+    finally:
+        # Increments are added to the queue only as their changes are committed, which may not yet have happened
+        # (e.g. within an enclosing transaction). The flush is registered after them, so it always runs last.
+        transaction.on_commit(partial(flush_counter_queue, queue), robust=True)
+        counter_queue.reset(queue_token)
@@ -51,3 +51,22 @@ class DataBackend:
         3. Performs any necessary cleanup
         """
         raise NotImplementedError()
+
+    def get_manifest(self, local_path):
+        """
+        Return a dictionary mapping the relative path of each file within the local replica to an identifier which
+        changes whenever the file's content changes (for example, a git blob ID). When syncing, files whose identifier
+        is unchanged since the previous sync are not read from disk. A value of None indicates that the file must
+        always be read. Returns None (the default) if the backend cannot provide a manifest, in which case all files
+        are read.
+
+        This method is called within the fetch() context.
+        """
+        return
+
+    def get_revision(self, local_path):
+        """
+        Return an identifier for the revision of the fetched data as a whole (for example, a git commit hash), or
+        None if not applicable. This method is called within the fetch() context.
+        """
+        return
@@ -5,6 +5,7 @@ from strawberry.types.unset import UNSET
 from strawberry_django.pagination import _QS, _PaginationWindow, _resolve_limit, apply
 
 from netbox.config import get_config
+from utilities.keyset import apply_keyset_ordering, filter_after, get_keyset_ordering, lookup_keyset_values
 
 __all__ = (
     'OffsetPaginationInfo',
@@ -19,12 +20,15 @@ class OffsetPaginationInfo:
     offset: int = 0
     limit: int | None = UNSET
     start: int | None = UNSET
+    after: strawberry.ID | None = UNSET
 
 
 @strawberry.input
 class OffsetPaginationInput(OffsetPaginationInfo):
     """
-    Customized implementation of OffsetPaginationInput to support cursor-based pagination.
+    Customized implementation of OffsetPaginationInput to support cursor-based pagination (`start`) and keyset
+    pagination (`after`). `after` takes the ID of the last object on the previous page, and returns the objects which
+    follow it in the requested ordering.
     """
     pass
 
@@ -94,6 +98,8 @@ def apply_pagination(
     if pagination is not None and pagination.start not in (None, UNSET):
         if pagination.offset:
             raise ValueError('Cannot specify both `start` and `offset` in pagination.')
+        if pagination.after not in (None, UNSET):
+            raise ValueError('Cannot specify both `start` and `after` in pagination.')
         if pagination.start < 0:
             raise ValueError('`start` must be greater than or equal to zero.')
 
@@ -104,6 +110,19 @@ def apply_pagination(
         # Ignore `offset` when `start` is set
         pagination.offset = 0
 
+    elif pagination is not None and pagination.after not in (None, UNSET):
+        if pagination.offset:
+            raise ValueError('Cannot specify both `after` and `offset` in pagination.')
+        if related_field_id is not None:
+            raise ValueError('`after` is not supported for related object lists.')
+
+        # Filter the queryset to include only records which follow the specified object in the requested ordering.
+        # The ordering is extended with the primary key to ensure that it is unique.
+        ordering = get_keyset_ordering(queryset)
+        queryset = apply_keyset_ordering(queryset, ordering)
+        values = lookup_keyset_values(queryset, ordering, pagination.after)
+        queryset = filter_after(queryset, ordering, values)
+
     # Enforce MAX_PAGE_SIZE on the pagination limit
     max_page_size = get_config().MAX_PAGE_SIZE
     if max_page_size:
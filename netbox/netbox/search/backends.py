@@ -4,18 +4,23 @@ from collections import defaultdict
 import netaddr
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchQuery, SearchVector, TrigramSimilarity
 from django.core.exceptions import ImproperlyConfigured
-from django.db import ProgrammingError
+from django.db import ProgrammingError, connection, router, transaction
 from django.db.models import F, Q, Window, prefetch_related_objects
 from django.db.models.fields.related import ForeignKey
 from django.db.models.functions import window
 from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
+from django_rq import get_queue
 from netaddr.core import AddrFormatError
 
 from core.models import ObjectType
 from extras.models import CachedValue, CustomField
+from netbox.config import get_config
+from netbox.constants import RQ_QUEUE_DEFAULT, SEARCH_INDEXING_BACKGROUND
+from netbox.context import search_queue
 from netbox.registry import registry
 from utilities.object_types import object_type_identifier
 from utilities.querysets import RestrictedPrefetch
@@ -67,6 +72,11 @@ class SearchBackend:
         """
         Receiver for the post_save signal, responsible for caching object creation/changes.
         """
+        # Defer caching until the search queue is flushed (if deferred indexing is active)
+        if (queue := search_queue.get()) is not None:
+            self.enqueue(queue, instance)
+            return
+
         try:
             self.cache(instance, remove_existing=not created)
         except ProgrammingError as e:
@@ -78,8 +88,36 @@ class SearchBackend:
         """
         Receiver for the post_delete signal, responsible for caching object deletion.
         """
+        # Defer removal until the search queue is flushed (if deferred indexing is active)
+        if (queue := search_queue.get()) is not None:
+            self.enqueue(queue, instance)
+            return
+
         self.remove(instance)
 
+    def enqueue(self, queue, instance):
+        """
+        Record a created, updated, or deleted object in the search queue. The object's cached representation will be
+        refreshed when the queue is flushed. Repeated changes to the same object are recorded only once.
+        """
+        try:
+            get_indexer(instance)
+        except KeyError:
+            # Skip non-cacheable objects
+            return
+
+        queue.setdefault(instance._meta.label_lower, set()).add(instance.pk)
+
+    def refresh(self, model, object_ids):
+        """
+        Bring the cached representations of the specified objects up to date with the database. Objects which still
+        exist are re-cached, and any cached data for objects which no longer exist is removed.
+        """
+        self.remove_by_id(model, object_ids)
+        instances = model.objects.filter(pk__in=object_ids)
+
+        return self.cache(instances.iterator(), indexer=get_indexer(model), remove_existing=False)
+
     def cache(self, instances, indexer=None, remove_existing=True):
         """
         Create or update the cached representation of an instance.
@@ -92,6 +130,14 @@ class SearchBackend:
         """
         raise NotImplementedError
 
+    def remove_by_id(self, model, object_ids):
+        """
+        Delete any cached representations of the specified objects. Backends should override this method to remove
+        many objects at once.
+        """
+        for object_id in object_ids:
+            self.remove(model(pk=object_id))
+
     def clear(self, object_types=None):
         """
         Delete *all* cached data (optionally filtered by object type).
@@ -115,9 +161,10 @@ class SearchBackend:
 
 class CachedValueSearchBackend(SearchBackend):
 
-    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
-
-        # Build the filter used to find relevant CachedValue records
+    def get_filter(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        """
+        Return a Q object matching the CachedValue records relevant to a search.
+        """
         query_filter = Q(**{f'value__{lookup}': value})
         if object_types:
             # Limit results by object type
@@ -135,8 +182,16 @@ class CachedValueSearchBackend(SearchBackend):
             except (AddrFormatError, ValueError):
                 pass
 
-        # Construct the base queryset to retrieve matching results
-        queryset = CachedValue.objects.filter(query_filter).annotate(
+        return query_filter
+
+    def get_queryset(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        """
+        Return the base queryset of matching CachedValues, annotated with the rank of each result for its object
+        (row_number) and limited to MAX_RESULTS.
+        """
+        query_filter = self.get_filter(value, object_types=object_types, lookup=lookup)
+
+        return CachedValue.objects.filter(query_filter).annotate(
             # Annotate the rank of each result for its object according to its weight
             row_number=Window(
                 expression=window.RowNumber(),
@@ -145,6 +200,11 @@ class CachedValueSearchBackend(SearchBackend):
             )
         )[:MAX_RESULTS]
 
+    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+
+        # Construct the base queryset to retrieve matching results
+        queryset = self.get_queryset(value, object_types=object_types, lookup=lookup)
+
         # Gather all ObjectTypes present in the search results (used for prefetching related
         # objects). This must be done before generating the final results list, which returns
         # a RawQuerySet.
@@ -197,6 +257,7 @@ class CachedValueSearchBackend(SearchBackend):
         return ret
 
     def cache(self, instances, indexer=None, remove_existing=True):
+        object_type = None
         custom_fields = None
 
         # Convert a single instance to an iterable
@@ -204,11 +265,12 @@ class CachedValueSearchBackend(SearchBackend):
             instances = [instances]
 
         buffer = []
+        object_ids = []
         counter = 0
         for instance in instances:
 
             # First item
-            if not counter:
+            if object_type is None:
 
                 # Determine the indexer
                 if indexer is None:
@@ -222,13 +284,10 @@ class CachedValueSearchBackend(SearchBackend):
                     cf for cf in CustomField.objects.get_for_model(indexer.model)
                     if cf.search_weight > 0
                 ]
-
-            # Wipe out any previously cached values for the object
-            if remove_existing:
-                self.remove(instance)
+                object_type = ObjectType.objects.get_for_model(indexer.model)
 
             # Generate cache data
-            object_type = ObjectType.objects.get_for_model(indexer.model)
+            object_ids.append(instance.pk)
             for field in indexer.to_cache(instance, custom_fields=custom_fields):
                 buffer.append(
                     CachedValue(
@@ -243,15 +302,27 @@ class CachedValueSearchBackend(SearchBackend):
 
             # Check whether the buffer needs to be flushed
             if len(buffer) >= 2000:
-                counter += len(CachedValue.objects.bulk_create(buffer))
+                counter += self._flush_buffer(buffer, indexer.model, object_ids if remove_existing else None)
                 buffer = []
+                object_ids = []
 
         # Final buffer flush
-        if buffer:
-            counter += len(CachedValue.objects.bulk_create(buffer))
+        if object_ids:
+            counter += self._flush_buffer(buffer, indexer.model, object_ids if remove_existing else None)
 
         return counter
 
+    def _flush_buffer(self, buffer, model, object_ids=None):
+        """
+        Write a buffer of CachedValues to the database, first wiping out any previously cached values for the
+        objects with the specified IDs (if any).
+        """
+        if object_ids:
+            self.remove_by_id(model, object_ids)
+        if buffer:
+            return len(CachedValue.objects.bulk_create(buffer))
+        return 0
+
     def remove(self, instance):
         # Avoid attempting to query for non-cacheable objects
         try:
@@ -265,6 +336,13 @@ class CachedValueSearchBackend(SearchBackend):
         # Call _raw_delete() on the queryset to avoid first loading instances into memory
         return qs._raw_delete(using=qs.db)
 
+    def remove_by_id(self, model, object_ids):
+        ct = ContentType.objects.get_for_model(model)
+        qs = CachedValue.objects.filter(object_type=ct, object_id__in=object_ids)
+
+        # Call _raw_delete() on the queryset to avoid first loading instances into memory
+        return qs._raw_delete(using=qs.db)
+
     def clear(self, object_types=None):
         qs = CachedValue.objects.all()
         if object_types:
@@ -284,6 +362,64 @@ class CachedValueSearchBackend(SearchBackend):
         return CachedValue.objects.count()
 
 
+class PostgreSQLSearchBackend(CachedValueSearchBackend):
+    """
+    A CachedValue-based backend which leverages PostgreSQL's full text search and pg_trgm extension. Partial matches
+    are served by the trigram GIN index on CachedValue.value, and multi-word queries additionally match values
+    containing all words (in any order) via the full text search index. Results are ranked in SQL by field weight
+    and then by similarity to the query. Counts of the entire cache are estimated from planner statistics rather
+    than computed with COUNT(*).
+    """
+    search_config = 'simple'
+
+    def get_filter(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        query_filter = super().get_filter(value, object_types=object_types, lookup=lookup)
+
+        # Match multi-word queries against the full text search vector
+        if lookup == LookupTypes.PARTIAL and len(value.split()) > 1:
+            search_query = SearchQuery(value, config=self.search_config, search_type='plain')
+            query_filter |= Q(search_vector=search_query)
+            if object_types:
+                query_filter &= Q(object_type__in=object_types)
+
+        return query_filter
+
+    def get_queryset(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        query_filter = self.get_filter(value, object_types=object_types, lookup=lookup)
+
+        return CachedValue.objects.alias(
+            search_vector=SearchVector('value', config=self.search_config),
+        ).annotate(
+            rank=TrigramSimilarity('value', value),
+        ).filter(query_filter).annotate(
+            # Annotate the rank of each result for its object according to its weight and similarity
+            row_number=Window(
+                expression=window.RowNumber(),
+                partition_by=[F('object_type'), F('object_id')],
+                order_by=[F('weight').asc(), F('rank').desc()],
+            )
+        ).order_by('weight', '-rank', 'object_type', 'object_id')[:MAX_RESULTS]
+
+    def count(self, object_types=None):
+        if object_types:
+            return super().count(object_types=object_types)
+        return self.size
+
+    @property
+    def size(self):
+        # Use the planner's estimate of the table's row count to avoid a full table scan. reltuples is -1 if the
+        # table has never been vacuumed or analyzed, in which case we fall back to an exact count.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [CachedValue._meta.db_table]
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= 0:
+            return row[0]
+        return CachedValue.objects.count()
+
+
 def get_backend():
     """
     Initializes and returns the configured search backend.
@@ -297,6 +433,36 @@ def get_backend():
     return backend_cls()
 
 
+def flush_search_queue(queue):
+    """
+    Apply the deferred search index updates recorded in the given queue, either immediately or by enqueuing a
+    background task (depending on SEARCH_INDEXING_MODE).
+    """
+    object_ids = {label: list(pks) for label, pks in queue.items()}
+
+    if settings.SEARCH_INDEXING_MODE == SEARCH_INDEXING_BACKGROUND:
+        queue_name = get_config().QUEUE_MAPPINGS.get('search', RQ_QUEUE_DEFAULT)
+        get_queue(queue_name).enqueue('netbox.search.backends.update_search_index', object_ids)
+    else:
+        update_search_index(object_ids)
+
+
+def update_search_index(object_ids):
+    """
+    Refresh the cached representations of the specified objects, in one batch per model.
+
+    Args:
+        object_ids: A dictionary mapping model labels (e.g. "dcim.site") to lists of object IDs
+    """
+    with transaction.atomic(using=router.db_for_write(CachedValue)):
+        for label, pks in object_ids.items():
+            try:
+                indexer = registry['search'][label]
+            except KeyError:
+                continue
+            search_backend.refresh(indexer.model, pks)
+
+
 search_backend = get_backend()
 
 # Connect handlers to the appropriate model signals
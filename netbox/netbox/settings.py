@@ -15,7 +15,14 @@ from django.utils.translation import gettext_lazy as _
 
 from core.exceptions import IncompatiblePluginError
 from netbox.config import PARAMS as CONFIG_PARAMS
-from netbox.constants import RQ_QUEUE_DEFAULT, RQ_QUEUE_HIGH, RQ_QUEUE_LOW
+from netbox.constants import (
+    COUNT_MODES,
+    COUNTER_CACHE_MODES,
+    RQ_QUEUE_DEFAULT,
+    RQ_QUEUE_HIGH,
+    RQ_QUEUE_LOW,
+    SEARCH_INDEXING_MODES,
+)
 from netbox.plugins import PluginConfig
 from netbox.registry import registry
 from netbox.settings_utils import get_configuration_dir, load_configuration, resolve_install_paths, secret_key_hint
@@ -91,9 +98,11 @@ AUTH_PASSWORD_VALIDATORS = getattr(configuration, 'AUTH_PASSWORD_VALIDATORS', [
 BASE_PATH = trailing_slash(getattr(configuration, 'BASE_PATH', ''))
 CHANGELOG_SKIP_EMPTY_CHANGES = getattr(configuration, 'CHANGELOG_SKIP_EMPTY_CHANGES', True)
 CENSUS_REPORTING_ENABLED = getattr(configuration, 'CENSUS_REPORTING_ENABLED', True)
+CONFIG_CONTEXT_CACHE_TIMEOUT = getattr(configuration, 'CONFIG_CONTEXT_CACHE_TIMEOUT', 0)
 CORS_ORIGIN_ALLOW_ALL = getattr(configuration, 'CORS_ORIGIN_ALLOW_ALL', False)
 CORS_ORIGIN_REGEX_WHITELIST = getattr(configuration, 'CORS_ORIGIN_REGEX_WHITELIST', [])
 CORS_ORIGIN_WHITELIST = getattr(configuration, 'CORS_ORIGIN_WHITELIST', [])
+COUNTER_CACHE_MODE = getattr(configuration, 'COUNTER_CACHE_MODE', 'immediate')
 CSRF_COOKIE_NAME = getattr(configuration, 'CSRF_COOKIE_NAME', 'csrftoken')
 CSRF_COOKIE_PATH = f'/{BASE_PATH.rstrip("/")}'
 CSRF_COOKIE_HTTPONLY = True
@@ -151,6 +160,7 @@ INTERNAL_IPS = getattr(configuration, 'INTERNAL_IPS', ('127.0.0.1', '::1'))
 ISOLATED_DEPLOYMENT = getattr(configuration, 'ISOLATED_DEPLOYMENT', False)
 JINJA_ENVIRONMENT_PARAMS = getattr(configuration, 'JINJA_ENVIRONMENT_PARAMS', [])
 JINJA2_FILTERS = getattr(configuration, 'JINJA2_FILTERS', {})
+JINJA2_TEMPLATE_CACHE_SIZE = getattr(configuration, 'JINJA2_TEMPLATE_CACHE_SIZE', 256)
 LANGUAGE_CODE = getattr(configuration, 'DEFAULT_LANGUAGE', 'en-us')
 LANGUAGE_COOKIE_PATH = CSRF_COOKIE_PATH
 LOGGING = getattr(configuration, 'LOGGING', {})
@@ -161,11 +171,15 @@ LOGIN_FORM_HIDDEN = getattr(configuration, 'LOGIN_FORM_HIDDEN', False)
 LOGOUT_REDIRECT_URL = getattr(configuration, 'LOGOUT_REDIRECT_URL', 'home')
 MEDIA_ROOT = getattr(configuration, 'MEDIA_ROOT', os.path.join(NETBOX_ROOT, 'media')).rstrip('/')
 METRICS_ENABLED = getattr(configuration, 'METRICS_ENABLED', False)
+PAGINATION_COUNT_CACHE_TIMEOUT = getattr(configuration, 'PAGINATION_COUNT_CACHE_TIMEOUT', 60)
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = getattr(configuration, 'PAGINATION_COUNT_ESTIMATE_THRESHOLD', 100000)
+PAGINATION_COUNT_MODE = getattr(configuration, 'PAGINATION_COUNT_MODE', 'exact')
 PLUGINS = getattr(configuration, 'PLUGINS', [])
 PLUGINS_CONFIG = getattr(configuration, 'PLUGINS_CONFIG', {})
 PLUGINS_CATALOG_CONFIG = getattr(configuration, 'PLUGINS_CATALOG_CONFIG', {})
 PROXY_ROUTERS = getattr(configuration, 'PROXY_ROUTERS', ['utilities.proxy.DefaultProxyRouter'])
 QUEUE_MAPPINGS = getattr(configuration, 'QUEUE_MAPPINGS', {})
+RACK_ELEVATION_CACHE_TIMEOUT = getattr(configuration, 'RACK_ELEVATION_CACHE_TIMEOUT', 0)
 REDIS = getattr(configuration, 'REDIS')  # Required
 RELEASE_CHECK_URL = getattr(configuration, 'RELEASE_CHECK_URL', None)
 REMOTE_AUTH_AUTO_CREATE_GROUPS = getattr(configuration, 'REMOTE_AUTH_AUTO_CREATE_GROUPS', False)
@@ -198,6 +212,7 @@ RQ_RETRY_INTERVAL = getattr(configuration, 'RQ_RETRY_INTERVAL', 60)
 RQ_RETRY_MAX = getattr(configuration, 'RQ_RETRY_MAX', 0)
 SCRIPTS_ROOT = getattr(configuration, 'SCRIPTS_ROOT', os.path.join(NETBOX_ROOT, 'scripts')).rstrip('/')
 SEARCH_BACKEND = getattr(configuration, 'SEARCH_BACKEND', 'netbox.search.backends.CachedValueSearchBackend')
+SEARCH_INDEXING_MODE = getattr(configuration, 'SEARCH_INDEXING_MODE', 'sync')
 SECRET_KEY = getattr(configuration, 'SECRET_KEY')  # Required
 SECURE_HSTS_INCLUDE_SUBDOMAINS = getattr(configuration, 'SECURE_HSTS_INCLUDE_SUBDOMAINS', False)
 SECURE_HSTS_PRELOAD = getattr(configuration, 'SECURE_HSTS_PRELOAD', False)
@@ -223,12 +238,30 @@ STORAGE_CONFIG = getattr(configuration, 'STORAGE_CONFIG', None)
 STORAGES = getattr(configuration, 'STORAGES', {})
 TIME_ZONE = getattr(configuration, 'TIME_ZONE', 'UTC')
 TRANSLATION_ENABLED = getattr(configuration, 'TRANSLATION_ENABLED', True)
+WEBHOOK_BATCH_SIZE = getattr(configuration, 'WEBHOOK_BATCH_SIZE', 0)
+WEBHOOK_MAX_WORKERS = getattr(configuration, 'WEBHOOK_MAX_WORKERS', 8)
 DISK_BASE_UNIT = getattr(configuration, 'DISK_BASE_UNIT', 1000)
 if DISK_BASE_UNIT not in [1000, 1024]:
     raise ImproperlyConfigured(f"DISK_BASE_UNIT must be 1000 or 1024 (found {DISK_BASE_UNIT})")
 RAM_BASE_UNIT = getattr(configuration, 'RAM_BASE_UNIT', 1000)
 if RAM_BASE_UNIT not in [1000, 1024]:
     raise ImproperlyConfigured(f"RAM_BASE_UNIT must be 1000 or 1024 (found {RAM_BASE_UNIT})")
+if COUNTER_CACHE_MODE not in COUNTER_CACHE_MODES:
+    raise ImproperlyConfigured(
+        f"COUNTER_CACHE_MODE must be one of {', '.join(COUNTER_CACHE_MODES)} (found {COUNTER_CACHE_MODE})"
+    )
+if SEARCH_INDEXING_MODE not in SEARCH_INDEXING_MODES:
+    raise ImproperlyConfigured(
+        f"SEARCH_INDEXING_MODE must be one of {', '.join(SEARCH_INDEXING_MODES)} (found {SEARCH_INDEXING_MODE})"
+    )
+if WEBHOOK_MAX_WORKERS < 1:
+    raise ImproperlyConfigured(f"WEBHOOK_MAX_WORKERS must be at least 1 (found {WEBHOOK_MAX_WORKERS})")
+if JINJA2_TEMPLATE_CACHE_SIZE < 0:
+    raise ImproperlyConfigured(f"JINJA2_TEMPLATE_CACHE_SIZE must not be negative (found {JINJA2_TEMPLATE_CACHE_SIZE})")
+if PAGINATION_COUNT_MODE not in COUNT_MODES:
+    raise ImproperlyConfigured(
+        f"PAGINATION_COUNT_MODE must be one of {', '.join(COUNT_MODES)} (found {PAGINATION_COUNT_MODE})"
+    )
 
 # Load any dynamic configuration parameters which have been hard-coded in the configuration file
 for param in CONFIG_PARAMS:
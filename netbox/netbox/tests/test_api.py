@@ -1,8 +1,10 @@
+import json
 import uuid
 
 from django.contrib.contenttypes.models import ContentType
 from django.db.backends.postgresql.psycopg_any import NumericRange
-from django.test import RequestFactory, TestCase
+from django.http import QueryDict
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
@@ -51,6 +53,48 @@ class AppTestCase(APITestCase):
         self.assertEqual(response.data['id'], self.user.pk)
 
 
+class StreamingExportTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+
+    def test_stream_ndjson(self):
+        self.add_permissions('dcim.view_site')
+        url = reverse('dcim-api:site-list')
+
+        response = self.client.get(f'{url}?format=ndjson&fields=id,name&name=Site 1&name=Site 2', **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [{'id': site.pk, 'name': site.name} for site in Site.objects.filter(name__in=['Site 1', 'Site 2'])]
+        )
+
+    def test_stream_csv(self):
+        self.add_permissions('dcim.view_site')
+        url = reverse('dcim-api:site-list')
+
+        response = self.client.get(f'{url}?format=csv&fields=id,name,tags', **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'id,name,tags')
+        self.assertEqual(lines[1], f'{Site.objects.first().pk},Site 1,[]')
+        self.assertEqual(len(lines), 4)
+
+    def test_stream_error(self):
+        self.add_permissions('dcim.view_site')
+        url = reverse('dcim-api:site-list')
+
+        # Errors are returned as JSON
+        response = self.client.get(f'{url}?format=ndjson&id=foo', **self.header)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+
 class RelatedObjectCountFieldTestCase(TestCase):
     """
     RelatedObjectCountFields are populated by annotations applied to a viewset's queryset, which are only
@@ -140,6 +184,83 @@ class OptionalLimitOffsetPaginationTestCase(TestCase):
         with self.assertRaises(ValidationError):
             self.paginator.paginate_queryset(queryset, request)
 
+    def test_invalid_count_mode_raises_validation_error(self):
+        """paginate_queryset() raises ValidationError for an unknown count_mode"""
+        queryset = Site.objects.all().order_by('pk')
+        request = self._make_drf_request(query_params={'count_mode': 'invalid'})
+        with self.assertRaises(ValidationError):
+            self.paginator.paginate_queryset(queryset, request)
+
+    def test_count_mode_none(self):
+        """With count_mode=none, count is omitted and the next link reflects whether more results exist"""
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+        queryset = Site.objects.all().order_by('pk')
+
+        request = self._make_drf_request(query_params={'count_mode': 'none', 'limit': '2'})
+        results = self.paginator.paginate_queryset(queryset, request)
+        self.assertEqual(len(results), 2)
+        self.assertIsNone(self.paginator.count)
+        self.assertIn('offset=2', self.paginator.get_next_link())
+
+        request = self._make_drf_request(query_params={'count_mode': 'none', 'limit': '2', 'offset': '2'})
+        results = self.paginator.paginate_queryset(queryset, request)
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(self.paginator.get_next_link())
+
+    def test_count_mode_cached(self):
+        """With count_mode=cached, the count for an identical query is served from the cache"""
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+        queryset = Site.objects.filter(name__startswith='Site').order_by('pk')
+        request = self._make_drf_request(query_params={'count_mode': 'cached'})
+
+        self.paginator.paginate_queryset(queryset, request)
+        self.assertEqual(self.paginator.count, 3)
+
+        Site.objects.filter(name='Site 3').delete()
+        self.paginator.paginate_queryset(queryset, request)
+        self.assertEqual(self.paginator.count, 3)
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=0)
+    def test_count_mode_estimate(self):
+        """With count_mode=estimate, the query planner's estimate is returned above the threshold"""
+        queryset = Site.objects.all().order_by('pk')
+        request = self._make_drf_request(query_params={'count_mode': 'estimate'})
+        self.paginator.paginate_queryset(queryset, request)
+        self.assertIsInstance(self.paginator.count, int)
+
+    def test_keyset_pagination(self):
+        """Keyset cursors page through results in any ordering"""
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+        queryset = Site.objects.order_by('-name')
+
+        names = []
+        request = self._make_drf_request(query_params={'cursor': '', 'limit': '2'})
+        while True:
+            paginator = NetBoxPagination()
+            results = paginator.paginate_queryset(queryset, request)
+            self.assertIsNone(paginator.count)
+            self.assertIsNone(paginator.get_previous_link())
+            names.extend(site.name for site in results)
+            if not (next_link := paginator.get_next_link()):
+                break
+            self.assertNotIn('offset', next_link)
+            request = self._make_drf_request(query_params=QueryDict(next_link.split('?', 1)[1]))
+        self.assertEqual(names, ['Site 5', 'Site 4', 'Site 3', 'Site 2', 'Site 1'])
+
+    def test_keyset_pagination_invalid_cursor(self):
+        """An invalid or tampered cursor raises ValidationError"""
+        queryset = Site.objects.order_by('name')
+        request = self._make_drf_request(query_params={'cursor': 'invalid'})
+        with self.assertRaises(ValidationError):
+            self.paginator.paginate_queryset(queryset, request)
+
+    def test_keyset_and_offset_conflict_raises_validation_error(self):
+        """paginate_queryset() raises ValidationError when both cursor and offset are specified"""
+        queryset = Site.objects.order_by('name')
+        request = self._make_drf_request(query_params={'cursor': '', 'offset': '10'})
+        with self.assertRaises(ValidationError):
+            self.paginator.paginate_queryset(queryset, request)
+
 
 class IntegerRangeSerializerTestCase(TestCase):
 
@@ -756,6 +756,39 @@ class GraphQLAPITestCase(APITestCase):
         self.assertEqual(len(data['data']['site_list']), 1)
         self.assertEqual(data['data']['site_list'][0]['name'], 'Site 7')
 
+    def test_keyset_pagination(self):
+        self.add_permissions('dcim.view_site')
+        url = reverse('graphql')
+        site = Site.objects.get(name='Site 3')
+
+        query = """
+        {
+            site_list(pagination: {after: """ + str(site.pk) + """, limit: 3}) {
+                id name
+            }
+        }
+        """
+        response = self.client.post(url, data={'query': query}, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(
+            [site['name'] for site in data['data']['site_list']],
+            ['Site 4', 'Site 5', 'Site 6']
+        )
+
+        # `after` and `offset` are mutually exclusive
+        query = """
+        {
+            site_list(pagination: {after: """ + str(site.pk) + """, offset: 1}) {
+                id name
+            }
+        }
+        """
+        response = self.client.post(url, data={'query': query}, format='json', **self.header)
+        data = json.loads(response.content)
+        self.assertIn('errors', data)
+
     @override_settings(MAX_PAGE_SIZE=3)
     def test_max_page_size(self):
         self.add_permissions('dcim.view_site')
@@ -1,8 +1,16 @@
+import uuid
+
+from django.test import RequestFactory
+
+from core.choices import JobStatusChoices
 from core.models import ObjectType
 from dcim.models import *
+from dcim.views import RegionBulkImportView
 from extras.models import CustomField
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
+from netbox.jobs import AsyncViewJob
 from users.models import ObjectPermission
+from utilities.request import copy_safe_request
 from utilities.testing import ModelViewTestCase, create_tags
 
 
@@ -138,3 +146,67 @@ class CSVImportTestCase(ModelViewTestCase):
         self.assertHttpStatus(self.client.post(self._get_url('bulk_import'), data), 302)
         region = Region.objects.get(slug='region-1')
         self.assertEqual(region.cf['tcf'], 'def-cf-text')
+
+    def test_chunked_import(self):
+        """
+        Test that a chunked import commits each chunk independently, and records its progress on the job.
+        """
+        self.add_permissions('dcim.view_region', 'dcim.add_region', 'core.view_job')
+        csv_data = [
+            'name,slug',
+            'Region 1,region-1',
+            'Region 2,region-2',
+            'Region 3,region-3',
+            'Region 4,',  # Invalid
+            'Region 5,region-5',
+        ]
+        request = RequestFactory().post(self._get_url('bulk_import'), {
+            'format': ImportFormatChoices.CSV,
+            'data': self._get_csv_data(csv_data),
+            'csv_delimiter': CSVDelimiterChoices.AUTO,
+            'background_job': True,
+            'chunk_size': 2,
+        })
+        request.user = self.user
+        request.id = uuid.uuid4()
+
+        job = AsyncViewJob.enqueue(
+            user=self.user,
+            view_cls=RegionBulkImportView,
+            request=copy_safe_request(request),
+            immediate=True
+        )
+        job.refresh_from_db()
+
+        # Only the chunk containing the invalid record should have been rolled back
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(
+            sorted(Region.objects.values_list('slug', flat=True)),
+            ['region-1', 'region-2', 'region-5']
+        )
+        self.assertEqual(job.data['total'], 5)
+        self.assertEqual(job.data['imported'], 3)
+        self.assertEqual(job.data['failed'], 2)
+        self.assertEqual(
+            [(chunk['first_record'], chunk['status']) for chunk in job.data['chunks']],
+            [(1, 'completed'), (3, 'failed'), (5, 'completed')]
+        )
+
+        # The failed records should be populated in the import form for retry
+        response = self.client.get(f"{self._get_url('bulk_import')}?retry_job={job.pk}")
+        self.assertHttpStatus(response, 200)
+        initial = response.context['form'].initial
+        self.assertEqual(initial['data'], 'name,slug\nRegion 3,region-3\nRegion 4,\n')
+        self.assertEqual(initial['chunk_size'], 2)
+
+    def test_chunked_import_requires_background_job(self):
+        self.add_permissions('dcim.view_region', 'dcim.add_region')
+        data = {
+            'format': ImportFormatChoices.CSV,
+            'data': self._get_csv_data(['name,slug', 'Region 1,region-1']),
+            'csv_delimiter': CSVDelimiterChoices.AUTO,
+            'chunk_size': 100,
+        }
+
+        self.assertHttpStatus(self.client.post(self._get_url('bulk_import'), data), 200)
+        self.assertEqual(Region.objects.count(), 0)
@@ -4,7 +4,8 @@ from django.test import TestCase
 from dcim.models import Site
 from dcim.search import SiteIndex
 from extras.models import CachedValue
-from netbox.search.backends import search_backend
+from netbox.context import search_queue
+from netbox.search.backends import PostgreSQLSearchBackend, flush_search_queue, search_backend
 
 
 class SearchBackendTestCase(TestCase):
@@ -138,6 +139,43 @@ class SearchBackendTestCase(TestCase):
             CachedValue.objects.exists()
         )
 
+    def test_deferred_indexing(self):
+        """
+        Test that changes recorded in the search queue are cached only once the queue is flushed.
+        """
+        deleted_site = Site.objects.first()
+        search_backend.cache(deleted_site)
+
+        queue = {}
+        token = search_queue.set(queue)
+        try:
+            site = Site.objects.create(name='Site 4', slug='site-4')
+            site.description = 'Fourth test site'
+            site.save()
+            deleted_site_pk = deleted_site.pk
+            deleted_site.delete()
+        finally:
+            search_queue.reset(token)
+
+        # Repeated saves of the same object are recorded once
+        self.assertEqual(queue, {'dcim.site': {site.pk, deleted_site_pk}})
+        content_type = ContentType.objects.get_for_model(Site)
+        self.assertFalse(
+            CachedValue.objects.filter(object_type=content_type, object_id=site.pk).exists()
+        )
+        self.assertTrue(
+            CachedValue.objects.filter(object_type=content_type, object_id=deleted_site_pk).exists()
+        )
+
+        flush_search_queue(queue)
+        self.assertEqual(
+            CachedValue.objects.filter(object_type=content_type, object_id=site.pk).count(),
+            3  # name, slug, description
+        )
+        self.assertFalse(
+            CachedValue.objects.filter(object_type=content_type, object_id=deleted_site_pk).exists()
+        )
+
     def test_search(self):
         """
         Test various searches.
@@ -151,3 +189,52 @@ class SearchBackendTestCase(TestCase):
         self.assertEqual(len(results), 1)
         results = search_backend.search('xxxxx')
         self.assertEqual(len(results), 0)
+
+
+class PostgreSQLSearchBackendTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        sites = (
+            Site(name='Site 1', slug='site-1', description='Core switching site'),
+            Site(name='Site 2', slug='site-2', description='Edge site'),
+            Site(name='Site 3', slug='site-3', description='Switching core'),
+        )
+        Site.objects.bulk_create(sites)
+        search_backend.cache(Site.objects.all())
+
+    def test_search(self):
+        backend = PostgreSQLSearchBackend()
+
+        results = backend.search('site')
+        self.assertEqual(len(results), 3)
+        results = backend.search('edge')
+        self.assertEqual(len(results), 1)
+        results = backend.search('xxxxx')
+        self.assertEqual(len(results), 0)
+
+    def test_search_multiple_words(self):
+        backend = PostgreSQLSearchBackend()
+
+        # Words may appear in any order
+        results = backend.search('core switching')
+        self.assertEqual(
+            sorted(r.object.name for r in results),
+            ['Site 1', 'Site 3']
+        )
+
+    def test_search_ranking(self):
+        backend = PostgreSQLSearchBackend()
+
+        # Name (weight 100) matches should be ranked ahead of description (weight 500) matches
+        results = backend.search('site')
+        self.assertEqual(results[0].field, 'name')
+
+    def test_count(self):
+        backend = PostgreSQLSearchBackend()
+        content_type = ContentType.objects.get_for_model(Site)
+
+        self.assertEqual(
+            backend.count(object_types=[content_type]),
+            CachedValue.objects.filter(object_type=content_type).count()
+        )
@@ -1,13 +1,17 @@
+import csv
+import json
 import logging
 import re
 from collections import Counter
 from copy import deepcopy
+from io import StringIO
 from types import SimpleNamespace
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ObjectDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import IntegrityError, router, transaction
 from django.db.models import ManyToManyField, ProtectedError, RestrictedError
 from django.db.models.fields.reverse_related import ManyToManyRel
@@ -19,24 +23,35 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 from mptt.models import MPTTModel
 
+from core.changelog import buffered_change_logging
 from core.exceptions import JobFailed
-from core.models import ObjectType
+from core.models import Job, ObjectType
 from core.signals import clear_events
 from extras.choices import CustomFieldUIEditableChoices
+from extras.events import flush_events
 from extras.models import CustomField, ExportTemplate
+from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
+from netbox.context import events_queue
 from netbox.forms.bulk_rename import NetBoxModelBulkRenameForm
 from netbox.models.features import ChangeLoggingMixin
 from netbox.object_actions import AddObject, BulkDelete, BulkEdit, BulkExport, BulkImport, BulkRename
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
 from utilities.export import TableExport, stream_table_csv_response
-from utilities.forms import BulkDeleteForm, BulkRenameForm, restrict_form_fields
+from utilities.forms import (
+    BulkDeleteForm,
+    BulkRenameForm,
+    apply_csv_lookups,
+    resolve_csv_lookups,
+    restrict_form_fields,
+)
 from utilities.forms.bulk_import import BulkImportForm
 from utilities.htmx import htmx_partial
 from utilities.jobs import is_background_request, process_request_as_job
 from utilities.permissions import get_permission_for_model
 from utilities.query import reapply_model_ordering
 from utilities.request import safe_for_redirect
+from utilities.rqworker import get_queue_for_model
 from utilities.string import title
 from utilities.tables import get_table_configs
 from utilities.views import GetReturnURLMixin, get_action_url
@@ -410,7 +425,7 @@ class BulkCreateView(GetReturnURLMixin, BaseMultiObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                with transaction.atomic(using=router.db_for_write(model)):
+                with transaction.atomic(using=router.db_for_write(model)), buffered_change_logging():
                     new_objs = self._create_objects(form, request)
 
                     # Enforce object-level permissions
@@ -552,13 +567,21 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         """
         return object_form.save()
 
-    def _process_import_records(self, form, request, records, prefetched_objects):
+    def _process_import_records(self, form, request, records, prefetched_objects, start=1):
         """
         Process CSV import records and save objects.
         """
         saved_objects = []
+        form_kwargs = {'headers': form._csv_headers} if hasattr(form, '_csv_headers') else {}
+
+        # Resolve the related objects referenced by all records at once, rather than one record at a time
+        try:
+            lookups = resolve_csv_lookups(self.model_form(**form_kwargs), records, request.user)
+        except KeyError:
+            # An invalid header is reported upon processing the first record
+            lookups = {}
 
-        for i, record in enumerate(records, start=1):
+        for i, record in enumerate(records, start=start):
             object_id = int(record.pop('id')) if record.get('id') else None
 
             # Determine whether this object is being created or updated
@@ -593,13 +616,7 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
             instance._changelog_message = form.cleaned_data.get('changelog_message', '')
 
             # Instantiate the model form for the object
-            model_form_kwargs = {
-                'data': record,
-                'instance': instance,
-            }
-            if hasattr(form, '_csv_headers'):
-                model_form_kwargs['headers'] = form._csv_headers  # Add CSV headers
-            model_form = self.model_form(**model_form_kwargs)
+            model_form = self.model_form(data=record, instance=instance, **form_kwargs)
 
             # When updating, omit all form fields other than those specified in the record. (No
             # fields are required when modifying an existing object.)
@@ -608,6 +625,7 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
                 for field_name in unused_fields:
                     del model_form.fields[field_name]
 
+            apply_csv_lookups(model_form, lookups)
             restrict_form_fields(model_form, request.user)
 
             if model_form.is_valid():
@@ -621,8 +639,17 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
         return saved_objects
 
-    def create_and_update_objects(self, form, request):
-        records = list(form.cleaned_data['data'])
+    def create_and_update_objects(self, form, request, records=None, start=1):
+        """
+        Create and/or update objects from the import records.
+
+        Args:
+            form: The bulk import form
+            request: The current request
+            records: The records to import (defaults to all records in the form's data)
+            start: The number of the first record, for reference in error messages
+        """
+        records = list(form.cleaned_data['data'] if records is None else records)
 
         # Prefetch objects to be updated, if any
         prefetch_ids = [int(record['id']) for record in records if record.get('id')]
@@ -665,9 +692,9 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         # For MPTT models, delay tree updates until all saves are complete
         if issubclass(self.queryset.model, MPTTModel):
             with self.queryset.model.objects.delay_mptt_updates():
-                saved_objects = self._process_import_records(form, request, records, prefetched_objects)
+                saved_objects = self._process_import_records(form, request, records, prefetched_objects, start)
         else:
-            saved_objects = self._process_import_records(form, request, records, prefetched_objects)
+            saved_objects = self._process_import_records(form, request, records, prefetched_objects, start)
 
         # Enforce object-level permissions in aggregate. Newly created objects are constrained by the 'add'
         # permission (self.queryset is already restricted to 'add'); updated objects by 'change' (reusing the
@@ -682,13 +709,127 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
         return saved_objects
 
+    def _import_in_chunks(self, form, request):
+        """
+        Import records in chunks of the form's chunk size, committing each chunk in its own transaction. The outcome
+        of each chunk and the overall progress of the import are recorded on the background job, along with the
+        submitted records of any chunk which failed so that they can be retried.
+        """
+        model = self.queryset.model
+        job = request.job.job
+        records = form.cleaned_data['data']
+        chunk_size = form.cleaned_data['chunk_size']
+
+        job.data = {
+            'object_type': model._meta.label_lower,
+            'chunk_size': chunk_size,
+            'total': len(records),
+            'imported': 0,
+            'failed': 0,
+            'headers': getattr(form, '_csv_headers', None),
+            'chunks': [],
+        }
+
+        for start in range(0, len(records), chunk_size):
+            chunk_records = records[start:start + chunk_size]
+            chunk = {
+                'first_record': start + 1,
+                'last_record': start + len(chunk_records),
+            }
+            # Records are modified while being processed, so retain a copy of each as submitted
+            submitted_records = deepcopy(chunk_records)
+
+            try:
+                with transaction.atomic(using=router.db_for_write(model)), buffered_change_logging():
+                    saved_objects = self.create_and_update_objects(
+                        form, request, records=chunk_records, start=start + 1
+                    )
+
+            except (AbortRequest, PermissionsViolation, ValidationError) as e:
+                err_messages = e.messages if type(e) is ValidationError else [e.message]
+                for msg in err_messages:
+                    request.job.logger.error(msg)
+                request.job.logger.warning(
+                    f"Records {chunk['first_record']}-{chunk['last_record']} were not imported"
+                )
+                clear_events.send(sender=self)
+                chunk.update(status='failed', errors=err_messages, records=submitted_records)
+                job.data['failed'] += len(chunk_records)
+
+            else:
+                # Dispatch the events of each chunk once it has been committed, as those still queued when the job
+                # fails are discarded
+                if events := list(events_queue.get().values()):
+                    flush_events(events)
+                events_queue.set({})
+                chunk.update(status='completed', objects=len(saved_objects))
+                job.data['imported'] += len(chunk_records)
+                request.job.logger.info(
+                    f"Imported records {chunk['first_record']}-{chunk['last_record']} "
+                    f"({job.data['imported']} of {job.data['total']})"
+                )
+
+            # Record the progress of the import
+            job.data['chunks'].append(chunk)
+            job.save(update_fields=['data', 'log_entries'])
+
+        msg = _('Imported {count} of {total} {object_type}').format(
+            count=job.data['imported'],
+            total=job.data['total'],
+            object_type=model._meta.verbose_name_plural
+        )
+        if job.data['failed']:
+            request.job.logger.warning(msg)
+            raise JobFailed
+        request.job.logger.info(msg)
+
+    def _get_retry_initial(self, request, model):
+        """
+        Return the initial form data with which to retry the failed records of a chunked import job, if one has been
+        specified by the `retry_job` query parameter.
+        """
+        job_id = request.GET.get('retry_job', '')
+        job = Job.objects.restrict(request.user, 'view').filter(pk=job_id).first() if job_id.isdigit() else None
+        data = job.data if job and isinstance(job.data, dict) else {}
+        if data.get('object_type') != model._meta.label_lower:
+            return {}
+        records = [
+            record for chunk in data['chunks'] if chunk['status'] == 'failed' for record in chunk['records']
+        ]
+        if not records:
+            return {}
+
+        initial = {
+            'background_job': True,
+            'chunk_size': data['chunk_size'],
+        }
+        if headers := data.get('headers'):
+            # Reproduce the original CSV headers, including the accessors of any related objects
+            fields = list(records[0])
+            output = StringIO()
+            writer = csv.writer(output, lineterminator='\n')
+            writer.writerow([f'{field}.{headers[field]}' if headers.get(field) else field for field in fields])
+            writer.writerows([record.get(field, '') for field in fields] for record in records)
+            initial.update({
+                'data': output.getvalue(),
+                'format': ImportFormatChoices.CSV,
+                'csv_delimiter': CSVDelimiterChoices.COMMA,
+            })
+        else:
+            initial.update({
+                'data': json.dumps(records, cls=DjangoJSONEncoder, indent=4),
+                'format': ImportFormatChoices.JSON,
+            })
+
+        return initial
+
     #
     # Request handlers
     #
 
     def get(self, request):
         model = self.model_form._meta.model
-        form = BulkImportForm()
+        form = BulkImportForm(initial=self._get_retry_initial(request, model))
         if not issubclass(model, ChangeLoggingMixin):
             form.fields.pop('changelog_message')
 
@@ -717,13 +858,20 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
                     count=len(form.cleaned_data['data']),
                     object_type=model._meta.verbose_name_plural,
                 )
-                if process_request_as_job(self.__class__, request, name=job_name):
+                # Imports of each model may be assigned to a dedicated queue (see QUEUE_MAPPINGS)
+                queue_name = get_queue_for_model(model._meta.label_lower)
+                if process_request_as_job(self.__class__, request, name=job_name, queue_name=queue_name):
                     return redirect(redirect_url)
 
+            # If a chunk size has been specified, commit the records of each chunk independently
+            if is_background_request(request) and form.cleaned_data['chunk_size']:
+                self._import_in_chunks(form, request)
+                return None
+
             try:
                 # Iterate through data and bind each record to a new model form instance. Object-level
                 # permissions are enforced within create_and_update_objects().
-                with transaction.atomic(using=router.db_for_write(model)):
+                with transaction.atomic(using=router.db_for_write(model)), buffered_change_logging():
                     new_objects = self.create_and_update_objects(form, request)
 
                 msg = _('Imported {count} {object_type}').format(
@@ -927,7 +1075,7 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
                         return redirect(self.get_return_url(request))
 
                 try:
-                    with transaction.atomic(using=router.db_for_write(model)):
+                    with transaction.atomic(using=router.db_for_write(model)), buffered_change_logging():
                         updated_objects = self._update_objects(form, request)
 
                         # Enforce object-level permissions
@@ -1080,7 +1228,10 @@ class BulkRenameView(GetReturnURLMixin, BaseMultiObjectView):
                     field_names = submitted
                 if not form.errors:
                     try:
-                        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                        with (
+                            transaction.atomic(using=router.db_for_write(self.queryset.model)),
+                            buffered_change_logging(),
+                        ):
                             renamed_pks = self._rename_objects(form, selected_objects, field_names)
 
                             if '_apply' in request.POST:
@@ -1187,7 +1338,7 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
                 queryset = self.queryset.filter(pk__in=pk_list)
                 deleted_count = queryset.count()
                 try:
-                    with transaction.atomic(using=router.db_for_write(model)):
+                    with transaction.atomic(using=router.db_for_write(model)), buffered_change_logging():
                         for obj in queryset:
 
                             # Take a snapshot of change-logged models
@@ -1326,7 +1477,7 @@ class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
                 }
 
                 try:
-                    with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                    with transaction.atomic(using=router.db_for_write(self.queryset.model)), buffered_change_logging():
 
                         for obj in data['pk']:
 
@@ -1,4 +1,8 @@
+import json
 import logging
+from collections import defaultdict
+from functools import reduce
+from operator import or_
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import (
@@ -8,6 +12,7 @@ from django.core.exceptions import (
     ObjectDoesNotExist,
     ValidationError,
 )
+from django.db.models import CharField, IntegerField, Q
 from django.db.models.fields.related import ManyToOneRel, RelatedField
 from django.urls import reverse
 from django.utils.module_loading import import_string
@@ -36,8 +41,12 @@ __all__ = (
     'get_view_name',
     'is_api_request',
     'is_graphql_request',
+    'resolve_related_objects',
 )
 
+# The maximum number of related object references resolved per query
+RELATED_OBJECT_BATCH_SIZE = 1000
+
 
 class IsSuperuser(BasePermission):
     """
@@ -218,7 +227,7 @@ def get_annotations_for_serializer(serializer_class, fields=None, omit=None):
     return annotations
 
 
-def get_related_object_by_attrs(queryset, attrs, user=None):
+def get_related_object_by_attrs(queryset, attrs, user=None, related_objects=None):
     """
     Return an object identified by either a dictionary of attributes or its numeric primary key (ID). This is used
     for referencing related objects when creating/updating objects via the REST API.
@@ -231,10 +240,17 @@ def get_related_object_by_attrs(queryset, attrs, user=None):
     :param queryset: The base queryset from which to retrieve the related object
     :param attrs: A dictionary of attributes or a numeric primary key identifying the related object
     :param user: The user making the request (used to enforce view permissions on attribute-based lookups)
+    :param related_objects: A mapping of related objects already resolved for the request (see
+        resolve_related_objects())
     """
     if attrs is None:
         return None
 
+    # Return the related object if it has already been resolved
+    if related_objects and (key := _get_reference_key(attrs)) is not None:
+        if (obj := related_objects.get((queryset.model, key))) is not None:
+            return obj
+
     # Dictionary of related object attributes
     if isinstance(attrs, dict):
         # Restrict the queryset to only those objects the user is permitted to view. This ensures that filtering by
@@ -273,3 +289,182 @@ def get_related_object_by_attrs(queryset, attrs, user=None):
         return queryset.get(pk=pk)
     except ObjectDoesNotExist:
         raise ValidationError(_("Related object not found using the provided numeric ID: {id}").format(id=pk))
+
+
+def _get_reference_key(attrs):
+    """
+    Return a hashable key representing a reference to a related object (a dictionary of attributes or a numeric ID).
+    """
+    if isinstance(attrs, dict):
+        try:
+            return json.dumps(attrs, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+    try:
+        return int(attrs)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_lookup_path(model, param):
+    """
+    Return the fields traversed by a filter parameter (e.g. "site__slug"), if it can be evaluated against a retrieved
+    object in the same manner as by the database: each field other than the last must be a forward relation, and the
+    last must be a concrete character or integer field (or a foreign key to one). Otherwise, return None.
+    """
+    path = []
+    names = param.split('__')
+    for i, name in enumerate(names):
+        try:
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        if i < len(names) - 1:
+            if not (field.many_to_one or field.one_to_one):
+                return None
+            model = field.related_model
+        elif not isinstance(field.target_field if field.is_relation else field, (CharField, IntegerField)):
+            return None
+        path.append(field)
+    return path
+
+
+def _get_path_value(obj, path):
+    for field in path[:-1]:
+        if (obj := getattr(obj, field.name)) is None:
+            return None
+    return getattr(obj, path[-1].attname)
+
+
+def _resolve_by_attrs(queryset, references):
+    """
+    Resolve references to objects by dictionaries of attributes using a single query per batch. Each object retrieved
+    is matched to the references whose attributes it satisfies; only references matching exactly one object are
+    resolved.
+    """
+    model = queryset.model
+    resolved = {}
+
+    # Determine the value (as prepared for the database) which each referenced object must have for each of its
+    # attributes
+    lookups = []
+    for key, attrs in references.items():
+        params = dict_to_filter_params(attrs)
+        values = []
+        for param, value in params.items():
+            if value is None or (path := _get_lookup_path(model, param)) is None:
+                break
+            field = path[-1].target_field if path[-1].is_relation else path[-1]
+            try:
+                values.append((path, field.to_python(value)))
+            except (TypeError, ValidationError):
+                break
+        else:
+            if values:
+                lookups.append((key, Q(**params), values))
+
+    for i in range(0, len(lookups), RELATED_OBJECT_BATCH_SIZE):
+        batch = lookups[i:i + RELATED_OBJECT_BATCH_SIZE]
+        relations = {
+            '__'.join(field.name for field in path[:-1])
+            for lookup in batch for path, value in lookup[2] if len(path) > 1
+        }
+        objects = list(
+            queryset.filter(reduce(or_, (lookup[1] for lookup in batch))).select_related(*relations)
+        )
+        for key, q, values in batch:
+            matches = [
+                obj for obj in objects
+                if all(_get_path_value(obj, path) == value for path, value in values)
+            ]
+            if len(matches) == 1:
+                resolved[key] = matches[0]
+
+    return resolved
+
+
+def _is_resolved_by_attrs(serializer):
+    """
+    Return True if the given serializer resolves related objects using get_related_object_by_attrs().
+    """
+    # Import here to avoid a circular import
+    from netbox.api.serializers import BaseModelSerializer, WritableNestedSerializer
+
+    if not isinstance(serializer, BaseModelSerializer):
+        return False
+    to_internal_value = type(serializer).to_internal_value
+    if to_internal_value is WritableNestedSerializer.to_internal_value:
+        return True
+    return serializer.nested and to_internal_value is BaseModelSerializer.to_internal_value
+
+
+def resolve_related_objects(serializer, data, user=None):
+    """
+    Resolve the related objects referenced by a list of objects being created or updated in bulk via the REST API, so
+    that all references to each model are retrieved at once rather than one at a time. Returns a mapping of (model,
+    reference key) to each resolved object, for use by get_related_object_by_attrs().
+
+    View permissions are enforced as by get_related_object_by_attrs(). Any reference which cannot be resolved to
+    exactly one object here is omitted, to be resolved individually (and any error reported) as usual.
+
+    :param serializer: The serializer for an individual object
+    :param data: The list of object representations (dictionaries) being created or updated
+    :param user: The user making the request
+    """
+    # Collect all references to related objects by model, omitting the serializer's own model (whose objects may be
+    # created or modified by the request)
+    references = defaultdict(dict)
+    for field_name, field in serializer.fields.items():
+        many = isinstance(field, ListSerializer)
+        nested_serializer = field.child if many else field
+        if field.read_only or not _is_resolved_by_attrs(nested_serializer):
+            continue
+        model = nested_serializer.Meta.model
+        if model is serializer.Meta.model:
+            continue
+        for item in data:
+            if not isinstance(item, dict) or item.get(field_name) is None:
+                continue
+            values = item[field_name] if many else [item[field_name]]
+            if not isinstance(values, list):
+                continue
+            for attrs in values:
+                if (key := _get_reference_key(attrs)) is not None:
+                    references[model][key] = attrs
+
+    related_objects = {}
+    for model, model_references in references.items():
+        queryset = model.objects.all()
+        pks = {}
+        attr_references = {}
+        for key, attrs in model_references.items():
+            # Referencing an object solely by its numeric ID is not subject to view permissions
+            if isinstance(attrs, dict) and list(attrs) != ['id']:
+                attr_references[key] = attrs
+                continue
+            try:
+                pks[key] = int(attrs['id'] if isinstance(attrs, dict) else attrs)
+            except (TypeError, ValueError):
+                continue
+
+        # Resolve references to numeric IDs
+        if pks:
+            objects = queryset.in_bulk(set(pks.values()))
+            for key, pk in pks.items():
+                if pk in objects:
+                    related_objects[(model, key)] = objects[pk]
+
+        # Resolve references by attributes, restricted to the objects which the user is permitted to view
+        if attr_references:
+            if user is not None and hasattr(queryset, 'restrict'):
+                queryset = queryset.restrict(user, 'view')
+            try:
+                resolved = _resolve_by_attrs(queryset, attr_references)
+            except (FieldError, TypeError, ValueError, ValidationError):
+                continue
+            for key, obj in resolved.items():
+                related_objects[(model, key)] = obj
+
+    return related_objects
@@ -1,11 +1,19 @@
+from collections import Counter, defaultdict
+from functools import partial
+
 from django.apps import apps
+from django.db import router, transaction
 from django.db.models import Count, F, OuterRef, QuerySet, Subquery
 from django.db.models.signals import post_delete, post_save, pre_delete
 
+from netbox.context import counter_queue
 from netbox.registry import registry
 
 from .fields import CounterCacheField
 
+# The number of objects corrected per UPDATE when repairing counters
+COUNTER_REPAIR_BATCH_SIZE = 1000
+
 
 def get_counters_for_model(model):
     """
@@ -19,9 +27,46 @@ def update_counter(model, pk, counter_name, value, using=None):
     Increment or decrement a counter field on an object identified by its model and primary key (PK). Positive values
     will increment; negative values will decrement.
     """
-    model.objects.using(using).filter(pk=pk).update(
-        **{counter_name: F(counter_name) + value}
-    )
+    update_counters(model, counter_name, {pk: value}, using=using)
+
+
+def update_counters(model, counter_name, deltas, using=None):
+    """
+    Apply a mapping of primary keys to increments for a counter field, updating all objects for which the increment
+    is the same at once. If deferred counter updates are active, the increments are instead queued once the current
+    transaction has been committed, to be applied by flush_counter_queue().
+    """
+    using = using or router.db_for_write(model)
+    if (queue := counter_queue.get()) is not None:
+        # Increments are queued only on commit, so that those made within a rolled back transaction are discarded
+        transaction.on_commit(partial(_queue_counter_deltas, queue, (using, model, counter_name), deltas), using=using)
+    else:
+        _apply_counter_deltas(model, counter_name, deltas, using)
+
+
+def _queue_counter_deltas(queue, key, deltas):
+    queue.setdefault(key, Counter()).update(deltas)
+
+
+def _apply_counter_deltas(model, counter_name, deltas, using):
+    pks_by_delta = defaultdict(list)
+    for pk, delta in deltas.items():
+        if delta:
+            pks_by_delta[delta].append(pk)
+    for delta, pks in sorted(pks_by_delta.items()):
+        # Objects are updated in order of primary key to avoid deadlocks between concurrent updates
+        model.objects.using(using).filter(pk__in=sorted(pks)).update(**{counter_name: F(counter_name) + delta})
+
+
+def flush_counter_queue(queue):
+    """
+    Apply the counter increments accumulated in a queue of deferred counter updates, with a single UPDATE for each
+    counter and increment. The queue maps (database alias, model, counter name) to the net increment for each object.
+    """
+    for (using, model, counter_name), deltas in queue.items():
+        with transaction.atomic(using=using):
+            _apply_counter_deltas(model, counter_name, deltas, using)
+    queue.clear()
 
 
 def update_counts(model, field_name, related_query):
@@ -42,6 +87,43 @@ def update_counts(model, field_name, related_query):
     })
 
 
+def verify_counts(model, field_name, related_query, using=None):
+    """
+    Detect and repair any drift in the given model's counter field. Rather than updating every object, the related
+    objects are counted with a single grouped query and compared with the cached counts; only objects whose counts
+    differ are updated, with one UPDATE for each correct value. Returns the number of objects corrected.
+
+        verify_counts(Device, '_interface_count', 'interfaces')
+    """
+    using = using or router.db_for_write(model)
+    relation = next(
+        rel for rel in model._meta.related_objects
+        if rel.one_to_many and rel.field.related_query_name() == related_query
+    )
+    fk_name = relation.field.attname
+    actual_counts = dict(
+        relation.related_model._base_manager.using(using)
+        .filter(**{f'{fk_name}__isnull': False})
+        .values_list(fk_name)
+        .annotate(count=Count('pk'))
+        .order_by()
+    )
+
+    drifted = defaultdict(list)
+    cached_counts = model._base_manager.using(using).values_list('pk', field_name).order_by()
+    for pk, cached_count in cached_counts.iterator(chunk_size=COUNTER_REPAIR_BATCH_SIZE):
+        if cached_count != (count := actual_counts.get(pk, 0)):
+            drifted[count].append(pk)
+
+    for count, pks in drifted.items():
+        for i in range(0, len(pks), COUNTER_REPAIR_BATCH_SIZE):
+            model._base_manager.using(using).filter(pk__in=pks[i:i + COUNTER_REPAIR_BATCH_SIZE]).update(
+                **{field_name: count}
+            )
+
+    return sum(len(pks) for pks in drifted.values())
+
+
 #
 # Signal handlers
 #
@@ -1,4 +1,5 @@
 import csv
+import json
 
 from django.http import StreamingHttpResponse
 from django.utils.encoding import force_str
@@ -7,11 +8,14 @@ from django.utils.translation import gettext_lazy as _
 from django_tables2.data import TableQuerysetData
 from django_tables2.export import TableExport as TableExport_
 from django_tables2.rows import BoundRow
+from rest_framework.utils.encoders import JSONEncoder
 
 from utilities.constants import CSV_DELIMITERS
 
 __all__ = (
     'TableExport',
+    'stream_serialized_csv_response',
+    'stream_serialized_ndjson_response',
     'stream_table_csv_response',
 )
 
@@ -91,3 +95,77 @@ def stream_table_csv_response(table, exclude_columns=None, filename=None, delimi
     if filename is not None:
         response['Content-Disposition'] = content_disposition_header(as_attachment=True, filename=filename)
     return response
+
+
+def iter_serialized_chunks(queryset, get_serializer, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield the serialized representations of all objects in the QuerySet, in lists of up to chunk_size objects. The
+    QuerySet is iterated in chunks using QuerySet.iterator(), with any prefetches applied to each chunk.
+
+    Args:
+        queryset: The QuerySet to serialize
+        get_serializer: A callable which returns a serializer for a list of objects, e.g. a view's get_serializer()
+        chunk_size: The number of objects to retrieve and serialize at once
+    """
+    chunk = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            yield get_serializer(chunk, many=True).data
+            chunk = []
+    if chunk:
+        yield get_serializer(chunk, many=True).data
+
+
+def stream_serialized_ndjson_response(queryset, get_serializer, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Return a StreamingHttpResponse that emits each object in the QuerySet as a line of JSON, without buffering the
+    entire result set in memory.
+
+    Args:
+        queryset: The QuerySet to export
+        get_serializer: A callable which returns a serializer for a list of objects, e.g. a view's get_serializer()
+        chunk_size: The number of objects to retrieve and serialize at once
+    """
+    def line_generator():
+        for data in iter_serialized_chunks(queryset, get_serializer, chunk_size):
+            yield ''.join(
+                json.dumps(item, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')) + '\n'
+                for item in data
+            )
+
+    return StreamingHttpResponse(line_generator(), content_type='application/x-ndjson; charset=utf-8')
+
+
+def stream_serialized_csv_response(queryset, get_serializer, chunk_size=EXPORT_CHUNK_SIZE, delimiter=None):
+    """
+    Return a StreamingHttpResponse that emits each object in the QuerySet as a row of CSV, without buffering the
+    entire result set in memory. Columns correspond to the serializer's fields; nested objects and lists are
+    rendered as JSON.
+
+    Args:
+        queryset: The QuerySet to export
+        get_serializer: A callable which returns a serializer for a list of objects, e.g. a view's get_serializer()
+        chunk_size: The number of objects to retrieve and serialize at once
+        delimiter: Name of a delimiter in utilities.constants.CSV_DELIMITERS (defaults to 'comma')
+    """
+    if delimiter and delimiter not in CSV_DELIMITERS:
+        raise ValueError(_("Invalid delimiter name: {name}").format(name=delimiter))
+    writer = csv.writer(_EchoBuffer(), delimiter=CSV_DELIMITERS[delimiter or 'comma'])
+    columns = list(get_serializer().fields)
+
+    def get_value(value):
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, cls=JSONEncoder, ensure_ascii=False)
+        return force_str(value)
+
+    def row_generator():
+        yield writer.writerow(columns)
+        for data in iter_serialized_chunks(queryset, get_serializer, chunk_size):
+            yield ''.join(
+                writer.writerow([get_value(item.get(column)) for column in columns]) for item in data
+            )
+
+    return StreamingHttpResponse(row_generator(), content_type='text/csv; charset=utf-8')
@@ -39,12 +39,26 @@ class BulkImportForm(ChangelogMessageMixin, BackgroundJobMixin, SyncedDataMixin,
         help_text=_("The character which delimits CSV fields. Applies only to CSV format."),
         required=False
     )
+    chunk_size = forms.IntegerField(
+        label=_("Chunk size"),
+        min_value=1,
+        required=False,
+        help_text=_(
+            "Commit records in chunks of this size, each in its own transaction. Applies only to background jobs."
+        )
+    )
 
     data_field = 'data'
 
     def clean(self):
         super().clean()
 
+        # Chunked imports are supported only by background jobs
+        if self.cleaned_data.get('chunk_size') and not self.cleaned_data.get('background_job'):
+            raise forms.ValidationError({
+                'chunk_size': _("Chunked imports must be executed as a background job.")
+            })
+
         # Determine import method
         import_method = self.cleaned_data.get('import_method') or ImportMethodChoices.DIRECT
 
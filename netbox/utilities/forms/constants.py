@@ -6,6 +6,9 @@ ALPHANUMERIC_EXPANSION_PATTERN = r'\[((?:[a-zA-Z0-9]+[?:,-])+[a-zA-Z0-9]+)\]'
 IP4_EXPANSION_PATTERN = r'\[((?:[0-9]{1,3}[?:,-])+[0-9]{1,3})\]'
 IP6_EXPANSION_PATTERN = r'\[((?:[0-9a-fA-F]{1,4}[?:,-])+[0-9a-fA-F]{1,4})\]'
 
+# The maximum number of values resolved per query by resolve_csv_lookups()
+CSV_LOOKUP_BATCH_SIZE = 1000
+
 # Boolean widget choices
 BOOLEAN_WITH_BLANK_CHOICES = (
     ('', '---------'),
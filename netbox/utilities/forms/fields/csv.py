@@ -69,7 +69,27 @@ class CSVTypedChoiceField(forms.TypedChoiceField):
     widget = CSVSelectWidget
 
 
-class CSVModelChoiceField(forms.ModelChoiceField):
+class CSVLookupMixin:
+    """
+    Allows values to be resolved from a map of related objects resolved in advance for a bulk import (see
+    resolve_csv_lookups()), rather than querying the database for each value. The map (if any) is assigned to
+    `lookup_map`, keyed by the string representation of each value. Values absent from the map are resolved as usual.
+    """
+    lookup_map = None
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        # Record the field's initial queryset, so that any later change to it (e.g. by a form's __init__()) can be
+        # detected
+        result.initial_queryset = result.queryset
+        return result
+
+    @property
+    def queryset_changed(self):
+        return self.queryset is not getattr(self, 'initial_queryset', None)
+
+
+class CSVModelChoiceField(CSVLookupMixin, forms.ModelChoiceField):
     """
     Extends Django's `ModelChoiceField` to provide additional validation for CSV values.
     """
@@ -78,6 +98,15 @@ class CSVModelChoiceField(forms.ModelChoiceField):
     }
 
     def to_python(self, value):
+        if self.lookup_map is not None and isinstance(value, (str, int)) and value not in self.empty_values:
+            if objects := self.lookup_map.get(str(value)):
+                if len(objects) > 1:
+                    raise forms.ValidationError(
+                        _('"{value}" is not a unique value for this field; multiple objects were found').format(
+                            value=value
+                        )
+                    )
+                return objects[0]
         try:
             return super().to_python(value)
         except MultipleObjectsReturned:
@@ -90,7 +119,7 @@ class CSVModelChoiceField(forms.ModelChoiceField):
             )
 
 
-class CSVModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+class CSVModelMultipleChoiceField(CSVLookupMixin, forms.ModelMultipleChoiceField):
     """
     Extends Django's `ModelMultipleChoiceField` to support comma-separated values.
     """
@@ -103,6 +132,15 @@ class CSVModelMultipleChoiceField(forms.ModelMultipleChoiceField):
             value = value.split(',') if value else []
         return super().clean(value)
 
+    def _check_values(self, value):
+        # Return the matching objects from the lookup map only if every value can be resolved from it
+        if self.lookup_map is not None and all(str(v) in self.lookup_map for v in value):
+            objects = {}
+            for v in value:
+                objects.update((obj.pk, obj) for obj in self.lookup_map[str(v)])
+            return list(objects.values())
+        return super()._check_values(value)
+
 
 class CSVContentTypeField(CSVModelChoiceField):
     """
@@ -2,6 +2,8 @@ import re
 import warnings
 
 from django import forms
+from django.core.exceptions import FieldError, ValidationError
+from django.db import DatabaseError, transaction
 from django.forms.models import fields_for_model
 from django.utils.translation import gettext as _
 
@@ -12,6 +14,7 @@ from .constants import *
 
 __all__ = (
     'add_blank_choice',
+    'apply_csv_lookups',
     'expand_alphanumeric_pattern',
     'expand_ipnetwork_pattern',
     'form_from_model',
@@ -21,6 +24,7 @@ __all__ = (
     'parse_alphanumeric_range',
     'parse_csv',
     'parse_numeric_range',
+    'resolve_csv_lookups',
     'restrict_form_fields',
     'validate_csv',
 )
@@ -225,6 +229,74 @@ def restrict_form_fields(form, user, action='view'):
             field.queryset = field.queryset.restrict(user, action)
 
 
+def resolve_csv_lookups(form, records, user, action='view'):
+    """
+    Resolve in advance the related objects referenced by a set of bulk import records. For each CSV model choice
+    field on the given (unbound) import form, all distinct values found in the records are resolved at once, subject
+    to the same permission restriction applied by restrict_form_fields(). Returns a dictionary mapping each field name
+    to its to_field_name and a map of values to matching objects, for use by apply_csv_lookups().
+
+    Fields whose querysets are modified by the form itself, and fields which reference the model being imported (and
+    which may therefore reference objects created or modified by the import), are omitted.
+    """
+    from .fields.csv import CSVContentTypeField, CSVLookupMixin, CSVModelMultipleChoiceField
+
+    lookups = {}
+    fields = {
+        name: field for name, field in form.fields.items()
+        if isinstance(field, CSVLookupMixin)
+        and not isinstance(field, CSVContentTypeField)
+        and not field.queryset_changed
+        and field.queryset.model is not form._meta.model
+    }
+    restrict_form_fields(form, user, action)
+
+    for name, field in fields.items():
+        key = field.to_field_name or 'pk'
+        if '.' in key or '__' in key:
+            continue
+
+        # Collect all distinct values referenced by the records
+        values = set()
+        for record in records:
+            value = record.get(name)
+            if isinstance(field, CSVModelMultipleChoiceField) and isinstance(value, str):
+                value = value.split(',')
+            for v in (value if isinstance(value, list) else [value]):
+                if isinstance(v, (str, int)) and v not in field.empty_values:
+                    values.add(str(v))
+        if not values:
+            continue
+
+        lookup_map = {}
+        values = sorted(values)
+        try:
+            for i in range(0, len(values), CSV_LOOKUP_BATCH_SIZE):
+                queryset = field.queryset.filter(**{f'{key}__in': values[i:i + CSV_LOOKUP_BATCH_SIZE]})
+                # Invalid values may raise a database error; this must not abort the enclosing transaction
+                with transaction.atomic(using=queryset.db):
+                    for obj in queryset:
+                        lookup_map.setdefault(str(getattr(obj, key)), []).append(obj)
+        except (AttributeError, DatabaseError, FieldError, TypeError, ValueError, ValidationError):
+            # Leave any values for this field to be resolved individually
+            continue
+        lookups[name] = (field.to_field_name, lookup_map)
+
+    return lookups
+
+
+def apply_csv_lookups(form, lookups):
+    """
+    Assign the related objects resolved by resolve_csv_lookups() to the corresponding fields of an import form bound
+    to a single record. This must be called before the form's fields are restricted. Fields whose querysets have been
+    modified by the form are skipped.
+    """
+    for name, (to_field_name, lookup_map) in lookups.items():
+        field = form.fields.get(name)
+        if field is not None and not field.queryset_changed and field.to_field_name == to_field_name:
+            field.lookup_map = lookup_map
+
+
 def parse_csv(reader):
     """
     Parse a csv_reader object into a headers dictionary and a list of records dictionaries. Raise an error
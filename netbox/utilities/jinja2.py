@@ -1,8 +1,13 @@
 import fnmatch
 import os
 import re
+import threading
+import uuid
+from collections import OrderedDict
 
 from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from jinja2 import BaseLoader, TemplateNotFound
@@ -18,6 +23,8 @@ __all__ = (
     'JINJA2_TEMPLATE_RE',
     'DataFileLoader',
     'env_filter',
+    'get_jinja2_template',
+    'invalidate_jinja2_templates',
     'render_jinja2',
     'sanitize_http_header',
     'validate_jinja2_syntax',
@@ -31,6 +38,13 @@ HTTP_HEADER_INVALID_CHARS_RE = re.compile(r'[\x00-\x1f\x7f]')
 # template-capable field (e.g. Webhook.payload_url) is being used as a literal value or a template.
 JINJA2_TEMPLATE_RE = re.compile(r'\{[{%#]')
 
+# Identifies the current generation of compiled templates which load DataFiles (see invalidate_jinja2_templates())
+JINJA2_TEMPLATE_VERSION_CACHE_KEY = 'jinja2_template_version'
+
+# Process-wide LRU cache of compiled templates
+_template_cache = OrderedDict()
+_template_cache_lock = threading.Lock()
+
 
 def env_filter(name):
     """
@@ -105,40 +119,107 @@ def _jinja2_filters(filters=None):
     return {**DEFAULT_JINJA2_FILTERS, **get_config().JINJA2_FILTERS, **(filters or {})}
 
 
-def render_jinja2(template_code, context, environment_params=None, data_file=None, debug=False, filters=None):
+def _freeze(value):
     """
-    Render a Jinja2 template with the provided context. Return the rendered content.
-
-    If debug is True, the Jinja2 debug extension is enabled to assist with template development.
-
-    The optional `filters` argument is a mapping of additional Jinja2 filters to make available for this render only
-    (e.g. context-specific sanitization filters). These take precedence over the default and user-configured filters.
+    Return a hashable representation of the given value for use in a cache key.
     """
-    environment_params = dict(environment_params or {})
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-    if debug:
-        extensions = list(environment_params.get('extensions', []))
-        if 'jinja2.ext.debug' not in extensions:
-            extensions.append('jinja2.ext.debug')
-        environment_params['extensions'] = extensions
 
+def _compile_jinja2_template(template_code, environment_params, data_file=None, filters=None):
+    """
+    Build a Jinja2 environment and compile the given template within it.
+    """
     if 'loader' not in environment_params:
         if data_file:
-            loader = DataFileLoader(data_file.source)
+            loader = DataFileLoader(data_file.source_id)
             loader.cache_templates({
                 data_file.path: template_code
             })
         else:
             loader = BaseLoader()
-        environment_params['loader'] = loader
+        environment_params = {**environment_params, 'loader': loader}
 
     environment = SandboxedEnvironment(**environment_params)
     environment.filters.update(_jinja2_filters(filters))
 
     if data_file:
-        template = environment.get_template(data_file.path)
-    else:
-        template = environment.from_string(source=template_code)
+        return environment.get_template(data_file.path)
+    return environment.from_string(source=template_code)
+
+
+def get_jinja2_template(template_code, environment_params=None, data_file=None, debug=False, filters=None):
+    """
+    Return the compiled Jinja2 template for the given template code and environment. Compiled templates are cached
+    per process (up to JINJA2_TEMPLATE_CACHE_SIZE templates), keyed by the template code, environment parameters,
+    and filters. Templates which load DataFiles are additionally keyed by the DataFile, and are invalidated whenever
+    a DataSource is synchronized.
+    """
+    environment_params = dict(environment_params or {})
+
+    if debug:
+        extensions = list(environment_params.get('extensions', []))
+        if 'jinja2.ext.debug' not in extensions:
+            extensions.append('jinja2.ext.debug')
+        environment_params['extensions'] = extensions
+
+    # Environments with a custom loader cannot be cached
+    if not settings.JINJA2_TEMPLATE_CACHE_SIZE or 'loader' in environment_params:
+        return _compile_jinja2_template(template_code, environment_params, data_file, filters)
+
+    key = (
+        template_code,
+        _freeze(environment_params),
+        _freeze(_jinja2_filters(filters)),
+    )
+    if data_file:
+        cache.add(JINJA2_TEMPLATE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        key += (data_file.source_id, data_file.path, cache.get(JINJA2_TEMPLATE_VERSION_CACHE_KEY))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable environment parameters or filters
+        return _compile_jinja2_template(template_code, environment_params, data_file, filters)
+
+    with _template_cache_lock:
+        if (template := _template_cache.get(key)) is not None:
+            _template_cache.move_to_end(key)
+            return template
+
+    template = _compile_jinja2_template(template_code, environment_params, data_file, filters)
+
+    with _template_cache_lock:
+        _template_cache[key] = template
+        while len(_template_cache) > settings.JINJA2_TEMPLATE_CACHE_SIZE:
+            _template_cache.popitem(last=False)
+
+    return template
+
+
+def invalidate_jinja2_templates():
+    """
+    Invalidate all cached templates which load DataFiles, in all processes. Templates which do not load DataFiles are
+    keyed by their content, and need not be invalidated.
+    """
+    cache.set(JINJA2_TEMPLATE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def render_jinja2(template_code, context, environment_params=None, data_file=None, debug=False, filters=None):
+    """
+    Render a Jinja2 template with the provided context. Return the rendered content.
+
+    If debug is True, the Jinja2 debug extension is enabled to assist with template development.
+
+    The optional `filters` argument is a mapping of additional Jinja2 filters to make available for this render only
+    (e.g. context-specific sanitization filters). These take precedence over the default and user-configured filters.
+
+    Compiled templates are cached; see get_jinja2_template().
+    """
+    template = get_jinja2_template(template_code, environment_params, data_file, debug=debug, filters=filters)
     return template.render(**context)
 
 
@@ -18,9 +18,15 @@ def is_background_request(request):
     return hasattr(request, 'job')
 
 
-def process_request_as_job(view, request, name=None):
+def process_request_as_job(view, request, name=None, queue_name=None):
     """
     Process a request using a view as a background job.
+
+    Args:
+        view: The view class which processes the request
+        request: The request being deferred
+        name: Name for the job (optional)
+        queue_name: The name of the queue on which the job is enqueued (optional)
     """
 
     # Check that the request that is not already being processed as a background job (would be a loop)
@@ -36,6 +42,7 @@ def process_request_as_job(view, request, name=None):
         user=request.user,
         view_cls=view,
         request=request_copy,
+        queue_name=queue_name,
     )
 
     # Record a message on the original request indicating deferral to a background job
@@ -0,0 +1,268 @@
+import json
+from functools import reduce
+from operator import or_
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, OrderBy, Q
+from django.db.models.constants import LOOKUP_SEP
+
+__all__ = (
+    'KeysetField',
+    'apply_keyset_ordering',
+    'decode_cursor',
+    'encode_cursor',
+    'filter_after',
+    'get_keyset_ordering',
+    'get_keyset_values',
+    'lookup_keyset_values',
+)
+
+CURSOR_SALT = 'netbox.pagination.cursor'
+
+# The maximum depth to which ordering by a related object is expanded to that object's own ordering
+MAX_ORDERING_DEPTH = 4
+
+
+class KeysetField:
+    """
+    A single field in a keyset ordering, along with its sort direction and the placement of null values.
+    """
+    def __init__(self, name, descending=False, nulls_first=None, expression=None):
+        self.name = name
+        self.descending = descending
+        # PostgreSQL sorts nulls as larger than any other value by default
+        self.nulls_first = descending if nulls_first is None else nulls_first
+        # An expression (e.g. a collation) to be annotated on the QuerySet as `name`
+        self.expression = expression
+
+    def __repr__(self):
+        return f'<KeysetField {self.serialize()}>'
+
+    def serialize(self):
+        return [self.name, self.descending, self.nulls_first, repr(self.expression) if self.expression else None]
+
+    def as_order_by(self):
+        nulls = {'nulls_first': True} if self.nulls_first else {'nulls_last': True}
+        if self.descending:
+            return F(self.name).desc(**nulls)
+        return F(self.name).asc(**nulls)
+
+    def after(self, value):
+        """
+        Return a Q object matching rows which sort strictly after the given value, or None if no rows can.
+        """
+        if value is None:
+            return Q(**{f'{self.name}__isnull': False}) if self.nulls_first else None
+        lookup = 'lt' if self.descending else 'gt'
+        q = Q(**{f'{self.name}__{lookup}': value})
+        if not self.nulls_first:
+            q |= Q(**{f'{self.name}__isnull': True})
+        return q
+
+    def equal(self, value):
+        if value is None:
+            return Q(**{f'{self.name}__isnull': True})
+        return Q(**{self.name: value})
+
+
+class CursorSerializer:
+    """
+    JSON serializer for signed cursors which accepts values of any type stored by a model field (e.g. datetimes,
+    UUIDs, or IP networks).
+    """
+    class Encoder(DjangoJSONEncoder):
+        def default(self, o):
+            try:
+                return super().default(o)
+            except TypeError:
+                return str(o)
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'), cls=self.Encoder).encode('latin-1')
+
+    def loads(self, data):
+        return json.loads(data.decode('latin-1'))
+
+
+def _iter_ordering(ordering):
+    """
+    Yield a (name, descending, nulls_first) three-tuple for each item in an ordering.
+    """
+    for item in ordering:
+        if isinstance(item, str):
+            if item == '?':
+                raise ValueError("Random ordering cannot be paginated by keyset.")
+            yield item.lstrip('-'), item.startswith('-'), None
+        elif isinstance(item, F):
+            yield item.name, False, None
+        elif isinstance(item, OrderBy):
+            nulls_first = True if item.nulls_first else (False if item.nulls_last else None)
+            if isinstance(item.expression, F):
+                yield item.expression.name, item.descending, nulls_first
+            else:
+                yield item.expression, item.descending, nulls_first
+        elif hasattr(item, 'resolve_expression'):
+            # An expression, such as a collation applied to a naturalized ordering field
+            yield item, False, None
+        else:
+            raise ValueError(f"Ordering by {item} cannot be paginated by keyset.")
+
+
+def _resolve_ordering(model, ordering, annotations, prefix='', invert=False, depth=0):
+    """
+    Resolve an ordering to a list of KeysetFields, expanding any ordering by a related object to that object's own
+    ordering (as Django does when ordering a query).
+    """
+    fields = []
+    for name, descending, nulls_first in _iter_ordering(ordering):
+        descending = descending != invert
+        if not isinstance(name, str):
+            # Expressions are annotated on the QuerySet so that they can be compared
+            if prefix:
+                raise ValueError(f"Ordering of related object {prefix.rstrip('_')} cannot be paginated by keyset.")
+            fields.append(KeysetField(f'_keyset_{len(fields)}', descending, nulls_first, expression=name))
+            continue
+        if not prefix and (name in annotations or name == 'pk'):
+            fields.append(KeysetField(name, descending, nulls_first))
+            continue
+
+        # Walk the lookup path to its final field
+        current = model
+        field = None
+        path = name.split(LOOKUP_SEP)
+        for i, part in enumerate(path):
+            try:
+                field = current._meta.pk if part == 'pk' else current._meta.get_field(part)
+            except FieldDoesNotExist:
+                raise ValueError(f"Ordering by {prefix}{name} cannot be paginated by keyset.")
+            if field.many_to_many or field.one_to_many or not field.concrete:
+                raise ValueError(f"Ordering by relation {prefix}{name} cannot be paginated by keyset.")
+            if field.is_relation and i < len(path) - 1:
+                current = field.related_model
+
+        # Ordering by a related object employs that object's ordering, or its primary key
+        if field.is_relation and path[-1] != field.attname:
+            related_ordering = field.related_model._meta.ordering
+            if related_ordering and depth < MAX_ORDERING_DEPTH:
+                fields.extend(_resolve_ordering(
+                    field.related_model,
+                    related_ordering,
+                    annotations,
+                    prefix=f'{prefix}{name}{LOOKUP_SEP}',
+                    invert=descending,
+                    depth=depth + 1
+                ))
+            else:
+                path[-1] = field.attname
+                fields.append(KeysetField(f'{prefix}{LOOKUP_SEP.join(path)}', descending, nulls_first))
+            continue
+
+        fields.append(KeysetField(f'{prefix}{name}', descending, nulls_first))
+
+    return fields
+
+
+def get_keyset_ordering(queryset):
+    """
+    Return the ordering of a QuerySet as a tuple of KeysetFields, ending with the primary key to ensure that the
+    ordering is unique. Raises ValueError if the ordering cannot be expressed as a keyset.
+    """
+    query = queryset.query
+    if query.extra_order_by:
+        raise ValueError("Extra ordering cannot be paginated by keyset.")
+    if query.order_by:
+        ordering = query.order_by
+    elif query.default_ordering:
+        ordering = queryset.model._meta.ordering
+    else:
+        ordering = ()
+
+    fields = _resolve_ordering(queryset.model, ordering, query.annotations)
+    pk_names = {'pk', queryset.model._meta.pk.name, queryset.model._meta.pk.attname}
+    if not any(field.name in pk_names for field in fields):
+        fields.append(KeysetField('pk'))
+    return tuple(fields)
+
+
+def apply_keyset_ordering(queryset, ordering):
+    """
+    Order the QuerySet by the given keyset ordering, annotating any ordering expressions.
+    """
+    if expressions := {field.name: field.expression for field in ordering if field.expression is not None}:
+        queryset = queryset.annotate(**expressions)
+    return queryset.order_by(*(field.as_order_by() for field in ordering))
+
+
+def get_keyset_values(queryset, ordering, obj):
+    """
+    Return the values of the keyset ordering fields for the given object (or dictionary) from the QuerySet. Values
+    which cannot be read directly from the object are retrieved from the database.
+    """
+    names = [field.name for field in ordering]
+    if isinstance(obj, dict):
+        if all(name in obj for name in names):
+            return [obj[name] for name in names]
+        pk = obj['pk'] if 'pk' in obj else obj[queryset.model._meta.pk.attname]
+    else:
+        if not any(LOOKUP_SEP in name for name in names):
+            return [getattr(obj, name) for name in names]
+        pk = obj.pk
+    return lookup_keyset_values(queryset, ordering, pk)
+
+
+def lookup_keyset_values(queryset, ordering, pk):
+    """
+    Retrieve the values of the keyset ordering fields for the object with the given primary key from the QuerySet.
+    Raises ValueError if the object does not exist within the QuerySet.
+    """
+    values = queryset.order_by().filter(pk=pk).values_list(*(field.name for field in ordering)).first()
+    if values is None:
+        raise ValueError(f"Object {pk} not found.")
+    return list(values)
+
+
+def filter_after(queryset, ordering, values):
+    """
+    Filter the QuerySet to include only objects which sort after the given keyset values.
+    """
+    conditions = []
+    equal = Q()
+    for field, value in zip(ordering, values):
+        if (after := field.after(value)) is not None:
+            conditions.append(equal & after)
+        equal &= field.equal(value)
+    if not conditions:
+        return queryset.none()
+    return queryset.filter(reduce(or_, conditions))
+
+
+def encode_cursor(queryset, ordering, values):
+    """
+    Return an opaque, signed cursor representing the given keyset values of a QuerySet's ordering.
+    """
+    return signing.dumps(
+        {
+            'm': queryset.model._meta.label_lower,
+            'o': [field.serialize() for field in ordering],
+            'v': values,
+        },
+        salt=CURSOR_SALT,
+        serializer=CursorSerializer,
+        compress=True
+    )
+
+
+def decode_cursor(queryset, ordering, cursor):
+    """
+    Return the keyset values encoded in a signed cursor. Raises ValueError if the cursor is invalid or does not
+    correspond to the QuerySet's model and ordering.
+    """
+    try:
+        data = signing.loads(cursor, salt=CURSOR_SALT, serializer=CursorSerializer)
+    except signing.BadSignature:
+        raise ValueError("Invalid cursor.")
+    if data.get('m') != queryset.model._meta.label_lower or data.get('o') != [f.serialize() for f in ordering]:
+        raise ValueError("Cursor does not match the requested ordering.")
+    return data['v']
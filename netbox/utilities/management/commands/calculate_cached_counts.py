@@ -3,12 +3,18 @@ from collections import defaultdict
 from django.core.management.base import BaseCommand
 
 from netbox.registry import registry
-from utilities.counters import update_counts
+from utilities.counters import update_counts, verify_counts
 
 
 class Command(BaseCommand):
     help = "Force a recalculation of all cached counter fields"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify', action='store_true',
+            help="Detect and correct only those cached counts which have drifted, rather than recalculating all counts"
+        )
+
     @staticmethod
     def collect_models():
         """
@@ -29,6 +35,11 @@ class Command(BaseCommand):
     def handle(self, *model_names, **options):
         for model, mappings in self.collect_models().items():
             for field_name, related_query in mappings.items():
-                update_counts(model, field_name, related_query)
+                if not options['verify']:
+                    update_counts(model, field_name, related_query)
+                    continue
+                corrected = verify_counts(model, field_name, related_query)
+                if corrected and options['verbosity']:
+                    self.stdout.write(f"Corrected {field_name} for {corrected} {model._meta.verbose_name_plural}")
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
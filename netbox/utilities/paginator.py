@@ -1,10 +1,18 @@
+from django.conf import settings
 from django.core.paginator import Page, Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from django_tables2.data import TableQuerysetData
+from django_tables2.rows import BoundRows
 
 from netbox.config import get_config
+from netbox.constants import COUNT_MODE_ESTIMATE, COUNT_MODE_EXACT, COUNT_MODE_NONE, COUNT_MODES
+from utilities.query import get_queryset_count
 
 __all__ = (
     'EnhancedPage',
     'EnhancedPaginator',
+    'get_count_mode',
     'get_paginate_count',
 )
 
@@ -14,7 +22,7 @@ class EnhancedPaginator(Paginator):
         25, 50, 100, 250, 500, 1000
     )
 
-    def __init__(self, object_list, per_page, orphans=None, **kwargs):
+    def __init__(self, object_list, per_page, orphans=None, count_mode=None, **kwargs):
 
         # Determine the page size
         try:
@@ -30,8 +38,23 @@ class EnhancedPaginator(Paginator):
         elif orphans is None:
             orphans = 10
 
+        # Page navigation requires a count, so skipping the count falls back to an estimate
+        self.count_mode = count_mode or settings.PAGINATION_COUNT_MODE
+        if self.count_mode == COUNT_MODE_NONE:
+            self.count_mode = COUNT_MODE_ESTIMATE
+
         super().__init__(object_list, per_page, orphans=orphans, **kwargs)
 
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        # Tables paginate over their bound rows; count the underlying QuerySet
+        if isinstance(queryset, BoundRows) and isinstance(queryset.data, TableQuerysetData):
+            queryset = queryset.data.data
+        if self.count_mode != COUNT_MODE_EXACT and isinstance(queryset, QuerySet):
+            return get_queryset_count(queryset, self.count_mode)
+        return super().count
+
     def _get_page(self, *args, **kwargs):
         return EnhancedPage(*args, **kwargs)
 
@@ -62,6 +85,16 @@ class EnhancedPage(Page):
         return page_list
 
 
+def get_count_mode(request):
+    """
+    Return the count mode specified by the count_mode URL query parameter, if valid, or PAGINATION_COUNT_MODE.
+    """
+    count_mode = request.GET.get('count_mode')
+    if count_mode in COUNT_MODES:
+        return count_mode
+    return settings.PAGINATION_COUNT_MODE
+
+
 def get_paginate_count(request):
     """
     Determine the desired length of a page, using the following in order:
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 
 from django.apps import apps
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model, Q
+from django.db.models.constants import LOOKUP_SEP
 from django.utils.translation import gettext_lazy as _
 
 from netbox.registry import registry
@@ -10,6 +12,8 @@ from users.constants import CONSTRAINT_TOKEN_USER, RESERVED_ACTIONS
 
 __all__ = (
     'ModelAction',
+    'constraints_are_multivalued',
+    'get_constraint_filter',
     'get_permission_for_model',
     'permission_is_exempt',
     'qs_filter_from_constraints',
@@ -159,3 +163,60 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def constraints_are_multivalued(model, constraints):
+    """
+    Return True if any of the given ObjectPermission constraints traverses a many-to-many or one-to-many relationship,
+    in which case filtering by the constraints may match an object more than once.
+
+    :param model: The model to which the constraints apply
+    :param constraints: An iterable of constraint dictionaries
+    """
+    for constraint in constraints:
+        for lookup in constraint or {}:
+            current = model
+            for name in lookup.split(LOOKUP_SEP):
+                try:
+                    field = current._meta.get_field(name)
+                except FieldDoesNotExist:
+                    # A lookup or transform (e.g. "in" or "pk") rather than a field
+                    break
+                if field.many_to_many or field.one_to_many:
+                    return True
+                # Stop at non-relational fields and generic foreign keys
+                if not field.is_relation or field.related_model is None:
+                    break
+                current = field.related_model
+    return False
+
+
+def get_constraint_filter(user, permission, model):
+    """
+    Return a Q object matching all instances of a model permitted to the user by the specified permission (per
+    qs_filter_from_constraints()), and a boolean indicating whether the filter traverses a multi-valued relationship.
+    Compiled filters are cached on the user instance alongside its permissions (i.e. typically for the duration of a
+    request).
+
+    :param user: The User to which the permission has been granted
+    :param permission: Permission name in the format <app_label>.<action>_<model>
+    :param model: The model to which the permission applies
+    """
+    constraints = user._object_perm_cache[permission]
+
+    # Compiled filters are stored along with the constraints from which they were compiled, and are discarded if the
+    # user's permissions have since been reloaded.
+    cache = getattr(user, '_object_perm_filter_cache', None)
+    if cache is None:
+        cache = user._object_perm_filter_cache = {}
+    if (cached := cache.get(permission)) is not None and cached[0] is constraints:
+        return cached[1], cached[2]
+
+    tokens = {
+        CONSTRAINT_TOKEN_USER: user,
+    }
+    qs_filter = qs_filter_from_constraints(constraints, tokens)
+    multivalued = bool(qs_filter) and constraints_are_multivalued(model._meta.concrete_model, constraints)
+    cache[permission] = (constraints, qs_filter, multivalued)
+
+    return qs_filter, multivalued
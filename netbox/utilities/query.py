@@ -1,11 +1,21 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
+from netbox.constants import COUNT_MODE_CACHED, COUNT_MODE_ESTIMATE, COUNT_MODE_NONE
 from utilities.mptt import TreeManager
 
 __all__ = (
     'count_related',
     'dict_to_filter_params',
+    'estimate_count',
+    'get_queryset_count',
     'reapply_model_ordering',
 )
 
@@ -72,3 +82,64 @@ def reapply_model_ordering(queryset: QuerySet) -> QuerySet:
 
     ordering = queryset.model._meta.ordering
     return queryset.order_by(*ordering)
+
+
+def estimate_count(queryset):
+    """
+    Return the number of rows the database's query planner expects the given QuerySet to return. This avoids
+    executing the query but may differ significantly from the actual count. Returns None if the database does not
+    support estimation.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def get_queryset_count(queryset, mode=None, count=None):
+    """
+    Return the number of objects in a QuerySet according to the given count mode (PAGINATION_COUNT_MODE by default):
+
+        exact: Count all matching rows.
+        estimate: Use the query planner's estimate if it meets PAGINATION_COUNT_ESTIMATE_THRESHOLD; otherwise count
+            all matching rows.
+        cached: Count all matching rows, caching the result for PAGINATION_COUNT_CACHE_TIMEOUT seconds. The cache is
+            keyed by the underlying SQL query, so identical filters (and permission constraints) share a count.
+        none: Do not count; return None.
+
+    An alternative callable may be passed as `count` to determine the exact count of the QuerySet.
+    """
+    mode = mode or settings.PAGINATION_COUNT_MODE
+    count = count or queryset.count
+
+    if mode == COUNT_MODE_NONE:
+        return None
+
+    if mode == COUNT_MODE_ESTIMATE:
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD:
+            return estimate
+        return count()
+
+    if mode == COUNT_MODE_CACHED and settings.PAGINATION_COUNT_CACHE_TIMEOUT:
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        digest = hashlib.sha256(repr((sql, params)).encode()).hexdigest()
+        cache_key = f'count:{queryset.model._meta.label_lower}:{digest}'
+        if (value := cache.get(cache_key)) is None:
+            value = count()
+            cache.set(cache_key, value, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return value
+
+    return count()
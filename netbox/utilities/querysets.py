@@ -1,7 +1,6 @@
 from django.db.models import Prefetch, QuerySet
 
-from users.constants import CONSTRAINT_TOKEN_USER
-from utilities.permissions import get_permission_for_model, permission_is_exempt, qs_filter_from_constraints
+from utilities.permissions import get_constraint_filter, get_permission_for_model, permission_is_exempt
 
 __all__ = (
     'RestrictedPrefetch',
@@ -57,14 +56,16 @@ class RestrictedQuerySet(QuerySet):
             return self.none()
 
         # Filter the queryset to include only objects with allowed attributes
-        constraints = user._object_perm_cache[permission_required]
-        tokens = {
-            CONSTRAINT_TOKEN_USER: user,
-        }
-        if attrs := qs_filter_from_constraints(constraints, tokens):
+        attrs, multivalued = get_constraint_filter(user, permission_required, self.model)
+        if not attrs:
+            return self
+
+        if multivalued:
             # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
             # DISTINCT acts globally on the entire request, which may not be desirable.
             allowed_objects = self.model.objects.filter(attrs)
             return self.filter(pk__in=allowed_objects)
 
-        return self
+        # Constraints which do not span multi-valued relationships cannot produce duplicates, and can be applied
+        # directly
+        return self.filter(attrs)
@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.test import Client, RequestFactory, TestCase, override_settings, tag
 from django.urls import reverse
 from drf_spectacular.drainage import GENERATOR_STATS
@@ -18,10 +19,12 @@ from netbox.registry import registry
 from users.models import ObjectPermission
 from utilities.api import (
     get_prefetches_for_serializer,
+    get_related_object_by_attrs,
     get_serializer_for_model,
     get_view_name,
     is_api_request,
     is_graphql_request,
+    resolve_related_objects,
 )
 from utilities.testing import APITestCase, disable_warnings
 
@@ -229,6 +232,64 @@ class WritableNestedSerializerTestCase(APITestCase):
         self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(VLAN.objects.count(), 0)
 
+    def test_resolve_related_objects(self):
+        data = [
+            {'vid': 100, 'name': 'Test VLAN 100', 'site': {'name': 'Site 1'}},
+            {'vid': 101, 'name': 'Test VLAN 101', 'site': {'region': {'slug': 'region-a'}, 'slug': 'site-2'}},
+            {'vid': 102, 'name': 'Test VLAN 102', 'site': self.site1.pk},
+            {'vid': 103, 'name': 'Test VLAN 103', 'site': {'region': {'name': 'Region A'}}},
+        ]
+        self.add_permissions('dcim.view_site')
+        related_objects = resolve_related_objects(VLANSerializer(), data, self.user)
+
+        # All unambiguous references should have been resolved in advance
+        queryset = Site.objects.all()
+        references = (
+            (data[0]['site'], self.site1),
+            (data[1]['site'], self.site2),
+            (data[2]['site'], self.site1),
+        )
+        with self.assertNumQueries(0):
+            for attrs, site in references:
+                self.assertEqual(
+                    get_related_object_by_attrs(queryset, attrs, user=self.user, related_objects=related_objects),
+                    site
+                )
+
+        # An ambiguous reference should be resolved (and reported) individually
+        with self.assertRaisesMessage(ValidationError, "Multiple objects match"):
+            get_related_object_by_attrs(queryset, data[3]['site'], user=self.user, related_objects=related_objects)
+
+    def test_bulk_related_by_attributes(self):
+        data = [
+            {'vid': 100, 'name': 'Test VLAN 100', 'site': {'name': 'Site 1'}},
+            {'vid': 101, 'name': 'Test VLAN 101', 'site': {'name': 'Site 2'}},
+            {'vid': 102, 'name': 'Test VLAN 102', 'site': {'name': 'Site 1'}},
+        ]
+        url = reverse('ipam-api:vlan-list')
+        self.add_permissions('ipam.add_vlan', 'dcim.view_site')
+
+        response = self.client.post(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [vlan['site']['id'] for vlan in response.data],
+            [self.site1.pk, self.site2.pk, self.site1.pk]
+        )
+
+    def test_bulk_related_by_attributes_without_view_permission(self):
+        data = [
+            {'vid': 100, 'name': 'Test VLAN 100', 'site': self.site1.pk},
+            {'vid': 101, 'name': 'Test VLAN 101', 'site': {'name': 'Site 2'}},
+        ]
+        url = reverse('ipam-api:vlan-list')
+        self.add_permissions('ipam.add_vlan')
+
+        with disable_warnings('django.request'):
+            response = self.client.post(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(VLAN.objects.count(), 0)
+        self.assertTrue(response.data[1]['site'][0].startswith("Related object not found"))
+
 
 class APIPaginationTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
@@ -1,16 +1,21 @@
+from io import StringIO
 from unittest.mock import patch
 
+from django.core.management import call_command
+from django.db import transaction
 from django.db.utils import ConnectionDoesNotExist
 from django.test import override_settings
 from django.urls import reverse
 
 from dcim.models import *
+from netbox.context_managers import deferred_counters
 from utilities.counters import (
     connect_counters,
     post_delete_receiver,
     post_save_receiver,
     pre_delete_receiver,
     update_counter,
+    verify_counts,
 )
 from utilities.testing.base import TestCase
 from utilities.testing.utils import create_test_device
@@ -201,6 +206,56 @@ class CountersTestCase(TestCase):
         self.assertEqual(device1.device_type.device_count, 2, 'device_count should decrement exactly once')
         self.assertEqual(vc.member_count, 0, 'member_count should decrement exactly once')
 
+    @override_settings(COUNTER_CACHE_MODE='deferred')
+    def test_deferred_counter_updates(self):
+        """
+        When counter updates are deferred, the increments are applied only once the changes have been committed.
+        Increments made within a rolled back transaction must be discarded.
+        """
+        device1, device2 = Device.objects.all()
+
+        with self.captureOnCommitCallbacks(execute=True), deferred_counters(None):
+            Interface.objects.create(device=device1, name='Interface 5')
+            Interface.objects.create(device=device1, name='Interface 6')
+            interface = Interface.objects.get(name='Interface 3')
+            interface.device = device1
+            interface.save()
+            with transaction.atomic():
+                Interface.objects.create(device=device2, name='Interface 7')
+                transaction.set_rollback(True)
+
+            # Counters are not updated until the changes have been committed
+            device1.refresh_from_db()
+            self.assertEqual(device1.interface_count, 2)
+
+        device1.refresh_from_db()
+        device2.refresh_from_db()
+        self.assertEqual(device1.interface_count, 5)
+        self.assertEqual(device2.interface_count, 1)
+
+    def test_verify_counts(self):
+        """
+        Drifted counts should be corrected, and only those objects whose counts have drifted updated.
+        """
+        device1, device2 = Device.objects.all()
+        Device.objects.filter(pk=device1.pk).update(interface_count=10)
+
+        self.assertEqual(verify_counts(Device, 'interface_count', 'interfaces'), 1)
+        device1.refresh_from_db()
+        self.assertEqual(device1.interface_count, 2)
+        self.assertEqual(verify_counts(Device, 'interface_count', 'interfaces'), 0)
+
+    def test_calculate_cached_counts_verify(self):
+        device1, device2 = Device.objects.all()
+        Device.objects.filter(pk=device2.pk).update(interface_count=0)
+
+        out = StringIO()
+        call_command('calculate_cached_counts', verify=True, stdout=out)
+
+        device2.refresh_from_db()
+        self.assertEqual(device2.interface_count, 2)
+        self.assertIn('Corrected interface_count for 1 devices', out.getvalue())
+
 
 class UnpinnedQuery(Exception):
     """Raised when a query which should have been pinned to a connection is routed instead."""
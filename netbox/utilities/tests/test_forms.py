@@ -1,19 +1,25 @@
 from django import forms
 from django.test import TestCase
 
-from dcim.models import Site
+from dcim.forms import SiteImportForm
+from dcim.models import Region, Site
 from netbox.choices import ImportFormatChoices
+from users.models import User
 from utilities.forms.bulk_import import BulkImportForm
 from utilities.forms.fields.csv import CSVSelectWidget
 from utilities.forms.fields.dynamic import DynamicChoiceField, DynamicMultipleChoiceField
 from utilities.forms.forms import BulkRenameForm
 from utilities.forms.utils import (
+    apply_csv_lookups,
     expand_alphanumeric_pattern,
     expand_ipnetwork_pattern,
     get_capacity_unit_label,
     get_field_value,
+    resolve_csv_lookups,
+    restrict_form_fields,
 )
 from utilities.forms.widgets.select import AvailableOptions, SelectedOptions
+from utilities.testing import create_tags
 
 
 class ExpandIPNetworkTestCase(TestCase):
@@ -625,3 +631,74 @@ class GetCapacityUnitLabelTestCase(TestCase):
 
     def test_iec_label(self):
         self.assertEqual(get_capacity_unit_label(1024), 'MiB')
+
+
+class CSVLookupTestCase(TestCase):
+    """
+    Validate the resolution of related objects in advance of a bulk import.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        regions = (
+            Region(name='Region 1', slug='region-1'),
+            Region(name='Region 2', slug='region-2'),
+        )
+        for region in regions:
+            region.save()
+        # Create two regions with the same name
+        for i in (1, 2):
+            Region(name='Region 3', slug=f'region-3-{i}', parent=regions[i - 1]).save()
+        create_tags('Alpha', 'Bravo')
+        cls.user = User.objects.create(username='superuser', is_superuser=True)
+
+    def setUp(self):
+        records = [
+            {'name': 'Site 1', 'slug': 'site-1', 'region': 'Region 1', 'tags': 'alpha,bravo'},
+            {'name': 'Site 2', 'slug': 'site-2', 'region': 'Region 3', 'tags': 'alpha'},
+            {'name': 'Site 3', 'slug': 'site-3', 'region': 'Region 4'},
+        ]
+        self.lookups = resolve_csv_lookups(SiteImportForm(), records, self.user)
+
+    def _get_form(self, record):
+        form = SiteImportForm(data=record)
+        apply_csv_lookups(form, self.lookups)
+        restrict_form_fields(form, self.user)
+        return form
+
+    def test_resolve_csv_lookups(self):
+        to_field_name, lookup_map = self.lookups['region']
+        self.assertEqual(to_field_name, 'name')
+        self.assertEqual(lookup_map['Region 1'], [Region.objects.get(slug='region-1')])
+        self.assertEqual(len(lookup_map['Region 3']), 2)
+        self.assertNotIn('Region 2', lookup_map)
+        self.assertNotIn('Region 4', lookup_map)
+        self.assertEqual(sorted(self.lookups['tags'][1]), ['alpha', 'bravo'])
+
+    def test_resolved_values(self):
+        form = self._get_form({'name': 'Site 1', 'slug': 'site-1', 'region': 'Region 1', 'tags': 'alpha,bravo'})
+        with self.assertNumQueries(0):
+            region = form.fields['region'].clean('Region 1')
+            tags = form.fields['tags'].clean('alpha,bravo')
+        self.assertEqual(region, Region.objects.get(slug='region-1'))
+        self.assertEqual(sorted(tag.slug for tag in tags), ['alpha', 'bravo'])
+
+    def test_unresolved_values(self):
+        form = self._get_form({'name': 'Site 1', 'slug': 'site-1', 'region': 'Region 2'})
+
+        # Values absent from the lookup map are resolved individually
+        self.assertEqual(form.fields['region'].clean('Region 2'), Region.objects.get(slug='region-2'))
+
+        with self.assertRaisesMessage(forms.ValidationError, 'Object not found: Region 4'):
+            form.fields['region'].clean('Region 4')
+        with self.assertRaisesMessage(forms.ValidationError, 'multiple objects were found'):
+            form.fields['region'].clean('Region 3')
+
+    def test_changed_queryset(self):
+        form = SiteImportForm(data={'name': 'Site 1', 'slug': 'site-1', 'region': 'Region 1'})
+        form.fields['region'].queryset = Region.objects.filter(slug='region-2')
+        apply_csv_lookups(form, self.lookups)
+
+        # The lookup map is not applied to a field whose queryset has been modified
+        self.assertIsNone(form.fields['region'].lookup_map)
+        with self.assertRaisesMessage(forms.ValidationError, 'Object not found: Region 1'):
+            form.fields['region'].clean('Region 1')
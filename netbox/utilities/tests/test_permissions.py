@@ -1,11 +1,17 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from core.models import ObjectType
 from dcim.models import Device, Site
+from extras.models import Tag
 from netbox.registry import registry
 from users.forms.model_forms import ObjectPermissionForm
-from users.models import ObjectPermission
-from utilities.permissions import ModelAction, register_model_actions
+from users.models import ObjectPermission, User
+from utilities.permissions import (
+    ModelAction,
+    constraints_are_multivalued,
+    get_constraint_filter,
+    register_model_actions,
+)
 from virtualization.models import VirtualMachine
 
 
@@ -197,3 +203,64 @@ class ObjectPermissionFormTestCase(TestCase):
         })
         self.assertTrue(form.fields['action_render_config'].initial)
         self.assertNotIn('render_config', form.initial['actions'])
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+class ConstraintFilterTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tags = (
+            Tag.objects.create(name='Tag 1', slug='tag-1'),
+            Tag.objects.create(name='Tag 2', slug='tag-2'),
+        )
+        sites = (
+            Site.objects.create(name='Site 1', slug='site-1'),
+            Site.objects.create(name='Site 2', slug='site-2'),
+            Site.objects.create(name='Site 3', slug='site-3'),
+        )
+        sites[0].tags.set(tags)
+        sites[1].tags.set(tags[:1])
+
+    def _get_user(self, constraints):
+        user = User.objects.create(username='User 1')
+        permission = ObjectPermission.objects.create(name='Permission 1', actions=['view'], constraints=constraints)
+        permission.object_types.set([ObjectType.objects.get_for_model(Site)])
+        permission.users.add(user)
+        return User.objects.get(pk=user.pk)
+
+    def test_constraints_are_multivalued(self):
+        self.assertFalse(constraints_are_multivalued(Site, [None]))
+        self.assertFalse(constraints_are_multivalued(Site, [{'name__in': ['Site 1']}]))
+        self.assertFalse(constraints_are_multivalued(Site, [{'pk': 1, 'region__parent__name': 'Region 1'}]))
+        self.assertFalse(constraints_are_multivalued(Device, [{'site__tenant__group__slug': 'group-1'}]))
+        self.assertTrue(constraints_are_multivalued(Site, [{'name': 'Site 1'}, {'tags__slug': 'tag-1'}]))
+        self.assertTrue(constraints_are_multivalued(Site, [{'devices__name': 'Device 1'}]))
+
+    def test_direct_filter(self):
+        user = self._get_user({'name__in': ['Site 1', 'Site 2']})
+        queryset = Site.objects.restrict(user, 'view')
+
+        self.assertNotIn('IN (SELECT', str(queryset.query))
+        self.assertEqual(sorted(queryset.values_list('name', flat=True)), ['Site 1', 'Site 2'])
+
+    def test_multivalued_filter(self):
+        user = self._get_user({'tags__slug__in': ['tag-1', 'tag-2']})
+        queryset = Site.objects.restrict(user, 'view')
+
+        # Sites with multiple matching tags must not be duplicated
+        self.assertIn('IN (SELECT', str(queryset.query))
+        self.assertEqual(sorted(queryset.values_list('name', flat=True)), ['Site 1', 'Site 2'])
+
+    def test_compiled_filter_cache(self):
+        user = self._get_user({'name': 'Site 1'})
+        user.get_all_permissions()
+
+        qs_filter, multivalued = get_constraint_filter(user, 'dcim.view_site', Site)
+        self.assertFalse(multivalued)
+        self.assertIs(get_constraint_filter(user, 'dcim.view_site', Site)[0], qs_filter)
+
+        # Reloading the user's permissions invalidates the compiled filter
+        del user._object_perm_cache
+        user.get_all_permissions()
+        self.assertIsNot(get_constraint_filter(user, 'dcim.view_site', Site)[0], qs_filter)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark the bulk import of interfaces with and without lookup pre-resolution.
+
+Each record of a bulk import references related objects (here, a device and a
+VRF for each interface). These may be resolved for all records at once before
+any are processed, or individually for each record. This imports the
+given numbers of interfaces via the bulk import view both ways, and reports the
+time taken and the number of queries executed for each.
+
+Run from the repository root against a development database:
+
+    python scripts/benchmark_import.py [--rows 10000 --rows 100000] [--devices N]
+
+Test objects (a site, device type, and devices to which the interfaces are
+assigned) are created within a transaction which is rolled back on completion,
+leaving the database unchanged.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+DEFAULT_ROWS = (10000, 100000)
+
+
+def setup_django():
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'netbox'))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'netbox.settings')
+    import django
+    django.setup()
+
+
+def build_csv(rows, devices, vrfs):
+    lines = ['device,name,type,vrf']
+    for i in range(rows):
+        device = devices[i % len(devices)]
+        vrf = vrfs[i % len(vrfs)]
+        lines.append(f'{device.name},benchmark{i // len(devices)},1000base-t,{vrf.rd}')
+    return '\n'.join(lines)
+
+
+def run_import(client, url, data):
+    """Import the given CSV data, and return the elapsed time (in seconds) and the number of queries executed."""
+    from django.db import connection, transaction
+
+    queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    with transaction.atomic(), connection.execute_wrapper(count_queries):
+        start = time.perf_counter()
+        response = client.post(url, {'data': data, 'format': 'csv', 'csv_delimiter': ','})
+        elapsed = time.perf_counter() - start
+        # Discard the imported interfaces
+        transaction.set_rollback(True)
+
+    if response.status_code != 302:
+        raise RuntimeError(f"Import failed (HTTP {response.status_code})")
+    return elapsed, queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--rows', action='append', type=int, metavar='N',
+        help=f"Number of interfaces to import (may be repeated; default: {', '.join(map(str, DEFAULT_ROWS))})"
+    )
+    parser.add_argument('--devices', type=int, default=1000, help="Number of devices referenced (default: 1000)")
+    parser.add_argument('--vrfs', type=int, default=20, help="Number of VRFs referenced (default: 20)")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import transaction
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
+    from ipam.models import VRF
+    from users.models import User
+
+    with override_settings(ALLOWED_HOSTS=['*'], DATA_UPLOAD_MAX_MEMORY_SIZE=None), transaction.atomic():
+        site = Site.objects.create(name='Benchmark Site', slug='benchmark-site')
+        manufacturer = Manufacturer.objects.create(name='Benchmark Manufacturer', slug='benchmark-manufacturer')
+        device_type = DeviceType.objects.create(
+            manufacturer=manufacturer, model='Benchmark Device Type', slug='benchmark-device-type'
+        )
+        role = DeviceRole.objects.create(name='Benchmark Role', slug='benchmark-role')
+        # Devices are created in bulk, as no components are needed
+        devices = Device.objects.bulk_create([
+            Device(site=site, device_type=device_type, role=role, name=f'benchmark-device-{i}')
+            for i in range(args.devices)
+        ])
+        vrfs = VRF.objects.bulk_create([VRF(name=f'benchmark-vrf-{i}', rd=f'65000:{i}') for i in range(args.vrfs)])
+
+        client = Client()
+        client.force_login(User.objects.create(username='benchmark-superuser', is_superuser=True))
+        url = reverse('dcim:interface_bulk_import')
+
+        for rows in args.rows or DEFAULT_ROWS:
+            data = build_csv(rows, devices, vrfs)
+            resolved = run_import(client, url, data)
+            with mock.patch('netbox.views.generic.bulk_views.resolve_csv_lookups', return_value={}):
+                unresolved = run_import(client, url, data)
+            for label, (elapsed, queries) in (('pre-resolved', resolved), ('per-record', unresolved)):
+                print(
+                    f"{rows:>7} rows  {label:<13} {elapsed:8.1f} s  {rows / elapsed:8.0f} rows/s  "
+                    f"{queries:8d} queries",
+                    flush=True
+                )
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
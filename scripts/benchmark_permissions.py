@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark list view latency for a constrained user and a superuser.
+
+Object permission constraints are applied to every queryset a list view
+evaluates (the table itself, its related object columns, and prefetches), so
+their cost grows with the complexity of the page. This requests the list views
+of the given models repeatedly as each user and reports the median and 95th
+percentile latency along with the number of queries per request.
+
+Run from the repository root against a populated development database:
+
+    python scripts/benchmark_permissions.py [--model dcim.device ...] [--iterations N]
+        [--constraints '{"status": "active"}']
+
+The constrained user is granted view permission on all models, subject to the
+given constraints (by default, a constraint matching all objects). Both users
+are created within a transaction which is rolled back on completion, leaving
+the database unchanged.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_MODELS = ('dcim.device', 'dcim.interface', 'ipam.prefix', 'ipam.ipaddress')
+
+
+def setup_django():
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'netbox'))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'netbox.settings')
+    import django
+    django.setup()
+
+
+def benchmark(client, url, iterations):
+    """Request the URL once to warm caches, then time the given number of requests."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f"GET {url} returned {response.status_code}")
+
+    timings = []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        'median': statistics.median(timings),
+        'p95': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        'queries': len(queries),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--model', action='append', dest='models', metavar='APP.MODEL',
+        help=f"Model whose list view is requested (may be repeated; default: {', '.join(DEFAULT_MODELS)})"
+    )
+    parser.add_argument('--iterations', type=int, default=20, help="Requests per view and user (default: 20)")
+    parser.add_argument('--per-page', type=int, default=100, help="Objects per page (default: 100)")
+    parser.add_argument(
+        '--constraints', type=json.loads, default={'pk__gt': 0},
+        help="JSON constraints applied to the constrained user's permission (default: {\"pk__gt\": 0})"
+    )
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.apps import apps
+    from django.db import transaction
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from core.models import ObjectType
+    from users.models import ObjectPermission, User
+    from utilities.views import get_viewname
+
+    models = [apps.get_model(label) for label in args.models or DEFAULT_MODELS]
+    results = []
+
+    with override_settings(ALLOWED_HOSTS=['*'], EXEMPT_VIEW_PERMISSIONS=[]), transaction.atomic():
+        superuser = User.objects.create(username='benchmark-superuser', is_superuser=True)
+        constrained_user = User.objects.create(username='benchmark-constrained')
+        permission = ObjectPermission.objects.create(
+            name='Benchmark', actions=['view'], constraints=args.constraints
+        )
+        permission.object_types.set(ObjectType.objects.public())
+        permission.users.add(constrained_user)
+
+        clients = {}
+        for label, user in (('superuser', superuser), ('constrained', constrained_user)):
+            clients[label] = Client()
+            clients[label].force_login(user)
+
+        for model in models:
+            url = f"{reverse(get_viewname(model, 'list'))}?per_page={args.per_page}"
+            for label, client in clients.items():
+                result = benchmark(client, url, args.iterations)
+                results.append((model._meta.label_lower, label, result))
+                print(
+                    f"{model._meta.label_lower:<24} {label:<12} median {result['median']:8.1f} ms  "
+                    f"p95 {result['p95']:8.1f} ms  {result['queries']:4d} queries",
+                    flush=True
+                )
+
+        transaction.set_rollback(True)
+
+    # Summarize the overhead of constraints relative to the superuser
+    print()
+    for model_label in dict.fromkeys(label for label, _, _ in results):
+        timings = {user: result['median'] for label, user, result in results if label == model_label}
+        overhead = (timings['constrained'] / timings['superuser'] - 1) * 100
+        print(f"{model_label:<24} constrained overhead {overhead:+6.1f}%")
+
+
+if __name__ == '__main__':
+    main()